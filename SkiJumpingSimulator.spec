@@ -10,12 +10,10 @@ a = Analysis(
         'PySide6.QtGui', 
         'PySide6.QtWidgets',
         'PySide6.QtMultimedia',
-        'matplotlib.backends.backend_qt5agg',
         'PIL.Image',
         'PIL.ImageFilter',
         'PIL.ImageDraw',
-        'numpy',
-        'matplotlib'
+        'numpy'
     ],
     hookspath=[],
     hooksconfig={},
@@ -2,23 +2,32 @@
 
 import sys
 import os
+import bisect
 import json
-import copy
+import functools
+import multiprocessing
 import random
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait as wait_futures
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import Optional
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QComboBox,
     QSpinBox,
     QAbstractSpinBox,
     QPushButton,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QHeaderView,
@@ -44,7 +53,12 @@ from PySide6.QtCore import (
     QSize,
     QPoint,
     QThread,
+    QEvent,
+    QModelIndex,
+    QSignalBlocker,
+    QSortFilterProxyModel,
     Signal as pyqtSignal,
+    Slot as pyqtSlot,
 )
 
 # from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
@@ -53,31 +67,47 @@ from PySide6.QtGui import (
     QPixmap,
     QImage,
     QPainter,
-    QPolygon,
     QColor,
     QFont,
     QFontMetrics,
     QDesktopServices,
 )
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.animation as animation
+from PySide6.QtMultimedia import QSoundEffect
 import numpy as np
 import math
 from PIL import Image, ImageDraw, ImageFilter
-from src.simulation import load_data_from_json, inrun_simulation, fly_simulation
+from src.simulation import (
+    load_data_from_json,
+    inrun_simulation,
+    fly_simulation,
+    highest_safe_gate,
+    warm_up,
+)
 from src.hill import Hill
 from src.jumper import Jumper
 
 # Removed unused physics constants/helpers imports (kept in simulation modules)
-from ui import AnimatedStackedWidget, NavigationSidebar, ModernComboBox, ModernSlider
+from ui import (
+    AnimatedStackedWidget,
+    NavigationSidebar,
+    ModernComboBox,
+    ModernSlider,
+    TrajectoryView,
+    JumperListModel,
+    CardButton,
+    FlagListModel,
+    CenteredIconDelegate,
+    HistoryDetailModel,
+    HistoryTableModel,
+)
 from utils.history_store import (
     init_db as history_init_db,
     start_competition as history_start_competition,
     register_participants as history_register_participants,
     add_jump as history_add_jump,
     finalize_competition as history_finalize_competition,
+    list_competitions as history_list_competitions,
+    get_competition_detail as history_get_competition_detail,
 )
 
 
@@ -88,11 +118,17 @@ class TimingIndicatorBar(QWidget):
     Marker pokazuje przesunięcie czasu (εt) oraz kolor zależny od klasyfikacji.
     """
 
+    # Wspólna dla wszystkich pasków tablica kolorów markera (budowana przy 1. użyciu)
+    _color_lut = None
+
     def __init__(self, parent=None, max_abs_seconds: float = 0.12):
         super().__init__(parent)
         self._max_abs_seconds = float(max_abs_seconds)
         self._epsilon_t_s = 0.0
         self._classification = "idealny"
+        # Statyczne tło paska (pixmapa) – budowane leniwie, unieważniane przy zmianie rozmiaru
+        self._static_layer = None
+        self._update_label_font()
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setMinimumHeight(44)
 
@@ -111,27 +147,69 @@ class TimingIndicatorBar(QWidget):
         b = int(c1.blue() + (c2.blue() - c1.blue()) * t)
         return QColor(r, g, b)
 
+    def _build_color_lut(self) -> list:
+        """Tablica 256 kolorów: zielony (#28a745) → żółty (#ffc107) → czerwony (#dc3545)."""
+        green = QColor("#28a745")
+        yellow = QColor("#ffc107")
+        red = QColor("#dc3545")
+        lut = []
+        for i in range(256):
+            ratio = i / 255.0
+            if ratio <= 0.5:
+                # 0.0..0.5 → green→yellow
+                lut.append(self._interpolate_color(green, yellow, ratio / 0.5))
+            else:
+                # 0.5..1.0 → yellow→red
+                lut.append(self._interpolate_color(yellow, red, (ratio - 0.5) / 0.5))
+        return lut
+
     def _color_for_magnitude(self) -> QColor:
         """Zwraca kolor wg modułu błędu czasu: zielony→żółty→czerwony.
 
         0% = zielony (#28a745), ~50% = żółty (#ffc107), 100% = czerwony (#dc3545)
         """
+        lut = TimingIndicatorBar._color_lut
+        if lut is None:
+            lut = TimingIndicatorBar._color_lut = self._build_color_lut()
         ratio = min(1.0, abs(self._epsilon_t_s) / max(1e-6, self._max_abs_seconds))
-        green = QColor("#28a745")
-        yellow = QColor("#ffc107")
-        red = QColor("#dc3545")
-        if ratio <= 0.5:
-            # 0.0..0.5 → green→yellow
-            return self._interpolate_color(green, yellow, ratio / 0.5)
-        # 0.5..1.0 → yellow→red
-        return self._interpolate_color(yellow, red, (ratio - 0.5) / 0.5)
+        return lut[int(ratio * 255)]
 
-    def paintEvent(self, event):  # noqa: N802 - Qt API
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    def resizeEvent(self, event):  # noqa: N802 - Qt API
+        # Statyczna warstwa zależy tylko od rozmiaru – zbuduj ją ponownie przy malowaniu
+        self._static_layer = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):  # noqa: N802 - Qt API
+        # Podpisy zależą od czcionki (np. po nałożeniu QSS)
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._update_label_font()
+            self._static_layer = None
+        super().changeEvent(event)
+
+    def _update_label_font(self):
+        """Przelicza czcionkę podpisów i szerokość napisu "za późno"."""
+        font = self.font()
+        self._small_font = QFont(font)
+        self._small_font.setPointSizeF(max(7.5, font.pointSizeF() - 1))
+        self._late_label_width = QFontMetrics(self._small_font).horizontalAdvance(
+            "za późno"
+        )
 
+    def _track_rect(self):
         # Kompaktowe marginesy zgodne z motywem (większy dolny margines na napisy)
-        rect = self.rect().adjusted(8, 6, -8, -14)
+        return self.rect().adjusted(8, 6, -8, -14)
+
+    def _build_static_layer(self) -> QPixmap:
+        """Renderuje szynę, znacznik środka i podpisy do pixmapy (bez markera)."""
+        dpr = self.devicePixelRatioF()
+        layer = QPixmap(self.size() * dpr)
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.transparent)
+
+        painter = QPainter(layer)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        rect = self._track_rect()
 
         # Tło (transparentne, nie rysujemy pełnego panelu żeby było minimalistycznie)
 
@@ -149,6 +227,29 @@ class TimingIndicatorBar(QWidget):
         painter.setPen(QColor(76, 132, 255, 120))  # akcent motywu
         painter.drawLine(center_x, track_y - 6, center_x, track_y + track_h + 6)
 
+        # Podpisy krańcowe subtelne
+        painter.setFont(self._small_font)
+        painter.setPen(QColor(200, 208, 227, 140))
+        # Ustaw podpisy w bezpiecznej strefie wewnątrz widgetu, tuż nad krawędzią
+        text_y = self.rect().bottom() - 4
+        painter.drawText(rect.left(), text_y, "za wcześnie")
+        painter.drawText(rect.right() - self._late_label_width, text_y, "za późno")
+
+        painter.end()
+        return layer
+
+    def paintEvent(self, event):  # noqa: N802 - Qt API
+        if self._static_layer is None:
+            self._static_layer = self._build_static_layer()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        # Statyczna część (szyna, środek, podpisy) z pamięci podręcznej
+        painter.drawPixmap(0, 0, self._static_layer)
+
+        rect = self._track_rect()
+
         # Pozycja markera
         max_abs = max(0.001, self._max_abs_seconds)
         ratio = (self._epsilon_t_s / (2 * max_abs)) + 0.5  # map [-max, +max] -> [0,1]
@@ -167,32 +268,20 @@ class TimingIndicatorBar(QWidget):
         painter.setBrush(Qt.NoBrush)
         painter.drawEllipse(QPoint(marker_x, rect.center().y()), radius, radius)
 
-        # Podpisy krańcowe subtelne
-        font = painter.font()
-        small_font = QFont(font)
-        small_font.setPointSizeF(max(7.5, font.pointSizeF() - 1))
-        painter.setFont(small_font)
-        painter.setPen(QColor(200, 208, 227, 140))
-        # Ustaw podpisy w bezpiecznej strefie wewnątrz widgetu, tuż nad krawędzią
-        metrics_small = QFontMetrics(small_font)
-        text_y = self.rect().bottom() - 4
-        painter.drawText(rect.left(), text_y, "za wcześnie")
-        painter.drawText(
-            rect.right() - metrics_small.horizontalAdvance("za późno"),
-            text_y,
-            "za późno",
-        )
-
         painter.end()
 
 
-def calculate_jump_points(distance: float, k_point: float) -> float:
+def calculate_jump_points(
+    distance: float, k_point: float, meter_value: Optional[float] = None
+) -> float:
     """
     Oblicza punkty za skok na podstawie odległości i punktu K.
 
     Args:
-        distance: Odległość skoku w metrach
+        distance: Odległość skoku w metrach (lub tablica NumPy odległości –
+            wtedy punkty liczone są element po elemencie)
         k_point: Punkt K skoczni w metrach
+        meter_value: Meter value skoczni, jeśli wyliczono ją wcześniej
 
     Returns:
         Punkty za skok (60 punktów za skok na K-point, +/- za każdy metr)
@@ -201,7 +290,8 @@ def calculate_jump_points(distance: float, k_point: float) -> float:
     difference = distance - k_point
 
     # Określ meter value na podstawie K-point
-    meter_value = get_meter_value(k_point)
+    if meter_value is None:
+        meter_value = get_meter_value(k_point)
 
     # Oblicz punkty: 60 + (różnica * meter_value)
     points = 60.0 + (difference * meter_value)
@@ -209,30 +299,26 @@ def calculate_jump_points(distance: float, k_point: float) -> float:
     return points
 
 
+# Tabela FIS: górne granice punktu K (włącznie) i odpowiadające im meter value
+_K_POINT_LIMITS = (24, 29, 34, 39, 49, 59, 69, 79, 99, 169)
+_METER_VALUES = (4.8, 4.4, 4.0, 3.6, 3.2, 2.8, 2.4, 2.2, 2.0, 1.8, 1.2)
+
+
 def get_meter_value(k_point: float) -> float:
     """Returns the meter value based on the K-point, as per FIS table."""
-    if k_point <= 24:
-        return 4.8
-    elif k_point <= 29:
-        return 4.4
-    elif k_point <= 34:
-        return 4.0
-    elif k_point <= 39:
-        return 3.6
-    elif k_point <= 49:
-        return 3.2
-    elif k_point <= 59:
-        return 2.8
-    elif k_point <= 69:
-        return 2.4
-    elif k_point <= 79:
-        return 2.2
-    elif k_point <= 99:
-        return 2.0
-    elif k_point <= 169:
-        return 1.8
-    else:
-        return 1.2
+    return _METER_VALUES[bisect.bisect_left(_K_POINT_LIMITS, k_point)]
+
+
+def sort_by_name(objects: list) -> list:
+    """
+    Sortuje listę (w miejscu) wg str() i zwraca nazwy w nowej kolejności.
+
+    str() wywoływane jest raz na obiekt, a nazwy można użyć ponownie
+    (np. jako tekst elementów list i comboboxów).
+    """
+    named = sorted(((str(obj), obj) for obj in objects), key=lambda pair: pair[0])
+    objects[:] = [obj for _, obj in named]
+    return [name for name, _ in named]
 
 
 def round_distance_to_half_meter(distance: float) -> float:
@@ -240,6 +326,11 @@ def round_distance_to_half_meter(distance: float) -> float:
     return round(distance * 2) / 2
 
 
+def round_distance_to_half_meter_vec(distances) -> np.ndarray:
+    """Wektorowa wersja round_distance_to_half_meter (identyczne zaokrąglanie)."""
+    return np.round(np.asarray(distances, dtype=float) * 2) / 2
+
+
 def get_qualification_limit(k_point: float) -> int:
     """
     Określa liczbę zawodników awansujących z kwalifikacji na podstawie typu skoczni.
@@ -257,11 +348,193 @@ def get_qualification_limit(k_point: float) -> int:
         return 50
 
 
+# Flagi komórek tabel (domyślne flagi QTableWidgetItem) liczone raz – bez odczytu
+# item.flags() dla każdej tworzonej komórki
+_READONLY_ITEM_FLAGS = (
+    Qt.ItemIsSelectable
+    | Qt.ItemIsEnabled
+    | Qt.ItemIsDragEnabled
+    | Qt.ItemIsDropEnabled
+    | Qt.ItemIsUserCheckable
+)
+_EDITABLE_ITEM_FLAGS = _READONLY_ITEM_FLAGS | Qt.ItemIsEditable
+
+# Grupy pól i podpowiedzi formularzy edytora (stałe, tylko do odczytu)
+_JUMPER_GROUPS = MappingProxyType(
+    {
+        "Dane Podstawowe": ("name", "last_name", "nationality"),
+        "Najazd": (
+            "inrun_position",
+        ),
+        "Wybicie": (
+            "takeoff_force",
+            "timing",
+        ),
+        "Lot": (
+            "flight_technique",
+            "flight_style",
+            "flight_resistance",
+        ),
+        "Lądowanie": (
+            "telemark",
+            "stability",
+        ),
+    }
+)
+_HILL_GROUPS = MappingProxyType(
+    {
+        "Dane Podstawowe": ("name", "country", "K", "L", "gates"),
+        "Geometria Najazdu": ("e1", "e2", "t", "gamma_deg", "alpha_deg", "r1"),
+        "Profil Zeskoku": (
+            "h",
+            "n",
+            "s",
+            "P",
+            "l1",
+            "l2",
+            "a_finish",
+            "beta_deg",
+            "betaP_deg",
+            "betaL_deg",
+            "Zu",
+        ),
+        "Parametry Fizyczne": ("inrun_friction_coefficient",),
+    }
+)
+
+_JUMPER_TOOLTIPS = MappingProxyType(
+    {
+        "name": "Imię zawodnika.",
+        "last_name": "Nazwisko zawodnika.",
+        "nationality": "Kod kraju (np. POL, GER, NOR). Wpływa na wyświetlaną flagę.",
+        "inrun_position": "Pozycja najazdowa skoczka. Wyższe wartości = lepsza aerodynamika = wyższa prędkość na progu.",
+        "takeoff_force": "Siła wybicia skoczka. Wyższe wartości = większa siła odbicia = dłuższe skoki. Kluczowy parametr wpływający na parabolę lotu.",
+        "timing": "Timing wybicia. Wyższe wartości = bliżej optimum, lepsze ukierunkowanie impulsu i mniejsza losowość.",
+        "flight_technique": "Technika lotu skoczka. Wyższe wartości = lepsze wykorzystanie siły nośnej = dłuższe skoki.",
+        "flight_style": "Styl lotu skoczka. Normalny = zrównoważony styl. Agresywny = mniejsza powierzchnia czołowa. Pasywny = większa powierzchnia czołowa.",
+        "flight_resistance": "Opór powietrza w locie. Wyższe wartości = mniejszy opór aerodynamiczny = dłuższe skoki.",
+        "telemark": "Umiejętność lądowania telemarkiem. Wyższe wartości = częstsze i ładniejsze lądowania telemarkiem.",
+        "stability": "Stabilność lądowania. Zmniejsza ryzyko podpórki i upadku daleko za HS.",
+        "landing_drag_coefficient": "Opór aerodynamiczny podczas lądowania (bardzo wysoki).",
+        "landing_frontal_area": "Powierzchnia czołowa podczas lądowania (największa).",
+        "landing_lift_coefficient": "Siła nośna podczas lądowania (zazwyczaj 0).",
+    }
+)
+_HILL_TOOLTIPS = MappingProxyType(
+    {
+        "name": "Oficjalna nazwa skoczni.",
+        "country": "Kod kraju (np. POL, GER, NOR). Wpływa na wyświetlaną flagę.",
+        "gates": "Całkowita liczba belek startowych dostępnych na skoczni.",
+        "e1": "Długość najazdu od najwyższej belki do progu (w metrach).",
+        "e2": "Długość najazdu od najniższej belki do progu (w metrach).",
+        "t": "Długość drugiej prostej najadzu (w metrach).",
+        "inrun_friction_coefficient": "Współczynnik tarcia nart o tory. Wyższe wartości = niższa prędkość na progu. Typowo: 0.02.",
+        "P": "Początek strefy lądowania (w metrach).",
+        "K": "Punkt konstrukcyjny skoczni w metrach (np. 90, 120, 200).",
+        "l1": "Odległość po zeskoku między punktem P a K (w metrach).",
+        "l2": "Odległosć po zeskoku między punktem K a L (w metrach).",
+        "a_finish": "Długość całego wypłaszczenia zeskoku (w metrach).",
+        "L": "Rozmiar skoczni (HS) w metrach. Określa granicę bezpiecznego skoku.",
+        "alpha_deg": "Kąt nachylenia progu w stopniach. Kluczowy dla kąta wybicia. Zwykle 10-11 stopni.",
+        "gamma_deg": "Kąt nachylenia górnej, stromej części najazdu w stopniach.",
+        "r1": "Promień krzywej przejściowej na najeździe (w metrach).",
+        "h": "Różnica wysokości między progiem a punktem K.",
+        "n": "Odległość w poziomie między progiem a punktem K.",
+        "betaP_deg": "Kąt nachylenia zeskoku w punkcie P w stopniach.",
+        "beta_deg": "Kąt nachylenia zeskoku w punkcie K w stopniach.",
+        "betaL_deg": "Kąt nachylenia zeskoku w punkcie L w stopniach.",
+        "Zu": "Wysokość progu nad pełnym wypłaszczeniem zeskoku (w metrach).",
+        "s": "Wysokość progu nad zeskokiem.",
+    }
+)
+
+# Rodzaj i konfiguracja pola formularza dla każdego atrybutu:
+# ("spin", min, max), ("double", min, max, miejsca po przecinku, krok),
+# ("slider", min, max), ("combo", pozycje), ("line",)
+_SPIN_FIELD = ("spin", 0, 500)
+_DOUBLE_FIELD = ("double", -10000.0, 10000.0, 4, 0.01)
+_DEG_FIELD = ("double", -10000.0, 10000.0, 2, None)
+_SLIDER_FIELD = ("slider", 0, 100)
+_LINE_FIELD = ("line",)
+_ATTR_SPEC = MappingProxyType(
+    {
+        **dict.fromkeys(("K", "L", "gates"), _SPIN_FIELD),
+        **dict.fromkeys(
+            ("e1", "e2", "t", "r1", "h", "n", "s", "l1", "l2", "a_finish", "P", "Zu"),
+            _DOUBLE_FIELD,
+        ),
+        **dict.fromkeys(
+            (
+                "inrun_position",
+                "takeoff_force",
+                "timing",
+                "flight_technique",
+                "flight_resistance",
+                "telemark",
+                "stability",
+            ),
+            _SLIDER_FIELD,
+        ),
+        "flight_style": ("combo", ("Normalny", "Agresywny", "Pasywny")),
+    }
+)
+_LABEL_OVERRIDES = MappingProxyType(
+    {
+        "inrun_position": "Pozycja najazdowa:",
+        "takeoff_force": "Siła wybicia:",
+        "timing": "Timing wybicia:",
+        "flight_technique": "Technika lotu:",
+        "flight_style": "Styl lotu:",
+        "flight_resistance": "Opór powietrza:",
+        "stability": "Stabilność:",
+    }
+)
+
+
+def _attr_spec(attr):
+    """Specyfikacja pola z tabeli; nieznane atrybuty klasyfikowane po nazwie."""
+    spec = _ATTR_SPEC.get(attr)
+    if spec is not None:
+        return spec
+    if "coefficient" in attr or "area" in attr:
+        return _DOUBLE_FIELD
+    if "deg" in attr:
+        return _DEG_FIELD
+    return _LINE_FIELD
+
+
+def _attr_label(attr):
+    label = _LABEL_OVERRIDES.get(attr)
+    if label is None:
+        label = attr.replace("_", " ").replace("deg", "(deg)").capitalize() + ":"
+    return label
+
+# Slidery mają 101 pozycji (0-100) – wartości fizyczne liczone raz przy starcie
+# (te same wzory co poniżej), konwersja to zwykłe indeksowanie.
+_SLIDER_TO_DRAG = tuple(0.5 - (v / 100.0) * (0.5 - 0.38) for v in range(101))
+_SLIDER_TO_JUMP_FORCE = tuple(
+    1000.0 + (v / 100.0) * (2000.0 - 1000.0) for v in range(101)
+)
+_SLIDER_TO_LIFT = tuple(0.5 + (v / 100.0) * (1.0 - 0.5) for v in range(101))
+_SLIDER_TO_DRAG_FLIGHT = tuple(0.5 - (v / 100.0) * (0.5 - 0.4) for v in range(101))
+
+
+def _slider_index(slider_value):
+    """Zwraca indeks tablicy dla całkowitej wartości 0-100, w przeciwnym razie None."""
+    index = int(slider_value)
+    if index == slider_value and 0 <= index <= 100:
+        return index
+    return None
+
+
 def slider_to_drag_coefficient(slider_value: int) -> float:
     """
     Konwertuje wartość slidera (0-100) na współczynnik oporu aerodynamicznego (0.5-0.38).
     """
     # Mapowanie: 0 -> 0.5, 100 -> 0.38
+    index = _slider_index(slider_value)
+    if index is not None:
+        return _SLIDER_TO_DRAG[index]
     return 0.5 - (slider_value / 100.0) * (0.5 - 0.38)
 
 
@@ -283,6 +556,9 @@ def slider_to_jump_force(slider_value: int) -> float:
     Konwertuje wartość slidera (0-100) na siłę wybicia (1000N-2000N).
     """
     # Mapowanie: 0 -> 1000N, 100 -> 2000N
+    index = _slider_index(slider_value)
+    if index is not None:
+        return _SLIDER_TO_JUMP_FORCE[index]
     return 1000.0 + (slider_value / 100.0) * (2000.0 - 1000.0)
 
 
@@ -304,6 +580,9 @@ def slider_to_lift_coefficient(slider_value: int) -> float:
     Konwertuje wartość slidera (0-100) na współczynnik siły nośnej (0.5-1.0).
     """
     # Mapowanie: 0 -> 0.5, 100 -> 1.0
+    index = _slider_index(slider_value)
+    if index is not None:
+        return _SLIDER_TO_LIFT[index]
     return 0.5 + (slider_value / 100.0) * (1.0 - 0.5)
 
 
@@ -325,8 +604,10 @@ def slider_to_drag_coefficient_flight(slider_value: int) -> float:
     Konwertuje wartość slidera (0-100) na współczynnik oporu aerodynamicznego w locie (0.5-0.4).
     """
     # Mapowanie: 0 -> 0.5, 100 -> 0.4
-    result = 0.5 - (slider_value / 100.0) * (0.5 - 0.4)
-    return result
+    index = _slider_index(slider_value)
+    if index is not None:
+        return _SLIDER_TO_DRAG_FLIGHT[index]
+    return 0.5 - (slider_value / 100.0) * (0.5 - 0.4)
 
 
 def drag_coefficient_flight_to_slider(drag_coefficient: float) -> int:
@@ -343,12 +624,16 @@ def drag_coefficient_flight_to_slider(drag_coefficient: float) -> int:
         return result
 
 
+_STYLE_FRONTAL_AREA = MappingProxyType(
+    {"Normalny": 0.52, "Agresywny": 0.5175, "Pasywny": 0.5225}
+)
+
+
 def style_to_frontal_area(style: str) -> float:
     """
     Konwertuje styl lotu na powierzchnię czołową.
     """
-    style_mapping = {"Normalny": 0.52, "Agresywny": 0.5175, "Pasywny": 0.5225}
-    return style_mapping.get(style, 0.52)  # Default to Normalny
+    return _STYLE_FRONTAL_AREA.get(style, 0.52)  # Default to Normalny
 
 
 def frontal_area_to_style(frontal_area: float) -> str:
@@ -386,6 +671,191 @@ def apply_style_physics(jumper, style: str):
         # Bez zmian w flight_lift_coefficient i flight_drag_coefficient
 
 
+# Suwaki formularza skoczka: pole suwaka -> (atrybut fizyczny, wartość domyślna,
+# konwersja atrybut -> suwak, konwersja suwak -> atrybut)
+_SLIDER_FIELDS = MappingProxyType(
+    {
+        "inrun_position": (
+            "inrun_drag_coefficient",
+            0.46,
+            drag_coefficient_to_slider,
+            slider_to_drag_coefficient,
+        ),
+        "takeoff_force": (
+            "jump_force",
+            1500.0,
+            jump_force_to_slider,
+            slider_to_jump_force,
+        ),
+        "timing": ("timing", 50, int, int),
+        "flight_technique": (
+            "flight_lift_coefficient",
+            0.8,
+            lift_coefficient_to_slider,
+            slider_to_lift_coefficient,
+        ),
+        "flight_resistance": (
+            "flight_drag_coefficient",
+            0.5,
+            drag_coefficient_flight_to_slider,
+            slider_to_drag_coefficient_flight,
+        ),
+        # Wartości bezpośrednie (nie fizyczne)
+        "telemark": ("telemark", 50, int, int),
+        "stability": ("stability", 50, int, int),
+    }
+)
+
+
+_gate_scan_pool = None
+_gate_scan_pool_lock = threading.Lock()
+_GATE_SCAN_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Wyniki highest_safe_gate: (wersja skoczni, wersja skoczka, belka startowa) -> wynik
+_gate_scan_cache = {}
+
+
+def _get_gate_scan_pool():
+    """
+    Zwraca współdzieloną pulę procesów do symulacji skoków (tworzoną leniwie).
+
+    fly_simulation to czysty Python, więc wątki nie dałyby przyspieszenia (GIL) –
+    skoki liczone są równolegle w osobnych procesach.
+    """
+    global _gate_scan_pool
+    with _gate_scan_pool_lock:
+        if _gate_scan_pool is None:
+            _gate_scan_pool = ProcessPoolExecutor(
+                max_workers=_GATE_SCAN_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _gate_scan_pool
+
+
+def _discard_gate_scan_pool(pool):
+    """Zamyka uszkodzoną pulę; następne wywołanie _get_gate_scan_pool utworzy nową."""
+    global _gate_scan_pool
+    with _gate_scan_pool_lock:
+        if _gate_scan_pool is pool:
+            _gate_scan_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_simulation_tasks_serially(func, args_list, should_stop=None):
+    results = []
+    for args in args_list:
+        if should_stop is not None and should_stop():
+            return None
+        results.append(func(*args))
+    return results
+
+
+def _run_simulation_tasks(func, args_list, should_stop=None):
+    """
+    Wykonuje zadania symulacji (w puli procesów, jeśli dostępna).
+
+    Gdy puli nie da się utworzyć albo zepsuje się w trakcie (start procesu,
+    import, zabity proces), zadania liczone są w bieżącym wątku.
+
+    Returns:
+        list: wyniki w kolejności args_list lub None po przerwaniu
+    """
+    try:
+        pool = _get_gate_scan_pool()
+    except Exception:
+        pool = None
+
+    if pool is None:
+        return _run_simulation_tasks_serially(func, args_list, should_stop)
+
+    futures = []
+    try:
+        for args in args_list:
+            futures.append(pool.submit(func, *args))
+        for _ in as_completed(futures):
+            if should_stop is not None and should_stop():
+                return None
+        return [future.result() for future in futures]
+    except (BrokenProcessPool, OSError) as e:
+        print(f"Pula procesów symulacji niedostępna, liczenie w wątku: {e}")
+        _discard_gate_scan_pool(pool)
+        return _run_simulation_tasks_serially(func, args_list, should_stop)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _scan_gates(hill, jumpers, should_stop=None):
+    """
+    Szuka najwyższej belki, z której żaden skoczek nie skacze powyżej HS.
+
+    Każdy zawodnik to jedno zadanie (highest_safe_gate), które schodzi z belkami
+    od najwyższej do pierwszego skoku nie dłuższego niż HS. Rekomendacja to
+    minimum z tych belek, więc zawodnicy liczeni są równolegle i bez
+    synchronizacji po każdej belce. Wyniki skanów są zapamiętywane według wersji
+    skoczni i skoczka, więc ponowne rekomendacje dla tego samego składu nie
+    symulują skoków od nowa.
+
+    Returns:
+        tuple: (rekomendowana belka, maksymalna odległość) lub None po przerwaniu
+    """
+    gate = hill.gates
+    scans = {}
+    pending = list(range(len(jumpers)))
+
+    # Zawodnicy bezpieczni na wyższej belce są sprawdzani ponownie od nowej
+    # (niższej) belki, aż wszyscy zmieszczą się przed HS na tej samej belce
+    while pending:
+        keys = {i: (hill._ver, jumpers[i]._ver, gate) for i in pending}
+        missing = []
+        for i in pending:
+            if keys[i] in _gate_scan_cache:
+                scans[i] = _gate_scan_cache[keys[i]]
+            else:
+                missing.append(i)
+
+        if missing:
+            # Awaria puli kończy się liczeniem w wątku (_run_simulation_tasks)
+            results = _run_simulation_tasks(
+                highest_safe_gate,
+                [(hill, jumpers[i], gate) for i in missing],
+                should_stop,
+            )
+            if results is None:
+                return None
+            _gate_scan_cache.update(zip((keys[i] for i in missing), results))
+            scans.update(zip(missing, results))
+
+        gate = min(safe_gate for safe_gate, _ in scans.values())
+        if gate < 1:
+            # Jeśli żadna belka nie jest bezpieczna, zwróć najniższą
+            return 1, 0.0
+        pending = [i for i, (safe_gate, _) in scans.items() if safe_gate != gate]
+
+    return gate, max(distance for _, distance in scans.values())
+
+
+class _WarmupWorker(QThread):
+    """
+    Uruchamia w tle pierwszy proces puli symulacji, zanim użytkownik o nie poprosi.
+
+    Start procesu "spawn" to import interpretera, NumPy i SciPy – bez rozgrzewki
+    ten koszt spada na pierwsze liczenie rekomendowanej belki. Rozgrzewany jest
+    jeden proces; pozostałe pula tworzy dopiero przy pierwszym skanie belek.
+    """
+
+    def run(self):
+        try:
+            future = _get_gate_scan_pool().submit(warm_up)
+            while not future.done():
+                if self.isInterruptionRequested():
+                    return
+                wait_futures([future], timeout=0.1)
+            future.result()
+        except Exception as e:
+            print(f"Rozgrzewka puli symulacji nie powiodła się: {e}")
+
+
 class RecommendedGateWorker(QThread):
     """
     Worker thread do obliczania rekomendowanej belki w tle.
@@ -406,34 +876,50 @@ class RecommendedGateWorker(QThread):
             self.calculation_finished.emit(1, 0.0)
             return
 
-        # Sprawdź każdą belkę od najwyższej do najniższej
-        for gate in range(self.hill.gates, 0, -1):
-            max_distance = 0
-            safe_gate = True
+        result = _scan_gates(
+            self.hill, self.jumpers, should_stop=self.isInterruptionRequested
+        )
+        if result is None:
+            # Obliczenia przerwane – nowszy worker policzy aktualną rekomendację
+            return
+        self.calculation_finished.emit(*result)
 
-            # Sprawdź wszystkich zawodników na tej belce
-            for jumper in self.jumpers:
-                try:
-                    distance = fly_simulation(self.hill, jumper, gate_number=gate)
-                    max_distance = max(max_distance, distance)
 
-                    # Jeśli którykolwiek skoczek przekracza HS, ta belka nie jest bezpieczna
-                    if distance > self.hill.L:
-                        safe_gate = False
-                        break
+class HistoryListWorker(QThread):
+    """
+    Wczytuje listę zapisanych zawodów z bazy historii w tle.
+    """
 
-                except Exception:
-                    # W przypadku błędu symulacji, uznaj belkę za niebezpieczną
-                    safe_gate = False
-                    break
+    loaded = pyqtSignal(list)  # wiersze z list_competitions
 
-            # Jeśli wszystkie skoki są bezpieczne, to jest rekomendowana belka
-            if safe_gate:
-                self.calculation_finished.emit(gate, max_distance)
-                return
+    def run(self):
+        try:
+            rows = history_list_competitions(limit=200, offset=0)
+        except Exception as e:
+            print(f"Nie udało się wczytać historii zawodów: {e}")
+            return
+        self.loaded.emit(rows)
+
+
+class HistoryDetailWorker(QThread):
+    """
+    Wczytuje szczegóły (serie i skoki) jednych zapisanych zawodów w tle.
+    """
 
-        # Jeśli żadna belka nie jest bezpieczna, zwróć najniższą
-        self.calculation_finished.emit(1, 0.0)
+    loaded = pyqtSignal(int, dict)  # comp_id, dane z get_competition_detail
+
+    def __init__(self, comp_id, parent=None):
+        super().__init__(parent)
+        self.comp_id = comp_id
+
+    def run(self):
+        try:
+            data = history_get_competition_detail(self.comp_id)
+        except Exception as e:
+            print(f"Nie udało się wczytać wyników zawodów {self.comp_id}: {e}")
+            return
+        if data:
+            self.loaded.emit(self.comp_id, data)
 
 
 def calculate_recommended_gate(hill, jumpers):
@@ -451,33 +937,7 @@ def calculate_recommended_gate(hill, jumpers):
     if not jumpers or not hill:
         return 1
 
-    # Sprawdź każdą belkę od najwyższej do najniższej
-    for gate in range(hill.gates, 0, -1):
-        max_distance = 0
-        safe_gate = True
-
-        # Sprawdź wszystkich zawodników na tej belce
-        for jumper in jumpers:
-            try:
-                distance = fly_simulation(hill, jumper, gate_number=gate)
-                max_distance = max(max_distance, distance)
-
-                # Jeśli którykolwiek skoczek przekracza HS, ta belka nie jest bezpieczna
-                if distance > hill.L:
-                    safe_gate = False
-                    break
-
-            except Exception:
-                # W przypadku błędu symulacji, uznaj belkę za niebezpieczną
-                safe_gate = False
-                break
-
-        # Jeśli wszystkie skoki są bezpieczne, to jest rekomendowana belka
-        if safe_gate:
-            return gate
-
-    # Jeśli żadna belka nie jest bezpieczna, zwróć najniższą
-    return 1
+    return _scan_gates(hill, jumpers)[0]
 
 
 def format_distance_with_unit(distance: float) -> str:
@@ -486,21 +946,22 @@ def format_distance_with_unit(distance: float) -> str:
     return f"{rounded_distance:.1f} m"
 
 
-def create_arrow_pixmap(direction, color):
-    """Tworzy pixmapę ze strzałką (trójkątem) o danym kolorze."""
-    pixmap = QPixmap(10, 10)
-    pixmap.fill(Qt.GlobalColor.transparent)
-    painter = QPainter(pixmap)
-    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-    painter.setPen(Qt.PenStyle.NoPen)
-    painter.setBrush(QColor(color))
-    if direction == "up":
-        points = [QPoint(5, 2), QPoint(2, 7), QPoint(8, 7)]
-    else:  # down
-        points = [QPoint(5, 8), QPoint(2, 3), QPoint(8, 3)]
-    painter.drawPolygon(QPolygon(points))
-    painter.end()
-    return pixmap
+def format_distances_vec(distances) -> list:
+    """Formatuje całą listę odległości naraz (jak format_distance_with_unit)."""
+    rounded = round_distance_to_half_meter_vec(distances)
+    return ["%.1f m" % distance for distance in rounded.tolist()]
+
+
+# Wzorzec ~25 szerokich znaków do wyznaczenia szerokości kolumny nazwisk
+_NAME_PROBE = "W" * 25
+
+
+@functools.lru_cache(maxsize=8)
+def _name_column_width(font_key: str) -> int:
+    """Szerokość kolumny nazwisk dla czcionki opisanej przez QFont.toString()."""
+    font = QFont()
+    font.fromString(font_key)
+    return QFontMetrics(font).horizontalAdvance(_NAME_PROBE) + 20
 
 
 class CustomSpinBox(QSpinBox):
@@ -530,13 +991,6 @@ class CustomSpinBox(QSpinBox):
         self.up_button.clicked.connect(self.stepUp)
         self.down_button.clicked.connect(self.stepDown)
 
-    def set_button_icons(self, up_icon, down_icon):
-        # Keep textual arrows for crisp, minimal look across DPI settings
-        self.up_button.setIcon(QIcon())
-        self.down_button.setIcon(QIcon())
-        self.up_button.setText("▲")
-        self.down_button.setText("▼")
-
     def resizeEvent(self, event):
         super().resizeEvent(event)
         button_width = 25
@@ -581,13 +1035,6 @@ class CustomDoubleSpinBox(QDoubleSpinBox):
         self.up_button.clicked.connect(self.stepUp)
         self.down_button.clicked.connect(self.stepDown)
 
-    def set_button_icons(self, up_icon, down_icon):
-        # Keep textual arrows for crisp, minimal look across DPI settings
-        self.up_button.setIcon(QIcon())
-        self.down_button.setIcon(QIcon())
-        self.up_button.setText("▲")
-        self.down_button.setText("▼")
-
     def resizeEvent(self, event):
         super().resizeEvent(event)
         button_width = 25
@@ -618,38 +1065,7 @@ class CustomSlider(QWidget):
         # Slider
         self.slider = ModernSlider(Qt.Horizontal)
         self.slider.setRange(0, 100)
-        # Apply slider styles directly
-        self.slider.setStyleSheet("""
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #1e2430;
-                border-radius: 4px;
-                border: none;
-                margin: 0;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4c84ff;
-                border-radius: 4px;
-                border: none;
-            }
-            QSlider::add-page:horizontal {
-                background: #2a2f3a;
-                border-radius: 4px;
-                border: none;
-            }
-            QSlider::handle:horizontal {
-                width: 20px;
-                height: 20px;
-                margin: -6px 0;
-                border-radius: 10px;
-                background: #4c84ff;
-                border: 3px solid #0f1115;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #5b90ff;
-                border-color: #1e2430;
-            }
-        """)
+        # Wygląd zapewnia ModernSlider.paintEvent i globalny QSS (ui/styles.qss)
 
         # Custom value spinbox with custom arrow buttons
         self.value_spinbox = CustomDoubleSpinBox()
@@ -663,16 +1079,14 @@ class CustomSlider(QWidget):
         self.slider.valueChanged.connect(self._update_spinbox)
         self.value_spinbox.valueChanged.connect(self._update_slider)
 
-    def set_button_icons(self, up_icon, down_icon):
-        """Ustawia ikony przycisków dla spinboxa."""
-        self.value_spinbox.set_button_icons(up_icon, down_icon)
-
+    @pyqtSlot(int)
     def _update_spinbox(self, value):
         # Prevent recursive calls
         self.value_spinbox.blockSignals(True)
         self.value_spinbox.setValue(float(value))
         self.value_spinbox.blockSignals(False)
 
+    @pyqtSlot(float)
     def _update_slider(self, value):
         # Prevent recursive calls
         self.slider.blockSignals(True)
@@ -709,12 +1123,15 @@ class CustomProxyStyle(QProxyStyle):
                 return 0
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """
     Zwraca ścieżkę do zasobu, preferując zasoby obok pliku .exe w trybie
     zapakowanym (onefile). Jeśli nie ma zasobu obok .exe, używa rozpakowanych
     plików wewnątrz katalogu tymczasowego (_MEIPASS). W trybie uruchamiania ze
     źródeł zwraca ścieżkę względną do bieżącego katalogu.
+
+    Wynik jest zapamiętywany – układ zasobów nie zmienia się w trakcie działania.
     """
     if getattr(sys, "frozen", False):
         # Preferuj zasoby zewnętrzne obok .exe
@@ -731,6 +1148,103 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+def _write_data_json(path, sections):
+    """
+    Zapisuje plik danych (sekcja -> lista obiektów z to_dict) rekord po rekordzie.
+
+    Wynik jest identyczny z json.dump(..., indent=4) całego słownika, ale w
+    pamięci jest naraz tylko jeden rekord. Zapis idzie do pliku tymczasowego w
+    tym samym katalogu, który zastępuje docelowy dopiero po udanym zapisie.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write("{")
+            for si, (name, objects) in enumerate(sections):
+                f.write(f'{"," if si else ""}\n    {json.dumps(name)}: [')
+                count = 0
+                for obj in objects:
+                    record = json.dumps(obj.to_dict(), ensure_ascii=False, indent=4)
+                    f.write("," if count else "")
+                    f.write("\n        ")
+                    f.write(record.replace("\n", "\n        "))
+                    count += 1
+                f.write("\n    ]" if count else "]")
+            f.write("\n}" if sections else "}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+# Wartości początkowe wyniku zawodnika odtwarzanego z historii (obie serie puste)
+_HISTORY_RESULT_TEMPLATE = MappingProxyType(
+    {
+        "d1": 0.0,
+        "p1": 0.0,
+        "d2": 0.0,
+        "p2": 0.0,
+        "judges1": None,
+        "judges2": None,
+        "timing1": None,
+        "timing2": None,
+    }
+)
+# Seria -> klucze wyniku (odległość, punkty, noty, timing) uzupełniane z jej skoków
+_HISTORY_ROUND_KEYS = (
+    (1, "d1", "p1", "judges1", "timing1"),
+    (2, "d2", "p2", "judges2", "timing2"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_flag_image(flag_path):
+    """Wczytuje plik flagi jako RGBA raz; wszystkie rozmiary flag skalują tę kopię."""
+    with Image.open(flag_path) as img:
+        return img.convert("RGBA")
+
+
+@functools.lru_cache(maxsize=512)
+def _rounded_flag_pixmap(country_code, target_w, target_h, radius):
+    """
+    Flaga z zaokrąglonymi rogami w danym rozmiarze.
+
+    Zapamiętywana dla (kraj, rozmiar, promień) – te same flagi powtarzają się
+    w tabelach, kartach i listach, a rasteryzacja przez PIL jest kosztowna.
+    """
+    if not country_code:
+        return QPixmap()
+    flag_path = resource_path(os.path.join("assets", "flags", f"{country_code}.png"))
+    if not os.path.exists(flag_path):
+        return QPixmap()
+    try:
+        # Wysokiej jakości antyaliasing: rysuj maskę w skali i przeskaluj LANCZOS
+        scale = 4
+        hi_w, hi_h = target_w * scale, target_h * scale
+        img = _load_flag_image(flag_path)
+        img_resized = img.resize((hi_w, hi_h), Image.Resampling.LANCZOS)
+        mask_hi = Image.new("L", (hi_w, hi_h), 0)
+        draw = ImageDraw.Draw(mask_hi)
+        draw.rounded_rectangle(((0, 0), (hi_w, hi_h)), radius=radius * scale, fill=255)
+        # Minimalne rozmycie krawędzi maski, by usunąć pikselowe rogi
+        mask_hi = mask_hi.filter(ImageFilter.GaussianBlur(radius=scale * 0.35))
+        img_resized.putalpha(mask_hi)
+        # Downscale do docelowego rozmiaru z zachowaniem antyaliasingu
+        final_img = img_resized.resize((target_w, target_h), Image.Resampling.LANCZOS)
+        qimage = QImage(
+            final_img.tobytes("raw", "RGBA"),
+            final_img.width,
+            final_img.height,
+            QImage.Format_RGBA8888,
+        )
+        return QPixmap.fromImage(qimage)
+    except Exception as e:
+        print(f"Error creating flag pixmap for {country_code}: {e}")
+        return QPixmap()
+
+
 class MainWindow(QMainWindow):
     """
     Główne okno aplikacji symulatora skoków narciarskich.
@@ -749,39 +1263,43 @@ class MainWindow(QMainWindow):
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
 
+        # Kolejność stron w stosie = kolejność ich tworzenia poniżej
         (
             self.MAIN_MENU_IDX,
-            self.SIM_TYPE_MENU_IDX,
             self.SINGLE_JUMP_IDX,
             self.COMPETITION_IDX,
             self.DATA_EDITOR_IDX,
-            self.DESCRIPTION_IDX,
             self.SETTINGS_IDX,
             self.JUMP_REPLAY_IDX,
             self.POINTS_BREAKDOWN_IDX,
             self.SUPPORT_IDX,
             self.HISTORY_IDX,
-        ) = range(11)
+        ) = range(9)
 
         self.current_theme = "dark"
         self.contrast_level = 1.0
         self.volume_level = 0.3
 
-        self.up_arrow_icon_dark = QIcon(create_arrow_pixmap("up", "#b0b0b0"))
-        self.down_arrow_icon_dark = QIcon(create_arrow_pixmap("down", "#b0b0b0"))
-        self.up_arrow_icon_light = QIcon(create_arrow_pixmap("up", "#404040"))
-        self.down_arrow_icon_light = QIcon(create_arrow_pixmap("down", "#404040"))
-
         # Global QSS is loaded in __main__; remove legacy dynamic themes
 
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
+        # Ikony flag: (kod kraju, promień) -> QIcon; krajów jest dużo mniej niż pozycji
+        self._flag_icon_cache = {}
+        # Kolejności sortowania list: (rodzaj, wg kraju) -> lista obiektów;
+        # czyszczone przy każdej zmianie danych
+        self._sort_orders = {}
+        # (imię, nazwisko) -> zawodnik, budowany przy pierwszym użyciu
+        self._jumper_index = None
+        # nazwa -> skocznia, budowany przy pierwszym użyciu
+        self._hill_index = None
+        self._history_detail_hill_name = ""
+
+        # QSoundEffect trzyma zdekodowane PCM w pamięci – klik bez opóźnienia startu
+        self.player = QSoundEffect()
         sound_file = resource_path(os.path.join("assets", "click.wav"))
         self.sound_loaded = os.path.exists(sound_file)
         if self.sound_loaded:
             self.player.setSource(QUrl.fromLocalFile(sound_file))
-            self.audio_output.setVolume(self.volume_level)
+            self.player.setVolume(self.volume_level)
 
         try:
             self.all_hills, self.all_jumpers = load_data_from_json()
@@ -795,10 +1313,8 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(None, title, message)
             self.all_hills, self.all_jumpers = [], []
 
-        if self.all_jumpers:
-            self.all_jumpers.sort(key=lambda jumper: str(jumper))
-        if self.all_hills:
-            self.all_hills.sort(key=lambda hill: str(hill))
+        sort_by_name(self.all_jumpers)
+        sort_by_name(self.all_hills)
 
         main_container = QWidget()
         shell_layout = QHBoxLayout(main_container)
@@ -823,6 +1339,9 @@ class MainWindow(QMainWindow):
         self.central_widget = AnimatedStackedWidget()
         content_layout.addWidget(self.central_widget, 1)
 
+        # Proces do skanu belek startuje w tle przy pierwszym wejściu w zawody
+        self._warmup_worker = None
+
         self.author_label = QLabel("Antoni Sokołowski")
         self.author_label.setObjectName("authorLabel")
         content_layout.addWidget(self.author_label, 0, Qt.AlignRight)
@@ -834,10 +1353,7 @@ class MainWindow(QMainWindow):
         self.competition_results = []
         self.current_jumper_index = 0
         self.current_round = 1
-        self.selected_jumper, self.selected_hill, self.ani = None, None, None
-        self.points_ani = None
-        self.replay_ani = None
-        self.zoom_ani = None
+        self.selected_jumper, self.selected_hill = None, None
         self.jumper_edit_widgets = {}
         self.hill_edit_widgets = {}
 
@@ -845,32 +1361,16 @@ class MainWindow(QMainWindow):
         self.judge_panel = JudgePanel()
 
         self._create_main_menu()
-        self._create_sim_type_menu()  # placeholder to preserve indices
         self._create_single_jump_page()
         self._create_competition_page()
-        self._create_data_editor_page()
-        # Zachowaj kolejność indeksów: Opis (placeholder), Ustawienia, Powtórka, Punkty
-        self._create_description_page()
-        self._create_settings_page()
+        # Strony bez powiązań z resztą okna budowane są przy pierwszym wejściu
+        self.central_widget.add_lazy_page(self._create_data_editor_page)
+        self.central_widget.add_lazy_page(self._create_settings_page)
         self._create_jump_replay_page()
         self._create_points_breakdown_page()
-        self._create_support_page()
+        self.central_widget.add_lazy_page(self._create_support_page)
         self._create_history_page()
 
-        # Map indices to titles
-        self.index_to_title = {
-            self.MAIN_MENU_IDX: "Start",
-            self.SINGLE_JUMP_IDX: "Symulacja skoku",
-            self.COMPETITION_IDX: "Zawody",
-            self.DATA_EDITOR_IDX: "Edytor danych",
-            # Opis projektu usunięty, Ustawienia odchudzone
-            self.SETTINGS_IDX: "Ustawienia",
-            self.JUMP_REPLAY_IDX: "Powtórka skoku",
-            self.POINTS_BREAKDOWN_IDX: "Podział punktów",
-            self.SUPPORT_IDX: "Wsparcie",
-            self.HISTORY_IDX: "Historia",
-        }
-
         # Build navigation buttons and wire to pages
         def go(idx: int):
             return lambda: [self.play_sound(), self.central_widget.setCurrentIndex(idx)]
@@ -898,6 +1398,22 @@ class MainWindow(QMainWindow):
         # Usunięto skrót do punktów z paska bocznego
         self.nav_sidebar.finalize()
 
+        # Tytuł nagłówka i aktywny przycisk paska dla każdej strony (indeks = strona);
+        # strony spoza tabeli (np. szczegóły historii) dostają tytuł domyślny
+        self._page_meta = [None] * self.central_widget.count()
+        for idx, title, btn in (
+            (self.MAIN_MENU_IDX, "Start", self._nav_btn_start),
+            (self.SINGLE_JUMP_IDX, "Symulacja skoku", self._nav_btn_single),
+            (self.COMPETITION_IDX, "Zawody", self._nav_btn_comp),
+            (self.DATA_EDITOR_IDX, "Edytor danych", self._nav_btn_editor),
+            (self.SETTINGS_IDX, "Ustawienia", self._nav_btn_settings),
+            (self.JUMP_REPLAY_IDX, "Powtórka skoku", None),
+            (self.POINTS_BREAKDOWN_IDX, "Podział punktów", None),
+            (self.SUPPORT_IDX, "Wsparcie", self._nav_btn_support),
+            (self.HISTORY_IDX, "Historia", self._nav_btn_history),
+        ):
+            self._page_meta[idx] = (title, btn)
+
         # React to page changes: update title and active nav
         self.central_widget.currentChanged.connect(self._on_page_changed)
         self._on_page_changed(self.central_widget.currentIndex())
@@ -934,42 +1450,9 @@ class MainWindow(QMainWindow):
         grid.setContentsMargins(0, 0, 0, 0)
 
         def make_card(text, sub, on_click):
-            # Create a custom widget container
-            container = QWidget()
-            container.setProperty("class", "cardButton")
-            container.setCursor(Qt.PointingHandCursor)
-            container.setMinimumSize(280, 120)
-            container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-            # Create layout
-            layout = QVBoxLayout(container)
-            layout.setContentsMargins(24, 28, 24, 20)
-            layout.setSpacing(8)
-
-            # Add some top spacing for better symmetry
-            layout.addSpacing(4)
-
-            # Main text label (bold)
-            main_label = QLabel(text)
-            main_label.setProperty("class", "cardMainText")
-            main_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            main_label.setWordWrap(True)
-
-            # Subtitle label
-            sub_label = QLabel(sub)
-            sub_label.setProperty("class", "cardSubText")
-            sub_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-            sub_label.setWordWrap(True)
-
-            # Add labels to layout
-            layout.addWidget(main_label)
-            layout.addWidget(sub_label)
-            layout.addStretch()
-
-            # Make the entire widget clickable
-            container.mousePressEvent = lambda event: [self.play_sound(), on_click()]
-
-            return container
+            card = CardButton(text, sub)
+            card.clicked.connect(lambda checked=False: (self.play_sound(), on_click()))
+            return card
 
         card_single = make_card(
             "Skok",
@@ -1017,11 +1500,6 @@ class MainWindow(QMainWindow):
         self.central_widget.addWidget(widget)
         self.page_main_menu = widget
 
-    def _create_sim_type_menu(self):
-        # Nie tworzymy już strony wyboru trybów – utrzymujemy indeksy, dodając pusty widget
-        widget = QWidget()
-        self.central_widget.addWidget(widget)
-
     def _create_single_jump_page(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -1043,11 +1521,12 @@ class MainWindow(QMainWindow):
 
         # Wybór zawodnika
         self.jumper_combo = ModernComboBox()
-        self.jumper_combo.addItem("Wybierz zawodnika")
-        for jumper in self.all_jumpers:
-            self.jumper_combo.addItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
+        self._fill_flag_combo(
+            self.jumper_combo,
+            "Wybierz zawodnika",
+            [str(jumper) for jumper in self.all_jumpers],
+            [jumper.nationality for jumper in self.all_jumpers],
+        )
         self.jumper_combo.currentIndexChanged.connect(self.update_jumper)
         config_group_layout.addLayout(
             self._create_form_row("Zawodnik:", self.jumper_combo)
@@ -1055,11 +1534,12 @@ class MainWindow(QMainWindow):
 
         # Wybór skoczni
         self.hill_combo = ModernComboBox()
-        self.hill_combo.addItem("Wybierz skocznię")
-        for hill in self.all_hills:
-            self.hill_combo.addItem(
-                self.create_rounded_flag_icon(hill.country), str(hill)
-            )
+        self._fill_flag_combo(
+            self.hill_combo,
+            "Wybierz skocznię",
+            [str(hill) for hill in self.all_hills],
+            [hill.country for hill in self.all_hills],
+        )
         self.hill_combo.currentIndexChanged.connect(self.update_hill)
         config_group_layout.addLayout(
             self._create_form_row("Skocznia:", self.hill_combo)
@@ -1114,9 +1594,8 @@ class MainWindow(QMainWindow):
         animation_group = QGroupBox("Animacja trajektorii")
         animation_group_layout = QVBoxLayout(animation_group)
 
-        self.figure = Figure(facecolor="#0f1115")
-        self.canvas = FigureCanvas(self.figure)
-        animation_group_layout.addWidget(self.canvas)
+        self.trajectory_view = TrajectoryView()
+        animation_group_layout.addWidget(self.trajectory_view)
 
         right_panel.addWidget(animation_group)
         right_panel.addStretch()
@@ -1170,20 +1649,19 @@ class MainWindow(QMainWindow):
         sort_layout.addWidget(self.sort_combo)
         jumper_group_layout.addLayout(sort_layout)
 
-        # Lista zawodników z lepszym stylem
-        self.jumper_list_widget = QListWidget()
-        self.jumper_list_widget.setMaximumHeight(300)
-
-        for jumper in self.all_jumpers:
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            item.setData(Qt.UserRole, jumper)
-            self.jumper_list_widget.addItem(item)
-        self.jumper_list_widget.itemChanged.connect(self._on_jumper_item_changed)
-        jumper_group_layout.addWidget(self.jumper_list_widget)
+        # Lista zawodników: model trzyma dane, widok rysuje tylko widoczne wiersze
+        self._jumper_model = JumperListModel(self.create_rounded_flag_icon, self)
+        self._jumper_model.set_jumpers(self.all_jumpers)
+        self._jumper_model.check_changed.connect(self._on_jumper_check_changed)
+        self.jumper_list_view = QListView()
+        self.jumper_list_view.setObjectName("jumperList")
+        self.jumper_list_view.setUniformItemSizes(True)
+        # Długa lista układana partiami w czasie bezczynności pętli zdarzeń
+        self.jumper_list_view.setLayoutMode(QListView.Batched)
+        self.jumper_list_view.setBatchSize(64)
+        self.jumper_list_view.setMaximumHeight(300)
+        self.jumper_list_view.setModel(self._jumper_model)
+        jumper_group_layout.addWidget(self.jumper_list_view)
 
         left_panel.addWidget(jumper_group)
 
@@ -1203,11 +1681,12 @@ class MainWindow(QMainWindow):
         hill_layout.addWidget(hill_label)
 
         self.comp_hill_combo = ModernComboBox()
-        self.comp_hill_combo.addItem("Wybierz skocznię")
-        for hill in self.all_hills:
-            self.comp_hill_combo.addItem(
-                self.create_rounded_flag_icon(hill.country), str(hill)
-            )
+        self._fill_flag_combo(
+            self.comp_hill_combo,
+            "Wybierz skocznię",
+            [str(hill) for hill in self.all_hills],
+            [hill.country for hill in self.all_hills],
+        )
         self.comp_hill_combo.currentIndexChanged.connect(self.update_competition_hill)
         hill_layout.addWidget(self.comp_hill_combo)
         hill_gate_container.addLayout(hill_layout)
@@ -1317,37 +1796,21 @@ class MainWindow(QMainWindow):
         )
         self.results_table.verticalHeader().setDefaultSectionSize(34)
         self.results_table.verticalHeader().setVisible(False)
-        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeToContents
-        )
-        self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Fixed)
+        header = self.results_table.horizontalHeader()
+        # Numeric columns (3-7) stretch to occupy remaining width nicely
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
         # Name column: fixed width to fit ~25 bold characters
-        self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)
-        # Numeric columns stretch to occupy remaining width nicely
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            3, QHeaderView.Stretch
-        )
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.Stretch
-        )
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            5, QHeaderView.Stretch
-        )
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            6, QHeaderView.Stretch
-        )
-        self.results_table.horizontalHeader().setSectionResizeMode(
-            7, QHeaderView.Stretch
-        )
+        header.setSectionResizeMode(2, QHeaderView.Fixed)
         # Allow narrow sections so compact modes can actually shrink
-        self.results_table.horizontalHeader().setMinimumSectionSize(24)
+        header.setMinimumSectionSize(24)
         # Compute and set name column width for ~25 characters (bold font used in cells)
         name_font = self.results_table.font()
         name_font.setBold(True)
-        metrics_name = QFontMetrics(name_font)
-        name_col_width = metrics_name.horizontalAdvance("W" * 25) + 20
-        self.results_table.setColumnWidth(2, name_col_width)
+        self.results_table.setColumnWidth(
+            2, _name_column_width(name_font.toString())
+        )
         self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.results_table.cellClicked.connect(self._on_result_cell_clicked)
@@ -1375,18 +1838,10 @@ class MainWindow(QMainWindow):
         )
         self.qualification_table.verticalHeader().setDefaultSectionSize(34)
         self.qualification_table.verticalHeader().setVisible(False)
-        self.qualification_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
-        )
-        self.qualification_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeToContents
-        )
-        self.qualification_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.Fixed
-        )
-        self.qualification_table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.Stretch
-        )
+        header = self.qualification_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
         self.qualification_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.qualification_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.qualification_table.cellClicked.connect(
@@ -1440,25 +1895,30 @@ class MainWindow(QMainWindow):
         jumper_tab = QWidget()
         jumper_tab_layout = QVBoxLayout(jumper_tab)
         jumper_tab_layout.setContentsMargins(0, 0, 0, 0)
-        self.editor_jumper_list = QListWidget()
+        self.editor_jumper_list = self._create_editor_list_view("nationality")
         jumper_tab_layout.addWidget(self.editor_jumper_list)
         self.editor_tab_widget.addTab(jumper_tab, "Skoczkowie")
 
         hill_tab = QWidget()
         hill_tab_layout = QVBoxLayout(hill_tab)
         hill_tab_layout.setContentsMargins(0, 0, 0, 0)
-        self.editor_hill_list = QListWidget()
+        self.editor_hill_list = self._create_editor_list_view("country")
         hill_tab_layout.addWidget(self.editor_hill_list)
         self.editor_tab_widget.addTab(hill_tab, "Skocznie")
 
         self._repopulate_editor_lists()
 
-        self.editor_jumper_list.currentItemChanged.connect(self._populate_editor_form)
-        self.editor_hill_list.currentItemChanged.connect(self._populate_editor_form)
+        for view in (self.editor_jumper_list, self.editor_hill_list):
+            view.selectionModel().currentChanged.connect(self._populate_editor_form)
 
         self.editor_sort_combo.currentTextChanged.connect(self._sort_editor_lists)
         self.editor_tab_widget.currentChanged.connect(self._filter_editor_lists)
-        self.editor_search_bar.textChanged.connect(self._filter_editor_lists)
+        # Filtrowanie dopiero po krótkiej przerwie w pisaniu, a nie po każdym znaku
+        self._editor_filter_timer = QTimer(self)
+        self._editor_filter_timer.setSingleShot(True)
+        self._editor_filter_timer.setInterval(80)
+        self._editor_filter_timer.timeout.connect(self._filter_editor_lists)
+        self.editor_search_bar.textChanged.connect(self._editor_filter_timer.start)
 
         left_panel.addWidget(self.editor_tab_widget)
 
@@ -1490,7 +1950,6 @@ class MainWindow(QMainWindow):
         jumper_form_scroll.setWidgetResizable(True)
         self.jumper_form_widget = QWidget()
         self.jumper_form_widget.setObjectName("editorForm")
-        self.jumper_form_widget.setObjectName("editorForm")
         self.jumper_edit_widgets = self._create_editor_form_content(
             self.jumper_form_widget, Jumper
         )
@@ -1500,7 +1959,6 @@ class MainWindow(QMainWindow):
         hill_form_scroll.setWidgetResizable(True)
         self.hill_form_widget = QWidget()
         self.hill_form_widget.setObjectName("editorForm")
-        self.hill_form_widget.setObjectName("editorForm")
         self.hill_edit_widgets = self._create_editor_form_content(
             self.hill_form_widget, Hill
         )
@@ -1525,91 +1983,11 @@ class MainWindow(QMainWindow):
 
         main_hbox.addLayout(right_panel, 2)
 
-        self.central_widget.addWidget(widget)
+        return widget
 
     def _create_editor_form_content(self, parent_widget, data_class):
-        jumper_groups = {
-            "Dane Podstawowe": ["name", "last_name", "nationality"],
-            "Najazd": [
-                "inrun_position",
-            ],
-            "Wybicie": [
-                "takeoff_force",
-                "timing",
-            ],
-            "Lot": [
-                "flight_technique",
-                "flight_style",
-                "flight_resistance",
-            ],
-            "Lądowanie": [
-                "telemark",
-                "stability",
-            ],
-        }
-        hill_groups = {
-            "Dane Podstawowe": ["name", "country", "K", "L", "gates"],
-            "Geometria Najazdu": ["e1", "e2", "t", "gamma_deg", "alpha_deg", "r1"],
-            "Profil Zeskoku": [
-                "h",
-                "n",
-                "s",
-                "P",
-                "l1",
-                "l2",
-                "a_finish",
-                "beta_deg",
-                "betaP_deg",
-                "betaL_deg",
-                "Zu",
-            ],
-            "Parametry Fizyczne": ["inrun_friction_coefficient"],
-        }
-
-        groups = jumper_groups if data_class == Jumper else hill_groups
-        jumper_tooltips = {
-            "name": "Imię zawodnika.",
-            "last_name": "Nazwisko zawodnika.",
-            "nationality": "Kod kraju (np. POL, GER, NOR). Wpływa na wyświetlaną flagę.",
-            "inrun_position": "Pozycja najazdowa skoczka. Wyższe wartości = lepsza aerodynamika = wyższa prędkość na progu.",
-            "takeoff_force": "Siła wybicia skoczka. Wyższe wartości = większa siła odbicia = dłuższe skoki. Kluczowy parametr wpływający na parabolę lotu.",
-            "timing": "Timing wybicia. Wyższe wartości = bliżej optimum, lepsze ukierunkowanie impulsu i mniejsza losowość.",
-            "flight_technique": "Technika lotu skoczka. Wyższe wartości = lepsze wykorzystanie siły nośnej = dłuższe skoki.",
-            "flight_style": "Styl lotu skoczka. Normalny = zrównoważony styl. Agresywny = mniejsza powierzchnia czołowa. Pasywny = większa powierzchnia czołowa.",
-            "flight_resistance": "Opór powietrza w locie. Wyższe wartości = mniejszy opór aerodynamiczny = dłuższe skoki.",
-            "telemark": "Umiejętność lądowania telemarkiem. Wyższe wartości = częstsze i ładniejsze lądowania telemarkiem.",
-            "stability": "Stabilność lądowania. Zmniejsza ryzyko podpórki i upadku daleko za HS.",
-            "landing_drag_coefficient": "Opór aerodynamiczny podczas lądowania (bardzo wysoki).",
-            "landing_frontal_area": "Powierzchnia czołowa podczas lądowania (największa).",
-            "landing_lift_coefficient": "Siła nośna podczas lądowania (zazwyczaj 0).",
-        }
-        hill_tooltips = {
-            "name": "Oficjalna nazwa skoczni.",
-            "country": "Kod kraju (np. POL, GER, NOR). Wpływa na wyświetlaną flagę.",
-            "gates": "Całkowita liczba belek startowych dostępnych na skoczni.",
-            "e1": "Długość najazdu od najwyższej belki do progu (w metrach).",
-            "e2": "Długość najazdu od najniższej belki do progu (w metrach).",
-            "t": "Długość drugiej prostej najadzu (w metrach).",
-            "inrun_friction_coefficient": "Współczynnik tarcia nart o tory. Wyższe wartości = niższa prędkość na progu. Typowo: 0.02.",
-            "P": "Początek strefy lądowania (w metrach).",
-            "K": "Punkt konstrukcyjny skoczni w metrach (np. 90, 120, 200).",
-            "l1": "Odległość po zeskoku między punktem P a K (w metrach).",
-            "l2": "Odległosć po zeskoku między punktem K a L (w metrach).",
-            "a_finish": "Długość całego wypłaszczenia zeskoku (w metrach).",
-            "L": "Rozmiar skoczni (HS) w metrach. Określa granicę bezpiecznego skoku.",
-            "alpha_deg": "Kąt nachylenia progu w stopniach. Kluczowy dla kąta wybicia. Zwykle 10-11 stopni.",
-            "gamma_deg": "Kąt nachylenia górnej, stromej części najazdu w stopniach.",
-            "r1": "Promień krzywej przejściowej na najeździe (w metrach).",
-            "h": "Różnica wysokości między progiem a punktem K.",
-            "n": "Odległość w poziomie między progiem a punktem K.",
-            "betaP_deg": "Kąt nachylenia zeskoku w punkcie P w stopniach.",
-            "beta_deg": "Kąt nachylenia zeskoku w punkcie K w stopniach.",
-            "betaL_deg": "Kąt nachylenia zeskoku w punkcie L w stopniach.",
-            "Zu": "Wysokość progu nad pełnym wypłaszczeniem zeskoku (w metrach).",
-            "s": "Wysokość progu nad zeskokiem.",
-        }
-
-        tooltips = jumper_tooltips if data_class == Jumper else hill_tooltips
+        groups = _JUMPER_GROUPS if data_class is Jumper else _HILL_GROUPS
+        tooltips = _JUMPER_TOOLTIPS if data_class is Jumper else _HILL_TOOLTIPS
         widgets = {}
         main_layout = QVBoxLayout(parent_widget)
 
@@ -1618,91 +1996,8 @@ class MainWindow(QMainWindow):
             form_layout = QFormLayout(group_box)
 
             for attr in attributes:
-                widget = None
-                if attr in ["K", "L", "gates"]:
-                    widget = CustomSpinBox()
-                    widget.setRange(0, 500)
-                elif (
-                    "coefficient" in attr
-                    or "area" in attr
-                    or attr
-                    in [
-                        "e1",
-                        "e2",
-                        "t",
-                        "r1",
-                        "h",
-                        "n",
-                        "s",
-                        "l1",
-                        "l2",
-                        "a_finish",
-                        "P",
-                        "Zu",
-                    ]
-                ):
-                    widget = CustomDoubleSpinBox()
-                    widget.setRange(-10000.0, 10000.0)
-                    widget.setDecimals(4)
-                    widget.setSingleStep(0.01)
-                elif attr in [
-                    "inrun_position",
-                    "takeoff_force",
-                    "timing",
-                    "flight_technique",
-                    "flight_resistance",
-                    "telemark",
-                    "stability",
-                ]:
-                    widget = CustomSlider()
-                    widget.setRange(0, 100)
-                elif attr == "flight_style":
-                    widget = ModernComboBox()
-                    widget.addItems(["Normalny", "Agresywny", "Pasywny"])
-                    # Ustawienie odpowiedniego rozmiaru dla dropdowna
-                    widget.setFixedHeight(
-                        35
-                    )  # Większa wysokość aby tekst był w pełni widoczny
-                elif "deg" in attr:
-                    widget = CustomDoubleSpinBox()
-                    widget.setRange(-10000.0, 10000.0)
-                    widget.setDecimals(2)
-                else:
-                    widget = QLineEdit()
-
-                # Ustawienie ikon w zależności od motywu
-                if isinstance(
-                    widget, (CustomSpinBox, CustomDoubleSpinBox, CustomSlider)
-                ):
-                    if self.current_theme == "dark":
-                        widget.set_button_icons(
-                            self.up_arrow_icon_dark, self.down_arrow_icon_dark
-                        )
-                    else:
-                        widget.set_button_icons(
-                            self.up_arrow_icon_light, self.down_arrow_icon_light
-                        )
-
-                # Special case for Polish labels
-                if attr == "inrun_position":
-                    label_text = "Pozycja najazdowa:"
-                elif attr == "takeoff_force":
-                    label_text = "Siła wybicia:"
-                elif attr == "timing":
-                    label_text = "Timing wybicia:"
-                elif attr == "flight_technique":
-                    label_text = "Technika lotu:"
-                elif attr == "flight_style":
-                    label_text = "Styl lotu:"
-                elif attr == "flight_resistance":
-                    label_text = "Opór powietrza:"
-                elif attr == "stability":
-                    label_text = "Stabilność:"
-                else:
-                    label_text = (
-                        attr.replace("_", " ").replace("deg", "(deg)").capitalize()
-                        + ":"
-                    )
+                widget = self._create_editor_field(_attr_spec(attr))
+                label_text = _attr_label(attr)
 
                 label_widget = QLabel(label_text)
                 label_widget.setToolTip(tooltips.get(attr, ""))
@@ -1715,102 +2010,110 @@ class MainWindow(QMainWindow):
         main_layout.addStretch()
         return widgets
 
-    def _filter_editor_lists(self):
-        search_text = self.editor_search_bar.text().lower().strip()
-
-        current_tab_index = self.editor_tab_widget.currentIndex()
-        active_list = (
-            self.editor_jumper_list if current_tab_index == 0 else self.editor_hill_list
-        )
-
-        for i in range(active_list.count()):
-            item = active_list.item(i)
-            item_text = item.text().lower()
+    @staticmethod
+    def _create_editor_field(spec):
+        """Tworzy widget pola formularza edytora według specyfikacji z _ATTR_SPEC."""
+        kind, *args = spec
+        if kind == "spin":
+            widget = CustomSpinBox()
+            widget.setRange(*args)
+        elif kind == "double":
+            minimum, maximum, decimals, step = args
+            widget = CustomDoubleSpinBox()
+            widget.setRange(minimum, maximum)
+            widget.setDecimals(decimals)
+            if step is not None:
+                widget.setSingleStep(step)
+        elif kind == "slider":
+            widget = CustomSlider()
+            widget.setRange(*args)
+        elif kind == "combo":
+            widget = ModernComboBox()
+            widget.addItems(list(args[0]))
+            # Większa wysokość aby tekst był w pełni widoczny
+            widget.setFixedHeight(35)
+        else:
+            widget = QLineEdit()
+        return widget
+
+    def _create_editor_list_view(self, code_attr):
+        """Widok listy edytora: model obiektów z flagą + filtr wyszukiwania."""
+        model = FlagListModel(code_attr, self.create_rounded_flag_icon, self)
+        proxy = QSortFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        view = QListView()
+        view.setObjectName("editorList")
+        # Wszystkie wiersze mają tę samą wysokość – Qt nie mierzy każdego osobno
+        view.setUniformItemSizes(True)
+        view.setModel(proxy)
+        return view
+
+    def _active_editor_list(self):
+        if self.editor_tab_widget.currentIndex() == 0:
+            return self.editor_jumper_list
+        return self.editor_hill_list
+
+    @staticmethod
+    def _editor_current_object(view):
+        index = view.currentIndex()
+        return index.data(Qt.UserRole) if index.isValid() else None
+
+    def _editor_select(self, view, obj, scroll=False):
+        """Ustawia obiekt jako bieżący element listy edytora."""
+        proxy = view.model()
+        index = proxy.mapFromSource(proxy.sourceModel().index_of(obj))
+        if not index.isValid():
+            return
+        view.setCurrentIndex(index)
+        if scroll:
+            # Przewinięcie tylko, gdy element jest poza widokiem
+            view.scrollTo(index, QListView.ScrollHint.EnsureVisible)
 
-            if search_text in item_text:
-                item.setHidden(False)
+    @pyqtSlot()
+    def _filter_editor_lists(self):
+        self._editor_filter_timer.stop()
+        search_text = self.editor_search_bar.text().strip()
+        self._active_editor_list().model().setFilterFixedString(search_text)
+
+    def _repopulate_editor_lists(self, kinds=("jumpers", "hills")):
+        by_country = "Wg Kraju" in self.editor_sort_combo.currentText()
+        for kind in kinds:
+            if kind == "jumpers":
+                view = self.editor_jumper_list
             else:
-                item.setHidden(True)
-
-    def _repopulate_editor_lists(self):
-        current_jumper = (
-            self.editor_jumper_list.currentItem().data(Qt.UserRole)
-            if self.editor_jumper_list.currentItem()
-            else None
-        )
-        current_hill = (
-            self.editor_hill_list.currentItem().data(Qt.UserRole)
-            if self.editor_hill_list.currentItem()
-            else None
-        )
-
-        self.editor_jumper_list.clear()
-        for jumper in self.all_jumpers:
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
-            item.setData(Qt.UserRole, jumper)
-            self.editor_jumper_list.addItem(item)
-            if jumper == current_jumper:
-                self.editor_jumper_list.setCurrentItem(item)
-
-        self.editor_hill_list.clear()
-        for hill in self.all_hills:
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(hill.country), str(hill)
-            )
-            item.setData(Qt.UserRole, hill)
-            self.editor_hill_list.addItem(item)
-            if hill == current_hill:
-                self.editor_hill_list.setCurrentItem(item)
-
-        self._sort_editor_lists()
+                view = self.editor_hill_list
+            current = self._editor_current_object(view)
+            view.model().sourceModel().set_items(self._sorted_order(kind, by_country))
+            if current is not None:
+                self._editor_select(view, current)
 
+    @pyqtSlot()
     def _sort_editor_lists(self):
         current_tab_index = self.editor_tab_widget.currentIndex()
-        list_widget = (
-            self.editor_jumper_list if current_tab_index == 0 else self.editor_hill_list
-        )
-
-        current_item_data = (
-            list_widget.currentItem().data(Qt.UserRole)
-            if list_widget.currentItem()
-            else None
-        )
-
-        items_data = [
-            list_widget.item(i).data(Qt.UserRole) for i in range(list_widget.count())
-        ]
-
-        sort_text = self.editor_sort_combo.currentText()
-        if "Wg Kraju" in sort_text:
-            items_data.sort(
-                key=lambda x: (
-                    getattr(x, "nationality", "") or getattr(x, "country", ""),
-                    str(x),
-                )
-            )
-        else:
-            items_data.sort(key=lambda x: str(x))
-
-        list_widget.clear()
-        new_selection = None
-        for data_obj in items_data:
-            icon = self.create_rounded_flag_icon(
-                getattr(data_obj, "nationality", None)
-                or getattr(data_obj, "country", None)
+        # Te same obiekty w nowej kolejności – bieżący element pozostaje zaznaczony
+        self._active_editor_list().model().sourceModel().reorder(
+            self._sorted_order(
+                "jumpers" if current_tab_index == 0 else "hills",
+                "Wg Kraju" in self.editor_sort_combo.currentText(),
             )
-            item = QListWidgetItem(icon, str(data_obj))
-            item.setData(Qt.UserRole, data_obj)
-            list_widget.addItem(item)
-            if current_item_data and data_obj == current_item_data:
-                new_selection = item
-
-        if new_selection:
-            list_widget.setCurrentItem(new_selection)
-
+        )
         self._filter_editor_lists()
 
+    def _show_new_editor_item(self, view, obj):
+        """Odświeża dane po dodaniu obiektu i zaznacza go na liście."""
+        if view is self.editor_jumper_list:
+            self._refresh_jumper_widgets()
+        else:
+            self._refresh_hill_widgets()
+        proxy = view.model()
+        if not proxy.mapFromSource(proxy.sourceModel().index_of(obj)).isValid():
+            # Nowy element nie pasuje do wyszukiwania – pokaż pełną listę
+            self.editor_search_bar.clear()
+            self._filter_editor_lists()
+        self._editor_select(view, obj, scroll=True)
+
+    @pyqtSlot()
     def _add_new_item(self):
         self.play_sound()
         current_tab_index = self.editor_tab_widget.currentIndex()
@@ -1818,50 +2121,21 @@ class MainWindow(QMainWindow):
         if current_tab_index == 0:  # Skoczkowie
             new_jumper = Jumper(name="Nowy", last_name="Skoczek", nationality="POL")
             self.all_jumpers.append(new_jumper)
-
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(new_jumper.nationality), str(new_jumper)
-            )
-            item.setData(Qt.UserRole, new_jumper)
-            self.editor_jumper_list.addItem(item)
-            self._sort_editor_lists()
-            for i in range(self.editor_jumper_list.count()):
-                if self.editor_jumper_list.item(i).data(Qt.UserRole) == new_jumper:
-                    self.editor_jumper_list.setCurrentRow(i)
-                    self.editor_jumper_list.scrollToItem(
-                        self.editor_jumper_list.item(i),
-                        QListWidget.ScrollHint.PositionAtCenter,
-                    )
-                    break
+            self._show_new_editor_item(self.editor_jumper_list, new_jumper)
 
         elif current_tab_index == 1:  # Skocznie
             new_hill = Hill(name="Nowa Skocznia", country="POL", K=90, L=120, gates=10)
             self.all_hills.append(new_hill)
+            self._show_new_editor_item(self.editor_hill_list, new_hill)
 
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(new_hill.country), str(new_hill)
-            )
-            item.setData(Qt.UserRole, new_hill)
-            self.editor_hill_list.addItem(item)
-            self._sort_editor_lists()
-            for i in range(self.editor_hill_list.count()):
-                if self.editor_hill_list.item(i).data(Qt.UserRole) == new_hill:
-                    self.editor_hill_list.setCurrentRow(i)
-                    self.editor_hill_list.scrollToItem(
-                        self.editor_hill_list.item(i),
-                        QListWidget.ScrollHint.PositionAtCenter,
-                    )
-                    break
-
-        self._refresh_all_data_widgets()
-
+    @pyqtSlot()
     def _clone_selected_item(self):
         self.play_sound()
         current_tab_index = self.editor_tab_widget.currentIndex()
 
         if current_tab_index == 0:  # Skoczkowie
-            selected_item = self.editor_jumper_list.currentItem()
-            if not selected_item:
+            jumper_to_clone = self._editor_current_object(self.editor_jumper_list)
+            if jumper_to_clone is None:
                 QMessageBox.information(
                     self,
                     "Informacja",
@@ -1869,30 +2143,16 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            jumper_to_clone = selected_item.data(Qt.UserRole)
-            new_jumper = copy.deepcopy(jumper_to_clone)
+            new_jumper = jumper_to_clone.clone()
             new_jumper.name = f"{jumper_to_clone.name} (kopia)"
+            new_jumper.mark_modified()
 
             self.all_jumpers.append(new_jumper)
-
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(new_jumper.nationality), str(new_jumper)
-            )
-            item.setData(Qt.UserRole, new_jumper)
-            self.editor_jumper_list.addItem(item)
-            self._sort_editor_lists()
-            for i in range(self.editor_jumper_list.count()):
-                if self.editor_jumper_list.item(i).data(Qt.UserRole) == new_jumper:
-                    self.editor_jumper_list.setCurrentRow(i)
-                    self.editor_jumper_list.scrollToItem(
-                        self.editor_jumper_list.item(i),
-                        QListWidget.ScrollHint.PositionAtCenter,
-                    )
-                    break
+            self._show_new_editor_item(self.editor_jumper_list, new_jumper)
 
         elif current_tab_index == 1:  # Skocznie
-            selected_item = self.editor_hill_list.currentItem()
-            if not selected_item:
+            hill_to_clone = self._editor_current_object(self.editor_hill_list)
+            if hill_to_clone is None:
                 QMessageBox.information(
                     self,
                     "Informacja",
@@ -1900,45 +2160,23 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            hill_to_clone = selected_item.data(Qt.UserRole)
-            new_hill = copy.deepcopy(hill_to_clone)
+            new_hill = hill_to_clone.clone()
             new_hill.name = f"{hill_to_clone.name} (Kopia)"
+            new_hill.mark_modified()
 
             self.all_hills.append(new_hill)
+            self._show_new_editor_item(self.editor_hill_list, new_hill)
 
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(new_hill.country), str(new_hill)
-            )
-            item.setData(Qt.UserRole, new_hill)
-            self.editor_hill_list.addItem(item)
-            self._sort_editor_lists()
-            for i in range(self.editor_hill_list.count()):
-                if self.editor_hill_list.item(i).data(Qt.UserRole) == new_hill:
-                    self.editor_hill_list.setCurrentRow(i)
-                    self.editor_hill_list.scrollToItem(
-                        self.editor_hill_list.item(i),
-                        QListWidget.ScrollHint.PositionAtCenter,
-                    )
-                    break
-
-        self._refresh_all_data_widgets()
-
+    @pyqtSlot()
     def _delete_selected_item(self):
         self.play_sound()
-        current_tab_index = self.editor_tab_widget.currentIndex()
-        active_list = (
-            self.editor_jumper_list if current_tab_index == 0 else self.editor_hill_list
-        )
-
-        current_item = active_list.currentItem()
-        if not current_item:
+        data_obj = self._editor_current_object(self._active_editor_list())
+        if data_obj is None:
             QMessageBox.warning(
                 self, "Błąd", "Nie zaznaczono żadnego elementu do usunięcia."
             )
             return
 
-        data_obj = current_item.data(Qt.UserRole)
-
         reply = QMessageBox.question(
             self,
             "Potwierdzenie usunięcia",
@@ -1948,37 +2186,25 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            row = active_list.row(current_item)
-            active_list.takeItem(row)
-
             if isinstance(data_obj, Jumper):
                 self.all_jumpers.remove(data_obj)
+                self._refresh_jumper_widgets()
             elif isinstance(data_obj, Hill):
                 self.all_hills.remove(data_obj)
+                self._refresh_hill_widgets()
 
-            del data_obj
-            self._refresh_all_data_widgets()
             self._populate_editor_form()
             QMessageBox.information(
                 self, "Usunięto", "Wybrany element został usunięty."
             )
 
-    def _populate_editor_form(self, current_item=None, previous_item=None):
-        active_list_widget = self.editor_tab_widget.currentWidget()
-        if isinstance(active_list_widget, QListWidget):
-            current_item = active_list_widget.currentItem()
-        else:
-            current_item = (
-                self.editor_jumper_list.currentItem()
-                if self.editor_tab_widget.currentIndex() == 0
-                else self.editor_hill_list.currentItem()
-            )
-
-        if not current_item:
+    @pyqtSlot(QModelIndex, QModelIndex)
+    def _populate_editor_form(self, current=None, previous=None):
+        data_obj = self._editor_current_object(self._active_editor_list())
+        if data_obj is None:
             self.editor_form_stack.setCurrentIndex(0)
             return
 
-        data_obj = current_item.data(Qt.UserRole)
         widgets = {}
         if isinstance(data_obj, Jumper):
             self.editor_form_stack.setCurrentIndex(1)
@@ -1994,78 +2220,46 @@ class MainWindow(QMainWindow):
                 continue
 
             value = getattr(data_obj, attr)
+            slider_field = _SLIDER_FIELDS.get(attr)
+            # Rodzaj pola z tej samej tabeli, z której zbudowano formularz
+            kind = _attr_spec(attr)[0]
 
-            widget.blockSignals(True)
-            try:
-                if attr == "inrun_position":
-                    # Konwertuj inrun_drag_coefficient na wartość slidera
-                    drag_coeff = getattr(data_obj, "inrun_drag_coefficient", 0.46)
-                    slider_value = drag_coefficient_to_slider(drag_coeff)
-                    widget.setValue(slider_value)
-                elif attr == "takeoff_force":
-                    # Konwertuj jump_force na wartość slidera
-                    jump_force = getattr(data_obj, "jump_force", 1500.0)
-                    slider_value = jump_force_to_slider(jump_force)
-                    widget.setValue(slider_value)
-                elif attr == "timing":
-                    timing_value = getattr(data_obj, "timing", 50)
-                    widget.setValue(int(timing_value))
-                elif attr == "flight_technique":
-                    # Konwertuj flight_lift_coefficient na wartość slidera
-                    lift_coeff = getattr(data_obj, "flight_lift_coefficient", 0.8)
-                    slider_value = lift_coefficient_to_slider(lift_coeff)
-                    widget.setValue(slider_value)
-                elif attr == "flight_style":
-                    # Konwertuj flight_frontal_area na styl
-                    frontal_area = getattr(data_obj, "flight_frontal_area", 0.52)
-                    style = frontal_area_to_style(frontal_area)
-                    widget.setCurrentText(style)
-                elif attr == "flight_resistance":
-                    # Konwertuj flight_drag_coefficient na wartość slidera
-                    drag_coeff = getattr(data_obj, "flight_drag_coefficient", 0.5)
-                    slider_value = drag_coefficient_flight_to_slider(drag_coeff)
-                    widget.setValue(slider_value)
-                elif attr == "telemark":
-                    # Ustaw wartość telemark bezpośrednio (nie fizyczna)
-                    telemark_value = getattr(data_obj, "telemark", 50)
-                    widget.setValue(int(telemark_value))
-                elif attr == "stability":
-                    stability_value = getattr(data_obj, "stability", 50)
-                    widget.setValue(int(stability_value))
-
-                elif isinstance(widget, QLineEdit):
-                    widget.setText(str(value) if value is not None else "")
-                elif isinstance(widget, (QDoubleSpinBox, QSpinBox)):
-                    if value is None:
-                        widget.setValue(0)
+            with QSignalBlocker(widget):
+                try:
+                    if slider_field is not None:
+                        source_attr, default, to_slider, _ = slider_field
+                        source_value = getattr(data_obj, source_attr, default)
+                        widget.setValue(to_slider(source_value))
+                    elif attr == "flight_style":
+                        # Konwertuj flight_frontal_area na styl
+                        frontal_area = getattr(data_obj, "flight_frontal_area", 0.52)
+                        widget.setCurrentText(frontal_area_to_style(frontal_area))
+                    elif kind == "line":
+                        widget.setText(str(value) if value is not None else "")
+                    elif kind in ("spin", "double"):
+                        if value is None:
+                            widget.setValue(0)
+                        else:
+                            widget.setValue(float(value))
+                except (ValueError, TypeError) as e:
+                    print(
+                        f"Błąd podczas wypełniania pola dla '{attr}': {e}. Ustawiono wartość domyślną."
+                    )
+                    if kind == "line":
+                        widget.clear()
                     else:
-                        widget.setValue(float(value))
-            except (ValueError, TypeError) as e:
-                print(
-                    f"Błąd podczas wypełniania pola dla '{attr}': {e}. Ustawiono wartość domyślną."
-                )
-                if isinstance(widget, QLineEdit):
-                    widget.clear()
-                else:
-                    widget.setValue(0)
-            finally:
-                widget.blockSignals(False)
+                        widget.setValue(0)
 
+    @pyqtSlot()
     def _save_current_edit(self):
         self.play_sound()
-        current_tab_index = self.editor_tab_widget.currentIndex()
-        active_list_widget = (
-            self.editor_jumper_list if current_tab_index == 0 else self.editor_hill_list
-        )
-
-        current_item = active_list_widget.currentItem()
-        if not current_item:
+        data_obj = self._editor_current_object(self._active_editor_list())
+        if data_obj is None:
             QMessageBox.warning(
                 self, "Błąd", "Nie wybrano żadnego elementu do zapisania."
             )
             return
 
-        data_obj = current_item.data(Qt.UserRole)
         widgets = {}
         if isinstance(data_obj, Jumper):
             widgets = self.jumper_edit_widgets
@@ -2077,82 +2271,42 @@ class MainWindow(QMainWindow):
             if not hasattr(data_obj, attr):
                 continue
 
+            slider_field = _SLIDER_FIELDS.get(attr)
+            kind = _attr_spec(attr)[0]
             try:
-                if attr == "inrun_position":
-                    # Konwertuj wartość slidera na inrun_drag_coefficient
-                    slider_value = widget.value()
-                    drag_coefficient = slider_to_drag_coefficient(slider_value)
-                    setattr(data_obj, "inrun_drag_coefficient", drag_coefficient)
-                elif attr == "takeoff_force":
-                    # Konwertuj wartość slidera na jump_force
-                    slider_value = widget.value()
-                    jump_force = slider_to_jump_force(slider_value)
-                    setattr(data_obj, "jump_force", jump_force)
-                elif attr == "timing":
-                    slider_value = widget.value()
-                    setattr(data_obj, "timing", slider_value)
-                elif attr == "flight_technique":
-                    # Konwertuj wartość slidera na flight_lift_coefficient
-                    slider_value = widget.value()
-                    lift_coefficient = slider_to_lift_coefficient(slider_value)
-                    setattr(data_obj, "flight_lift_coefficient", lift_coefficient)
+                if slider_field is not None:
+                    target_attr, _, _, from_slider = slider_field
+                    setattr(data_obj, target_attr, from_slider(widget.value()))
                 elif attr == "flight_style":
                     # Konwertuj styl na parametry fizyczne
                     style = widget.currentText()
                     old_style = getattr(data_obj, "flight_style", "Normalny")
-
-                    # Sprawdź czy styl się rzeczywiście zmienił
-                    if style != old_style:
-                        frontal_area = style_to_frontal_area(style)
-                        setattr(data_obj, "flight_frontal_area", frontal_area)
-                        setattr(data_obj, "flight_style", style)
-
+                    style_changed = style != old_style
+                    data_obj.flight_frontal_area = style_to_frontal_area(style)
+                    data_obj.flight_style = style
+                    if style_changed:
                         # Aplikuj dodatkowe efekty stylu na inne parametry
                         apply_style_physics(data_obj, style)
-                    else:
-                        # Jeśli styl się nie zmienił, tylko zaktualizuj flight_frontal_area
-                        frontal_area = style_to_frontal_area(style)
-                        setattr(data_obj, "flight_frontal_area", frontal_area)
-                        setattr(data_obj, "flight_style", style)
-                elif attr == "flight_resistance":
-                    # Konwertuj wartość slidera na flight_drag_coefficient
-                    slider_value = widget.value()
-                    drag_coefficient = slider_to_drag_coefficient_flight(slider_value)
-                    setattr(data_obj, "flight_drag_coefficient", drag_coefficient)
-                elif attr == "telemark":
-                    # Zapisz wartość telemark bezpośrednio (nie fizyczna)
-                    slider_value = widget.value()
-                    setattr(data_obj, "telemark", slider_value)
-                elif attr == "stability":
-                    # Zapisz wartość stabilności bezpośrednio (nie fizyczna)
-                    slider_value = widget.value()
-                    setattr(data_obj, "stability", slider_value)
-
-                elif isinstance(widget, QLineEdit):
-                    new_value = widget.text()
-                    setattr(data_obj, attr, new_value)
-                elif isinstance(widget, QComboBox):
-                    new_value = widget.currentText()
-                    setattr(data_obj, attr, new_value)
-                elif isinstance(widget, QDoubleSpinBox):
-                    new_value = widget.value()
-                    setattr(data_obj, attr, new_value)
-                elif isinstance(widget, QSpinBox):
-                    new_value = widget.value()
-                    setattr(data_obj, attr, new_value)
+                elif kind == "line":
+                    setattr(data_obj, attr, widget.text())
+                elif kind == "combo":
+                    setattr(data_obj, attr, widget.currentText())
+                elif kind in ("spin", "double"):
+                    setattr(data_obj, attr, widget.value())
             except Exception as e:
                 print(f"Nie udało się zapisać atrybutu '{attr}': {e}")
 
         if isinstance(data_obj, Hill):
             data_obj.recalculate_derived_attributes()
+        data_obj.mark_modified()
+        # Stare wersje nie będą już odpytywane – zwolnij zapamiętane skany belek
+        _gate_scan_cache.clear()
 
-        current_item.setText(str(data_obj))
-        if hasattr(data_obj, "country"):
-            current_item.setIcon(self.create_rounded_flag_icon(data_obj.country))
-        elif hasattr(data_obj, "nationality"):
-            current_item.setIcon(self.create_rounded_flag_icon(data_obj.nationality))
-
-        self._refresh_all_data_widgets()
+        # Nazwa i flaga na liście edytora odświeżają się razem z resztą widoków
+        if isinstance(data_obj, Hill):
+            self._refresh_hill_widgets()
+        else:
+            self._refresh_jumper_widgets()
 
         QMessageBox.information(
             self,
@@ -2160,6 +2314,7 @@ class MainWindow(QMainWindow):
             f"Zmiany dla '{str(data_obj)}' zostały zastosowane w aplikacji.",
         )
 
+    @pyqtSlot()
     def _save_data_to_json(self):
         self.play_sound()
         data_dir = resource_path("data")
@@ -2173,12 +2328,10 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            data_to_save = {
-                "hills": [h.to_dict() for h in self.all_hills],
-                "jumpers": [j.to_dict() for j in self.all_jumpers],
-            }
-            with open(filePath, "w", encoding="utf-8") as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=4)
+            # Błąd w trakcie zapisu nie zostawi uciętego pliku danych
+            _write_data_json(
+                filePath, (("hills", self.all_hills), ("jumpers", self.all_jumpers))
+            )
 
             QMessageBox.information(
                 self, "Sukces", f"Dane zostały pomyślnie zapisane do pliku:\n{filePath}"
@@ -2190,10 +2343,40 @@ class MainWindow(QMainWindow):
             )
 
     def _refresh_all_data_widgets(self):
+        self._refresh_jumper_widgets()
+        self._refresh_hill_widgets()
+
+    def _refresh_jumper_widgets(self):
+        """Przebudowuje widoki zawodników; listy skoczni zostają nietknięte."""
+        # Dane mogły się zmienić – zapamiętane kolejności sortowania są nieaktualne
+        self._sort_orders.pop(("jumpers", False), None)
+        self._sort_orders.pop(("jumpers", True), None)
+        self._jumper_index = None
         sel_jumper_text = ""
         if self.jumper_combo.currentIndex() > -1:
             sel_jumper_text = self.jumper_combo.currentText()
 
+        # Nazwy liczone raz przy sortowaniu i używane ponownie we wszystkich listach
+        jumper_names = sort_by_name(self.all_jumpers)
+        jumper_codes = [jumper.nationality for jumper in self.all_jumpers]
+        self._fill_flag_combo(
+            self.jumper_combo, "Wybierz zawodnika", jumper_names, jumper_codes
+        )
+
+        self._jumper_model.set_jumpers(self.all_jumpers)
+        self._sort_jumper_list(self.sort_combo.currentText())
+
+        self.jumper_combo.setCurrentText(sel_jumper_text)
+
+        # Edytor budowany leniwie – przy pierwszym wejściu wczyta aktualne dane
+        if hasattr(self, "editor_jumper_list"):
+            self._repopulate_editor_lists(("jumpers",))
+
+    def _refresh_hill_widgets(self):
+        """Przebudowuje widoki skoczni; listy zawodników zostają nietknięte."""
+        self._sort_orders.pop(("hills", False), None)
+        self._sort_orders.pop(("hills", True), None)
+        self._hill_index = None
         sel_hill_text = ""
         if self.hill_combo.currentIndex() > -1:
             sel_hill_text = self.hill_combo.currentText()
@@ -2202,46 +2385,37 @@ class MainWindow(QMainWindow):
         if self.comp_hill_combo.currentIndex() > -1:
             sel_comp_hill_text = self.comp_hill_combo.currentText()
 
-        self.all_jumpers.sort(key=lambda jumper: str(jumper))
-        self.all_hills.sort(key=lambda hill: str(hill))
-
-        self.jumper_combo.clear()
-        self.jumper_combo.addItem("Wybierz zawodnika")
-        for jumper in self.all_jumpers:
-            self.jumper_combo.addItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
-
-        self.hill_combo.clear()
-        self.hill_combo.addItem("Wybierz skocznię")
-        for hill in self.all_hills:
-            self.hill_combo.addItem(
-                self.create_rounded_flag_icon(hill.country), str(hill)
-            )
-
-        self.comp_hill_combo.clear()
-        self.comp_hill_combo.addItem("Wybierz skocznię")
-        for hill in self.all_hills:
-            self.comp_hill_combo.addItem(
-                self.create_rounded_flag_icon(hill.country), str(hill)
-            )
-
-        self.jumper_list_widget.clear()
-        for jumper in self.all_jumpers:
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Unchecked)
-            item.setData(Qt.UserRole, jumper)
-            self.jumper_list_widget.addItem(item)
-        self._sort_jumper_list(self.sort_combo.currentText())
+        hill_names = sort_by_name(self.all_hills)
+        hill_codes = [hill.country for hill in self.all_hills]
+        self._fill_flag_combo(
+            self.hill_combo, "Wybierz skocznię", hill_names, hill_codes
+        )
+        self._fill_flag_combo(
+            self.comp_hill_combo, "Wybierz skocznię", hill_names, hill_codes
+        )
 
-        self.jumper_combo.setCurrentText(sel_jumper_text)
         self.hill_combo.setCurrentText(sel_hill_text)
         self.comp_hill_combo.setCurrentText(sel_comp_hill_text)
 
-        self._repopulate_editor_lists()
+        if hasattr(self, "editor_hill_list"):
+            self._repopulate_editor_lists(("hills",))
+
+    def _fill_flag_combo(self, combo, placeholder, names, country_codes):
+        """
+        Wypełnia combobox jednym wstawieniem wszystkich nazw, a potem dokłada flagi.
+
+        Sygnały comba nie są blokowane – zmiana bieżącego indeksu przy czyszczeniu
+        ma nadal aktualizować zaznaczenie (np. po usunięciu zawodnika).
+        """
+        combo.setUpdatesEnabled(False)
+        try:
+            combo.clear()
+            combo.addItem(placeholder)
+            combo.addItems(names)
+            for index, code in enumerate(country_codes, start=1):
+                combo.setItemIcon(index, self.create_rounded_flag_icon(code))
+        finally:
+            combo.setUpdatesEnabled(True)
 
     def _create_jump_replay_page(self):
         widget = QWidget()
@@ -2280,10 +2454,8 @@ class MainWindow(QMainWindow):
         self.replay_stats_label.setMaximumHeight(26)
         layout.addWidget(self.replay_stats_label)
 
-        self.replay_figure = Figure(facecolor="#0f1115")
-        self.replay_canvas = FigureCanvas(self.replay_figure)
-        self.replay_canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        layout.addWidget(self.replay_canvas)
+        self.replay_view = TrajectoryView()
+        layout.addWidget(self.replay_view)
 
         # Placeholder na chip timingu (tworzony dynamicznie w _show_jump_replay)
         self.replay_timing_chip = None
@@ -2363,9 +2535,8 @@ class MainWindow(QMainWindow):
         # Prawa kolumna - Animacja trajektorii w tle
         animation_panel = QVBoxLayout()
 
-        self.points_figure = Figure(facecolor="#0f1115")
-        self.points_canvas = FigureCanvas(self.points_figure)
-        animation_panel.addWidget(self.points_canvas)
+        self.points_view = TrajectoryView()
+        animation_panel.addWidget(self.points_view)
 
         main_hbox.addLayout(animation_panel, 2)
         layout.addLayout(main_hbox)
@@ -2380,35 +2551,18 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(self._create_top_bar("Historia zawodów", self.MAIN_MENU_IDX))
 
-        # Tabela historii zawodów
-        table = QTableWidget()
-        table.setColumnCount(7)
-        table.setHorizontalHeaderLabels(
-            [
-                "ID",
-                "Nazwa",
-                "Skocznia",
-                "K",
-                "Data",
-                "Typ",
-                "Akcje",
-            ]
-        )
+        # Tabela historii zawodów – widok nad modelem wierszy z bazy
+        self._history_model = HistoryTableModel(self)
+        self._history_model.name_edited.connect(self._on_history_name_edited)
+        table = QTableView()
+        table.setModel(self._history_model)
 
         # Ustaw szerokości kolumn
-        table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.Fixed
-        )  # ID - wąska
-        table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.Stretch
-        )  # Nazwa - rozciąga się, aby wypełnić pozostałą przestrzeń
-        table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.Fixed
-        )  # Skocznia - wąska, tylko dla nazw jak "Garmisch-Partenkirchen"
-        table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Fixed)  # K
-        table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)  # Data
-        table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Fixed)  # Typ
-        table.horizontalHeader().setSectionResizeMode(6, QHeaderView.Fixed)  # Akcje
+        # ID, Skocznia, K, Data, Typ i Akcje mają stałą szerokość
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        # Nazwa - rozciąga się, aby wypełnić pozostałą przestrzeń
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
 
         # Ustaw szerokości kolumn (tylko dla kolumn z Fixed mode)
         table.setColumnWidth(0, 50)  # ID - wąska
@@ -2420,23 +2574,33 @@ class MainWindow(QMainWindow):
         table.setColumnWidth(5, 100)  # Typ
         table.setColumnWidth(6, 160)  # Akcje - szersza dla przycisków z tekstem
 
-        # Ustaw wysokość wierszy
+        # Ustaw wysokość wierszy – stała, więc widok nie mierzy każdego wiersza
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         table.verticalHeader().setDefaultSectionSize(
             50
         )  # Znacznie większa wysokość dla przycisków
+        table.verticalHeader().setVisible(False)
 
-        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setSelectionBehavior(QTableView.SelectRows)
         table.setEditTriggers(
-            QTableWidget.DoubleClicked
+            QTableView.DoubleClicked
         )  # Włącz edycję przez podwójne kliknięcie
-        table.itemChanged.connect(self._on_history_item_changed)  # Obsługa zmiany nazwy
         self.history_table = table
 
         refresh_btn = QPushButton("Odśwież")
         refresh_btn.setProperty("variant", "primary")
         refresh_btn.clicked.connect(self._refresh_history_table)
 
-        layout.addWidget(refresh_btn, 0, Qt.AlignLeft)
+        # Wskaźnik ładowania widoczny, gdy worker czyta bazę historii
+        self.history_status_label = QLabel()
+        self.history_status_label.setVisible(False)
+
+        refresh_row = QHBoxLayout()
+        refresh_row.addWidget(refresh_btn)
+        refresh_row.addWidget(self.history_status_label)
+        refresh_row.addStretch()
+
+        layout.addLayout(refresh_row)
         layout.addWidget(table, 1)
 
         self.central_widget.addWidget(widget)
@@ -2448,145 +2612,107 @@ class MainWindow(QMainWindow):
 
         # Usunięto kliknięcie na wiersz - wyniki dostępne tylko przez przycisk
 
+    @pyqtSlot()
     def _refresh_history_table(self):
+        """Zleca wczytanie listy zawodów workerowi; tabelę wypełnia slot."""
+        self.history_status_label.setText("Wczytywanie historii...")
+        self.history_status_label.setVisible(True)
+
+        # Wynik starszego, wciąż działającego workera zostanie pominięty
+        worker = HistoryListWorker(self)
+        worker.loaded.connect(self._on_history_rows_loaded)
+        worker.finished.connect(self._on_history_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._history_list_worker = worker
+        worker.start()
+
+    @pyqtSlot(list)
+    def _on_history_rows_loaded(self, rows):
+        if self.sender() is not self._history_list_worker:
+            return
         try:
-            from utils.history_store import list_competitions as _list
-
-            rows = _list(limit=200, offset=0)
-            self.history_table.setRowCount(len(rows))
-            for i, r in enumerate(rows):
-                mode = r.get("mode", "")
-                if "qualification" in mode.lower():
-                    comp_type = "Kwalifikacje"
-                elif "competition" in mode.lower():
-                    comp_type = "Konkurs"
-                else:
-                    comp_type = mode or "Nieznany"
-                # Format date - remove T and replace with space
-                created_at = r.get("created_at", "")
-                if "T" in created_at:
-                    created_at = created_at.replace("T", " ")
-
-                values = [
-                    str(r.get("id", "")),
-                    r.get("name", ""),
-                    r.get("hill_name", ""),
-                    f"{float(r.get('k_point') or 0):.0f}",
-                    created_at,
-                    comp_type,
-                ]
-                for col, val in enumerate(values):
-                    item = QTableWidgetItem(val)
-                    item.setTextAlignment(Qt.AlignCenter)
-
-                    # Włącz edycję tylko dla kolumny "Nazwa" (kolumna 1)
-                    if col == 1:  # Kolumna "Nazwa"
-                        item.setFlags(item.flags() | Qt.ItemIsEditable)
-                    else:
-                        item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                    self.history_table.setItem(i, col, item)
-
-                # Dodaj przyciski akcji w ostatniej kolumnie
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(
-                    4, 4, 4, 12
-                )  # Jeszcze wyżej (mniej góra, więcej dół)
-                actions_layout.setSpacing(6)
-
-                # Przycisk "Pokaż wyniki"
-                show_results_btn = QPushButton("Wyniki")
-                show_results_btn.setProperty("variant", "primary")
-                show_results_btn.setStyleSheet("""
-                    QPushButton {
-                        font-size: 12px;
-                        font-weight: 600;
-                        border-radius: 6px;
-                        padding: 4px 6px;
-                        min-height: 26px;
-                        max-height: 26px;
-                        border: 1px solid #3b82f6;
-                        background-color: #3b82f6;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #2563eb;
-                        border-color: #2563eb;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1d4ed8;
-                        border-color: #1d4ed8;
-                    }
-                """)
-                show_results_btn.setToolTip("Pokaż wyniki")
-                show_results_btn.clicked.connect(
-                    lambda checked, row_idx=i: [
-                        self.play_sound(),
-                        self._show_history_results(row_idx),
-                    ]
-                )
+            model = self._history_model
+            table = self.history_table
+            # Przyciski akcji wstawiane przy wyłączonym odświeżaniu – jeden układ
+            # i jedno malowanie po wypełnieniu całej tabeli
+            table.setUpdatesEnabled(False)
+            try:
+                model.set_rows(rows)
+                for i in range(len(rows)):
+                    # Dodaj przyciski akcji w ostatniej kolumnie
+                    table.setIndexWidget(
+                        model.index(i, model.ACTIONS_COLUMN),
+                        self._create_history_actions(i),
+                    )
+            finally:
+                table.setUpdatesEnabled(True)
+        except Exception:
+            pass
 
-                # Przycisk "Usuń"
-                delete_btn = QPushButton("Usuń")
-                delete_btn.setProperty("variant", "danger")
-                delete_btn.setStyleSheet("""
-                    QPushButton {
-                        font-size: 12px;
-                        font-weight: 600;
-                        border-radius: 6px;
-                        padding: 4px 6px;
-                        min-height: 26px;
-                        max-height: 26px;
-                        border: 1px solid #ef4444;
-                        background-color: #ef4444;
-                        color: white;
-                    }
-                    QPushButton:hover {
-                        background-color: #dc2626;
-                        border-color: #dc2626;
-                    }
-                    QPushButton:pressed {
-                        background-color: #b91c1c;
-                        border-color: #b91c1c;
-                    }
-                """)
-                delete_btn.setToolTip("Usuń rekord")
-                delete_btn.clicked.connect(
-                    lambda checked, row_idx=i: [
-                        self.play_sound(),
-                        self._delete_history_record(row_idx),
-                    ]
-                )
+    @pyqtSlot()
+    def _on_history_worker_finished(self):
+        # Wskaźnik znika dopiero, gdy żaden aktualny odczyt historii nie trwa
+        sender = self.sender()
+        pending = False
+        for name in ("_history_list_worker", "_history_detail_worker"):
+            worker = getattr(self, name, None)
+            if worker is sender:
+                setattr(self, name, None)
+            elif worker is not None:
+                pending = True
+        if not pending:
+            self.history_status_label.setVisible(False)
+
+    def _create_history_actions(self, row):
+        """Przyciski "Wyniki" i "Usuń" dla wiersza tabeli historii."""
+        actions_widget = QWidget()
+        actions_layout = QHBoxLayout(actions_widget)
+        actions_layout.setContentsMargins(
+            4, 4, 4, 12
+        )  # Jeszcze wyżej (mniej góra, więcej dół)
+        actions_layout.setSpacing(6)
+
+        # Przycisk "Pokaż wyniki"
+        show_results_btn = QPushButton("Wyniki")
+        show_results_btn.setProperty("variant", "primary")
+        # Styl przycisków akcji w globalnym QSS (bez parsowania CSS per wiersz)
+        show_results_btn.setProperty("class", "historyAction")
+        show_results_btn.setToolTip("Pokaż wyniki")
+        show_results_btn.clicked.connect(
+            lambda checked, row_idx=row: [
+                self.play_sound(),
+                self._show_history_results(row_idx),
+            ]
+        )
 
-                actions_layout.addWidget(show_results_btn, 1)
-                actions_layout.addWidget(delete_btn, 1)
+        # Przycisk "Usuń"
+        delete_btn = QPushButton("Usuń")
+        delete_btn.setProperty("variant", "danger")
+        delete_btn.setProperty("class", "historyAction")
+        delete_btn.setToolTip("Usuń rekord")
+        delete_btn.clicked.connect(
+            lambda checked, row_idx=row: [
+                self.play_sound(),
+                self._delete_history_record(row_idx),
+            ]
+        )
 
-                self.history_table.setCellWidget(i, 6, actions_widget)
-        except Exception:
-            pass
+        actions_layout.addWidget(show_results_btn, 1)
+        actions_layout.addWidget(delete_btn, 1)
+        return actions_widget
 
     def _show_history_results(self, row_idx: int):
         """Pokazuje szczegółowe wyniki dla wybranego rekordu historii"""
-        comp_id_item = self.history_table.item(row_idx, 0)
-        if not comp_id_item:
-            return
-        try:
-            comp_id = int(comp_id_item.text())
-        except Exception:
+        comp_id = self._history_model.competition_id(row_idx)
+        if comp_id is None:
             return
 
-        # Użyj istniejącej funkcji _open_history_detail
-        self._open_history_detail(comp_id_item)
+        self._open_history_detail(comp_id)
 
     def _delete_history_record(self, row_idx: int):
         """Usuwa rekord z historii"""
-        comp_id_item = self.history_table.item(row_idx, 0)
-        if not comp_id_item:
-            return
-        try:
-            comp_id = int(comp_id_item.text())
-        except Exception:
+        comp_id = self._history_model.competition_id(row_idx)
+        if comp_id is None:
             return
 
         # Potwierdzenie usunięcia
@@ -2615,280 +2741,179 @@ class MainWindow(QMainWindow):
                     self, "Błąd", f"Wystąpił błąd podczas usuwania: {str(e)}"
                 )
 
-    def _on_history_item_changed(self, item: QTableWidgetItem):
+    @pyqtSlot(int, str)
+    def _on_history_name_edited(self, comp_id: int, new_name: str):
         """Obsługuje zmianę nazwy zawodów w tabeli historii"""
-        if item.column() == 1:  # Kolumna "Nazwa"
-            try:
-                comp_id = int(self.history_table.item(item.row(), 0).text())
-                new_name = item.text().strip()
-
-                if new_name:  # Sprawdź czy nazwa nie jest pusta
-                    from utils.history_store import update_competition_name
+        try:
+            if new_name:  # Sprawdź czy nazwa nie jest pusta
+                from utils.history_store import update_competition_name
 
-                    if update_competition_name(comp_id, new_name):
-                        # Odtwórz dźwięk sukcesu
-                        self.play_sound()
-                    else:
-                        # Przywróć poprzednią nazwę
-                        QMessageBox.warning(
-                            self, "Błąd", "Nie udało się zaktualizować nazwy zawodów."
-                        )
-                        # Odśwież tabelę aby przywrócić poprzednią nazwę
-                        self._refresh_history_table()
+                if update_competition_name(comp_id, new_name):
+                    # Odtwórz dźwięk sukcesu
+                    self.play_sound()
                 else:
-                    # Przywróć poprzednią nazwę jeśli nowa jest pusta
+                    # Przywróć poprzednią nazwę
                     QMessageBox.warning(
-                        self, "Błąd", "Nazwa zawodów nie może być pusta."
+                        self, "Błąd", "Nie udało się zaktualizować nazwy zawodów."
                     )
+                    # Odśwież tabelę aby przywrócić poprzednią nazwę
                     self._refresh_history_table()
-            except Exception as e:
-                QMessageBox.critical(
-                    self, "Błąd", f"Wystąpił błąd podczas aktualizacji nazwy: {str(e)}"
+            else:
+                # Przywróć poprzednią nazwę jeśli nowa jest pusta
+                QMessageBox.warning(
+                    self, "Błąd", "Nazwa zawodów nie może być pusta."
                 )
                 self._refresh_history_table()
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Błąd", f"Wystąpił błąd podczas aktualizacji nazwy: {str(e)}"
+            )
+            self._refresh_history_table()
 
-    def _open_history_detail(self, item: QTableWidgetItem):  # noqa: N802 - Qt slot
-        row = item.row()
-        comp_id_item = self.history_table.item(row, 0)
-        if not comp_id_item:
-            return
-        try:
-            comp_id = int(comp_id_item.text())
-        except Exception:
-            return
-        try:
-            from utils.history_store import get_competition_detail as _detail
-
-            data = _detail(comp_id)
-        except Exception:
+    def _open_history_detail(self, comp_id: int):
+        """Zleca wczytanie wyników workerowi; stronę pokazuje slot po odczycie."""
+        self.history_status_label.setText("Wczytywanie wyników...")
+        self.history_status_label.setVisible(True)
+
+        worker = HistoryDetailWorker(comp_id, self)
+        worker.loaded.connect(self._on_history_detail_loaded)
+        worker.finished.connect(self._on_history_worker_finished)
+        worker.finished.connect(worker.deleteLater)
+        self._history_detail_worker = worker
+        worker.start()
+
+    @pyqtSlot(int, dict)
+    def _on_history_detail_loaded(self, comp_id: int, data: dict):
+        # Liczy się tylko ostatnio kliknięty rekord
+        if self.sender() is not self._history_detail_worker:
             return
 
-        if not data:
-            return
-
-        # Build a simple detail page similar to competition results
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        layout.setSpacing(10)
-        layout.setContentsMargins(15, 8, 15, 15)
+        # Strona szczegółów budowana jest raz; kolejne otwarcia podmieniają model
+        if not hasattr(self, "_history_detail_widget"):
+            self._create_history_detail_page()
 
         # Determine competition type
         comp_mode = data["competition"].get("mode", "")
         is_qualification = "qualification" in comp_mode.lower()
         type_label = "Kwalifikacje" if is_qualification else "Konkurs"
-        title = QLabel(f"Wyniki: {type_label}")
-        title.setProperty("class", "headerLabel")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addLayout(self._create_top_bar("Historia: wyniki", self.HISTORY_IDX))
-        layout.addWidget(title)
+        self._history_detail_title.setText(f"Wyniki: {type_label}")
 
-        # Determine competition type
-        comp_mode = data["competition"].get("mode", "")
-        is_qualification = "qualification" in comp_mode.lower()
-
-        table = QTableWidget()
-        if is_qualification:
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                [
-                    "Miejsce",
-                    "Flaga",
-                    "Zawodnik",
-                    "Dystans",
-                    "Punkty",
-                ]
-            )
-        else:
-            table.setColumnCount(8)
-            table.setHorizontalHeaderLabels(
-                [
-                    "Miejsce",
-                    "Flaga",
-                    "Zawodnik",
-                    "I seria",
-                    "I seria (pkt)",
-                    "II seria",
-                    "II seria (pkt)",
-                    "Suma (pkt)",
-                ]
+        # Reconstruct per-jumper aggregates
+        # Skoki dzielone są na serie raz; każda seria zapisuje tylko swoje klucze
+        jumps_by_round = {}
+        for r in data.get("rounds", []):
+            jumps_by_round.setdefault(int(r.get("round_index") or 0), []).append(
+                r.get("jumps", [])
             )
-        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
 
-        # Reconstruct per-jumper aggregates
         results_map = {}
-        rounds = data.get("rounds", [])
-
-        for r in rounds:
-            ri = int(r.get("round_index") or 0)
-            for j in r.get("jumps", []):
+        results_map_get = results_map.get
+        template = _HISTORY_RESULT_TEMPLATE
+        for ri, d_key, p_key, judges_key, timing_key in _HISTORY_ROUND_KEYS:
+            for j in chain.from_iterable(jumps_by_round.get(ri, ())):
                 key = (
                     j.get("name", ""),
                     j.get("last_name", ""),
                     j.get("country_code", ""),
                 )
-                if key not in results_map:
-                    results_map[key] = {
+                entry = results_map_get(key)
+                if entry is None:
+                    entry = results_map[key] = {
+                        **template,
                         "name": key[0],
                         "last": key[1],
                         "country": key[2],
-                        "d1": 0.0,
-                        "p1": 0.0,
-                        "d2": 0.0,
-                        "p2": 0.0,
-                        "judges1": None,
-                        "judges2": None,
-                        "timing1": None,
-                        "timing2": None,
                     }
-                entry = results_map[key]
-                distance = float(j.get("distance") or 0.0)
-                total_points = float(j.get("total_points") or 0.0)
-                notes = j.get("notes_json")  # To są dane judge (noty sędziowskie)
-                timing = j.get("timing_json")
-
-                if ri == 1:
-                    entry["d1"] = distance
-                    entry["p1"] = total_points
-                    entry["judges1"] = notes  # Dane judge są już sparsowane z JSON
-                    entry["timing1"] = timing
-                    print(f"DEBUG: Przypisano judges1 dla {entry['name']}: {notes}")
-
-                elif ri == 2:
-                    entry["d2"] = distance
-                    entry["p2"] = total_points
-                    entry["judges2"] = notes  # Dane judge są już sparsowane z JSON
-                    entry["timing2"] = timing
-                    print(f"DEBUG: Przypisano judges2 dla {entry['name']}: {notes}")
+                entry[d_key] = float(j.get("distance") or 0.0)
+                entry[p_key] = float(j.get("total_points") or 0.0)
+                # Noty sędziowskie – dane judge są już sparsowane z JSON
+                entry[judges_key] = j.get("notes_json")
+                entry[timing_key] = j.get("timing_json")
 
         results = list(results_map.values())
         # Sort like competition: by p1 in round 1; by p1+p2 in round 2 or final
+        # Każdy wpis ma p1/p2 z _HISTORY_RESULT_TEMPLATE – klucze bez .get()
         if is_qualification:
             # For qualification, sort by points (only one round)
-            results.sort(key=lambda x: x.get("p1", 0), reverse=True)
-        elif any(e.get("d2", 0) > 0 for e in results):
-            results.sort(key=lambda x: (x.get("p1", 0) + x.get("p2", 0)), reverse=True)
+            results.sort(key=itemgetter("p1"), reverse=True)
+        elif any(e["d2"] > 0 for e in results):
+            results.sort(key=lambda x: x["p1"] + x["p2"], reverse=True)
         else:
-            results.sort(key=lambda x: x.get("p1", 0), reverse=True)
-
-        table.setRowCount(len(results))
-        # k_point can be used for derived metrics if needed in the future
-        for i, res in enumerate(results):
-            place_item = QTableWidgetItem(str(i + 1))
-            place_item.setTextAlignment(Qt.AlignCenter)
-            table.setItem(i, 0, place_item)
-
-            # Flag
-            flag_container = QWidget()
-            flag_layout = QHBoxLayout(flag_container)
-            flag_layout.setContentsMargins(0, 0, 0, 0)
-            flag_layout.setSpacing(0)
-            flag_label = QLabel()
-            pix = self._create_rounded_flag_pixmap(
-                res["country"], size=QSize(24, 16), radius=4
-            )
-            if not pix.isNull():
-                flag_label.setPixmap(pix)
-            flag_label.setAlignment(Qt.AlignCenter)
-            flag_layout.addStretch(1)
-            flag_layout.addWidget(flag_label, 0, Qt.AlignCenter)
-            flag_layout.addStretch(1)
-            table.setCellWidget(i, 1, flag_container)
-
-            # Name
-            name_item = QTableWidgetItem(f"{res['name']} {res['last']}")
-            f = name_item.font()
-            f.setBold(True)
-            name_item.setFont(f)
-            # Wyłącz edycję dla nazwy zawodnika
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(i, 2, name_item)
-
-            def _set_cell(col, text):
-                it = QTableWidgetItem(text)
-                it.setTextAlignment(Qt.AlignCenter)
-                # Wyłącz edycję dla wszystkich kolumn z punktami i odległościami
-                it.setFlags(it.flags() & ~Qt.ItemIsEditable)
-                table.setItem(i, col, it)
-
-            if is_qualification:
-                # Qualification: single round
-                d1 = res.get("d1", 0.0)
-                p1 = res.get("p1", 0.0)
-                _set_cell(3, f"{d1:.1f} m" if d1 > 0 else "-")
-                _set_cell(4, f"{p1:.1f}" if p1 > 0 else "-")
-            else:
-                # Competition: two rounds
-                d1 = res.get("d1", 0.0)
-                p1 = res.get("p1", 0.0)
-                d2 = res.get("d2", 0.0)
-                p2 = res.get("p2", 0.0)
-                _set_cell(3, f"{d1:.1f} m" if d1 > 0 else "-")
-                _set_cell(4, f"{p1:.1f}" if p1 > 0 else "-")
-                _set_cell(5, f"{d2:.1f} m" if d2 > 0 else "-")
-                _set_cell(6, f"{p2:.1f}" if p2 > 0 else "-")
-                total = (p1 + p2) if (p1 or p2) else 0.0
-                _set_cell(7, f"{total:.1f}" if total > 0 else "-")
+            results.sort(key=itemgetter("p1"), reverse=True)
 
-        layout.addWidget(table)
+        self._history_detail_model.set_results(results, is_qualification)
 
         # Store context for click handling
-        self.history_detail_table = table
-        table.setObjectName("history_detail_table")  # Set object name for navigation
         self._history_detail_is_qualification = is_qualification
         self._history_detail_results = results
         self._history_detail_hill_name = data["competition"].get("hill_name", "")
         self._history_detail_gate = getattr(self, "competition_gate", None)
         # Zapisz ID konkursu w kontekście
         self._current_history_competition_id = data["competition"].get("id")
-        print(f"DEBUG: Łączę itemClicked z _on_history_detail_cell_clicked")
-        print(f"DEBUG: Liczba wyników: {len(results)}")
-        print(f"DEBUG: Czy to kwalifikacje: {is_qualification}")
-        print(f"DEBUG: ID konkursu: {self._current_history_competition_id}")
 
-        # Usuń wszystkie istniejące połączenia
-        try:
-            self.history_detail_table.itemClicked.disconnect()
-        except:
-            pass
+        # Navigate to this detail page
+        self.central_widget.setCurrentWidget(self._history_detail_widget)
+
+    def _create_history_detail_page(self):
+        """Tworzy (jednorazowo) stronę szczegółów wyników z historii."""
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setSpacing(10)
+        layout.setContentsMargins(15, 8, 15, 15)
+
+        title = QLabel()
+        title.setProperty("class", "headerLabel")
+        title.setAlignment(Qt.AlignCenter)
+        layout.addLayout(self._create_top_bar("Historia: wyniki", self.HISTORY_IDX))
+        layout.addWidget(title)
 
-        self.history_detail_table.itemClicked.connect(
-            self._on_history_detail_cell_clicked
+        # Komórki formatowane przez model dopiero przy rysowaniu widocznych wierszy
+        table = QTableView()
+        model = HistoryDetailModel(
+            [],
+            False,
+            lambda code: self._create_rounded_flag_pixmap(code, QSize(24, 16), 4),
+            table,
         )
+        table.setModel(model)
+        table.setItemDelegateForColumn(
+            HistoryDetailModel.FLAG_COLUMN, CenteredIconDelegate(table)
+        )
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Stała wysokość wierszy jak w tabeli wyników zawodów
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(34)
+        table.verticalHeader().setVisible(False)
+        table.setObjectName("history_detail_table")  # Set object name for navigation
+        layout.addWidget(table)
 
-        # Dodaj prosty test - sprawdź czy itemClicked działa
-        def test_click(item):
-            print(f"DEBUG: TEST CLICK - row: {item.row()}, col: {item.column()}")
-            # Sprawdź czy dane są dostępne
-            if item.row() < len(results):
-                res = results[item.row()]
-                print(f"DEBUG: Dane dla wiersza {item.row()}: {res}")
-
-        self.history_detail_table.itemClicked.connect(test_click)
+        table.clicked.connect(self._on_history_detail_cell_clicked)
 
-        # Navigate to this detail page
+        self.history_detail_table = table
+        self._history_detail_model = model
+        self._history_detail_title = title
+        self._history_detail_widget = widget
         self.central_widget.addWidget(widget)
         self._history_detail_widget_index = self.central_widget.count() - 1
-        self.central_widget.setCurrentWidget(widget)
 
-    def _on_history_detail_cell_clicked(self, item: QTableWidgetItem):
+    @pyqtSlot(QModelIndex)
+    def _on_history_detail_cell_clicked(self, index: QModelIndex):
         print(
-            f"DEBUG: _on_history_detail_cell_clicked wywołane! row: {item.row()}, col: {item.column()}"
+            f"DEBUG: _on_history_detail_cell_clicked wywołane! row: {index.row()}, col: {index.column()}"
         )
         try:
-            row = item.row()
-            col = item.column()
+            row = index.row()
+            col = index.column()
             results = getattr(self, "_history_detail_results", [])
             if row < 0 or row >= len(results):
                 return
             res = results[row]
             print(f"DEBUG: res: {res}")
-            # Resolve hill by name
-            hill_name = getattr(self, "_history_detail_hill_name", "")
-            hill = next(
-                (h for h in self.all_hills if getattr(h, "name", None) == hill_name),
-                None,
+            jumper = self._history_jumper(res)
+            # Indeks nazw jest odświeżany razem z listami skoczni – bez starych obiektów
+            hill = self._hill_by_name(self._history_detail_hill_name) or getattr(
+                self, "competition_hill", None
             )
-            hill = hill or getattr(self, "competition_hill", None)
             if hill is None:
                 return
             gate = (
@@ -2901,18 +2926,6 @@ class MainWindow(QMainWindow):
                 # distance in col 3, points in col 4
                 if col == 3 and res.get("d1", 0) > 0:
                     # replay
-                    # Find a representative jumper-like object: we only have name/last, so use matching from all_jumpers if possible
-                    jumper = next(
-                        (
-                            j
-                            for j in self.all_jumpers
-                            if j.name == res["name"] and j.last_name == res["last"]
-                        ),
-                        None,
-                    )
-                    jumper = jumper or Jumper(
-                        res["name"], res["last"], nationality=res.get("country")
-                    )
                     self._show_jump_replay(
                         jumper,
                         hill,
@@ -2972,17 +2985,6 @@ class MainWindow(QMainWindow):
                         except Exception as e:
                             print(f"DEBUG: Błąd pobierania danych judge: {e}")
 
-                    jumper = next(
-                        (
-                            j
-                            for j in self.all_jumpers
-                            if j.name == res["name"] and j.last_name == res["last"]
-                        ),
-                        None,
-                    )
-                    jumper = jumper or Jumper(
-                        res["name"], res["last"], nationality=res.get("country")
-                    )
                     self._show_points_breakdown(
                         jumper, distance, points, "Q", judge, from_history=True
                     )
@@ -2990,17 +2992,6 @@ class MainWindow(QMainWindow):
 
             # Competition: series 1 (cols 3,4), series 2 (cols 5,6)
             if col in (3, 4) and (res.get("d1", 0) > 0 or res.get("p1", 0) > 0):
-                jumper = next(
-                    (
-                        j
-                        for j in self.all_jumpers
-                        if j.name == res["name"] and j.last_name == res["last"]
-                    ),
-                    None,
-                )
-                jumper = jumper or Jumper(
-                    res["name"], res["last"], nationality=res.get("country")
-                )
                 if col == 3 and res.get("d1", 0) > 0:
                     self._show_jump_replay(
                         jumper,
@@ -3021,17 +3012,6 @@ class MainWindow(QMainWindow):
                         from_history=True,
                     )
             elif col in (5, 6) and (res.get("d2", 0) > 0 or res.get("p2", 0) > 0):
-                jumper = next(
-                    (
-                        j
-                        for j in self.all_jumpers
-                        if j.name == res["name"] and j.last_name == res["last"]
-                    ),
-                    None,
-                )
-                jumper = jumper or Jumper(
-                    res["name"], res["last"], nationality=res.get("country")
-                )
                 if col == 5 and res.get("d2", 0) > 0:
                     self._show_jump_replay(
                         jumper,
@@ -3085,25 +3065,7 @@ class MainWindow(QMainWindow):
                     print(
                         f"DEBUG: Wywołuję _show_total_points_breakdown z historii, total_points: {total_points}"
                     )
-                    # Znajdź skocznię po nazwie z historii
-                    hill_name = getattr(self, "_history_detail_hill_name", "")
-                    hill = next(
-                        (h for h in self.all_hills if h.name == hill_name), None
-                    )
                     if hill:
-                        # Znajdź lub utwórz obiekt jumper
-                        jumper = next(
-                            (
-                                j
-                                for j in self.all_jumpers
-                                if j.name == res["name"] and j.last_name == res["last"]
-                            ),
-                            None,
-                        )
-                        jumper = jumper or Jumper(
-                            res["name"], res["last"], nationality=res.get("country")
-                        )
-
                         print(f"DEBUG: Znaleziono/utworzono jumper: {jumper}")
 
                         self._show_total_points_breakdown(
@@ -3112,13 +3074,35 @@ class MainWindow(QMainWindow):
                             total_points,
                         )
                     else:
-                        print(f"DEBUG: Nie znaleziono skoczni: {hill_name}")
+                        print(
+                            "DEBUG: Nie znaleziono skoczni: "
+                            f"{self._history_detail_hill_name}"
+                        )
                 else:
                     print("DEBUG: Suma punktów wynosi 0")
         except Exception as e:
             print(f"DEBUG: Błąd w _on_history_detail_cell_clicked: {e}")
             pass
 
+    def _hill_by_name(self, name):
+        """Skocznia o danej nazwie lub None (indeks budowany przy pierwszym użyciu)."""
+        if self._hill_index is None:
+            # Odwrócona kolejność – przy powtórzonej nazwie wygrywa pierwsza
+            self._hill_index = {h.name: h for h in reversed(self.all_hills)}
+        return self._hill_index.get(name)
+
+    def _history_jumper(self, res):
+        """Zawodnik z bazy dla wyniku z historii lub tymczasowy obiekt z jego danymi."""
+        if self._jumper_index is None:
+            # Odwrócona kolejność – przy powtórzonym nazwisku wygrywa pierwszy
+            self._jumper_index = {
+                (j.name, j.last_name): j for j in reversed(self.all_jumpers)
+            }
+        jumper = self._jumper_index.get((res["name"], res["last"]))
+        return jumper or Jumper(
+            res["name"], res["last"], nationality=res.get("country")
+        )
+
     def _create_support_page(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -3205,17 +3189,11 @@ class MainWindow(QMainWindow):
 
         # Usunięto automatyczne odświeżanie - kafelek bez liczb członków/online
 
-        self.central_widget.addWidget(widget)
         self.page_support = widget
+        return widget
 
     # Usunięto metody Discord API - nie są już potrzebne
 
-    def _create_description_page(self):
-        # Placeholder to zachować kolejność indeksów (bez treści)
-        widget = QWidget()
-        self.central_widget.addWidget(widget)
-        self.page_description = widget
-
     def _create_settings_page(self):
         # Ustawienia: tryb okna, głośność, kontrast
         widget = QWidget()
@@ -3228,8 +3206,14 @@ class MainWindow(QMainWindow):
         self.window_mode_combo.addItems(
             ["W oknie", "Pełny ekran w oknie", "Pełny ekran"]
         )
+        # Akcje w kolejności pozycji listy – wybór po indeksie, bez porównań tekstu
+        self._window_mode_actions = (
+            self.showNormal,
+            self.showMaximized,
+            self.showFullScreen,
+        )
         self.window_mode_combo.setCurrentText("Pełny ekran w oknie")
-        self.window_mode_combo.currentTextChanged.connect(self._change_window_mode)
+        self.window_mode_combo.currentIndexChanged.connect(self._change_window_mode)
         layout.addLayout(self._create_form_row("Tryb okna:", self.window_mode_combo))
 
         volume_label = QLabel("Głośność:")
@@ -3252,16 +3236,13 @@ class MainWindow(QMainWindow):
         )
 
         layout.addStretch()
-        self.central_widget.addWidget(widget)
         self.page_settings = widget
+        return widget
 
-    def _change_window_mode(self, mode):
-        if mode == "Pełny ekran":
-            self.showFullScreen()
-        elif mode == "Pełny ekran w oknie":
-            self.showMaximized()
-        else:  # "W oknie"
-            self.showNormal()
+    @pyqtSlot(int)
+    def _change_window_mode(self, index):
+        if 0 <= index < len(self._window_mode_actions):
+            self._window_mode_actions[index]()
 
     def _create_top_bar(self, title_text, back_index):
         # With global header + nav, top bar reduces to optional back button row
@@ -3276,24 +3257,35 @@ class MainWindow(QMainWindow):
         top_bar.addStretch(1)
         return top_bar
 
+    @pyqtSlot(int)
     def _on_page_changed(self, index: int):
-        # Header title
-        title = self.index_to_title.get(index, "Ski Jumping Simulator")
+        meta = self._page_meta[index] if 0 <= index < len(self._page_meta) else None
+        if meta is None:
+            self.header_title_label.setText("Ski Jumping Simulator")
+            return
+        title, btn = meta
         self.header_title_label.setText(title)
-
-        # Active nav button
-        mapping = {
-            self.MAIN_MENU_IDX: self._nav_btn_start,
-            self.SINGLE_JUMP_IDX: self._nav_btn_single,
-            self.COMPETITION_IDX: self._nav_btn_comp,
-            self.DATA_EDITOR_IDX: self._nav_btn_editor,
-            # self.DESCRIPTION_IDX: no sidebar button
-            self.SETTINGS_IDX: self._nav_btn_settings,
-            # self.JUMP_REPLAY_IDX: no sidebar button
-        }
-        btn = mapping.get(index)
+        # Powtórka i podział punktów nie mają przycisku w pasku bocznym
         if btn is not None:
             self.nav_sidebar.set_active(btn)
+        if index == self.COMPETITION_IDX and self._warmup_worker is None:
+            self._warmup_worker = _WarmupWorker(self)
+            self._warmup_worker.start()
+
+    def closeEvent(self, event):
+        # Wątki w tle i procesy puli kończone przed zniszczeniem okna
+        for worker in (
+            self._warmup_worker,
+            getattr(self, "recommended_gate_worker", None),
+            getattr(self, "_history_list_worker", None),
+            getattr(self, "_history_detail_worker", None),
+        ):
+            if worker is not None and worker.isRunning():
+                worker.requestInterruption()
+                worker.wait()
+        if _gate_scan_pool is not None:
+            _discard_gate_scan_pool(_gate_scan_pool)
+        super().closeEvent(event)
 
     def _create_form_row(self, label_text, widget):
         row = QHBoxLayout()
@@ -3309,9 +3301,9 @@ class MainWindow(QMainWindow):
         row.addWidget(widget)
         return row
 
-    def _on_jumper_item_changed(self, item):
-        jumper = item.data(Qt.UserRole)
-        if item.checkState() == Qt.Checked:
+    @pyqtSlot(object, bool)
+    def _on_jumper_check_changed(self, jumper, checked):
+        if checked:
             if jumper not in self.selection_order:
                 self.selection_order.append(jumper)
         else:
@@ -3331,15 +3323,11 @@ class MainWindow(QMainWindow):
             hill = self.all_hills[self.comp_hill_combo.currentIndex() - 1]
             self._update_recommended_gate(hill)
 
+    @pyqtSlot()
     def _toggle_all_jumpers(self):
         self.play_sound()
-        checked_count = sum(
-            1
-            for i in range(self.jumper_list_widget.count())
-            if self.jumper_list_widget.item(i).checkState() == Qt.Checked
-        )
-
-        if checked_count < self.jumper_list_widget.count():
+        model = self._jumper_model
+        if model.checked_count() < model.rowCount():
             new_state = Qt.Checked
             self.toggle_all_button.setText("Odznacz wszystkich")
             self.toggle_all_button.setProperty("variant", "danger")
@@ -3348,17 +3336,8 @@ class MainWindow(QMainWindow):
             self.toggle_all_button.setText("Zaznacz wszystkich")
             self.toggle_all_button.setProperty("variant", "primary")
 
-        self.jumper_list_widget.itemChanged.disconnect(self._on_jumper_item_changed)
-        for i in range(self.jumper_list_widget.count()):
-            self.jumper_list_widget.item(i).setCheckState(new_state)
-        self.jumper_list_widget.itemChanged.connect(self._on_jumper_item_changed)
-
-        self.selection_order.clear()
-        if new_state == Qt.Checked:
-            self.selection_order = [
-                self.jumper_list_widget.item(i).data(Qt.UserRole)
-                for i in range(self.jumper_list_widget.count())
-            ]
+        model.set_all_checked(new_state == Qt.Checked)
+        self.selection_order = model.jumpers() if new_state == Qt.Checked else []
 
         # Aktualizuj licznik wybranych zawodników po zmianie stanu (niebieski)
         if hasattr(self, "selected_count_label"):
@@ -3391,7 +3370,7 @@ class MainWindow(QMainWindow):
             hasattr(self, "recommended_gate_worker")
             and self.recommended_gate_worker.isRunning()
         ):
-            self.recommended_gate_worker.quit()
+            self.recommended_gate_worker.requestInterruption()
             self.recommended_gate_worker.wait()
 
         # Pokaż wskaźnik ładowania
@@ -3426,33 +3405,35 @@ class MainWindow(QMainWindow):
         # Ukryj informację o maksymalnej odległości
         self.gate_info_label.setVisible(False)
 
-    def _sort_jumper_list(self, sort_text):
-        items_data = []
-        for i in range(self.jumper_list_widget.count()):
-            item = self.jumper_list_widget.item(i)
-            jumper = item.data(Qt.UserRole)
-            check_state = item.checkState()
-            items_data.append((jumper, check_state))
-
-        if sort_text == "Wg Kraju":
-            items_data.sort(key=lambda data: (data[0].nationality, str(data[0])))
-        else:
-            items_data.sort(key=lambda data: str(data[0]))
-
-        self.jumper_list_widget.itemChanged.disconnect(self._on_jumper_item_changed)
-        self.jumper_list_widget.clear()
+    def _sorted_order(self, kind, by_country):
+        """
+        Zawodnicy/skocznie w danej kolejności, sortowani raz na zmianę danych.
 
-        for jumper, check_state in items_data:
-            item = QListWidgetItem(
-                self.create_rounded_flag_icon(jumper.nationality), str(jumper)
-            )
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(check_state)
-            item.setData(Qt.UserRole, jumper)
-            self.jumper_list_widget.addItem(item)
+        all_jumpers/all_hills są już posortowane wg nazwy (sort_by_name przy
+        wczytaniu i każdym odświeżeniu), a sortowanie jest stabilne – wystarczy
+        klucz kraju, bez ponownego str() dla każdego obiektu.
+        """
+        key = (kind, by_country)
+        order = self._sort_orders.get(key)
+        if order is None:
+            if kind == "jumpers":
+                objects, code_attr = self.all_jumpers, "nationality"
+            else:
+                objects, code_attr = self.all_hills, "country"
+            if by_country:
+                order = sorted(objects, key=attrgetter(code_attr))
+            else:
+                order = list(objects)
+            self._sort_orders[key] = order
+        return order
 
-        self.jumper_list_widget.itemChanged.connect(self._on_jumper_item_changed)
+    @pyqtSlot(str)
+    def _sort_jumper_list(self, sort_text):
+        self._jumper_model.reorder(
+            self._sorted_order("jumpers", sort_text == "Wg Kraju")
+        )
 
+    @pyqtSlot(int, int)
     def _on_result_cell_clicked(self, row, column):
         self.play_sound()
 
@@ -3721,6 +3702,7 @@ class MainWindow(QMainWindow):
         self.central_widget.addWidget(card)
         self.central_widget.setCurrentWidget(card)
 
+    @pyqtSlot(int, int)
     def _on_qualification_cell_clicked(self, row, column):
         """Obsługa kliknięcia w komórkę tabeli kwalifikacji"""
         self.play_sound()
@@ -3786,9 +3768,7 @@ class MainWindow(QMainWindow):
         self._jump_replay_from_history = from_history
 
         self.central_widget.setCurrentIndex(self.JUMP_REPLAY_IDX)
-        self._run_animation_on_canvas(
-            self.replay_canvas, self.replay_figure, sim_data, hill
-        )
+        self._run_trajectory_animation(self.replay_view, sim_data, hill)
 
         # Minimalistyczny pasek timingu pod statystykami
         try:
@@ -3816,16 +3796,7 @@ class MainWindow(QMainWindow):
             # Tytuł nad paskiem
             title_label = QLabel("Timing wybicia")
             title_label.setAlignment(Qt.AlignCenter)
-            title_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #cccccc;
-                    font-size: 11px;
-                    padding: 0px;
-                    margin: 2px 0 0 0;
-                }
-                """
-            )
+            title_label.setProperty("class", "timingCaption")
 
             bar = TimingIndicatorBar(max_abs_seconds=0.12)
             bar.setTiming(epsilon_t_s, classification)
@@ -3837,23 +3808,42 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-    def _create_distance_card(
-        self, distance, k_point, meter_value, difference, distance_points
+    def _new_breakdown_card(
+        self, title_text: Optional[str] = None, spacing: int = 4
     ):
-        """Tworzy kartę z informacjami o odległości i obliczeniach punktów."""
+        """Tworzy pustą kartę podziału punktów (opcjonalnie z tytułem-chipem).
+
+        Zwraca krotkę (karta, układ pionowy), do której dokłada się treść.
+        """
         card = QWidget()
         # Neutralna karta bez lokalnych kolorów; wygląd po stronie QSS
         card.setProperty("class", "card")
 
         layout = QVBoxLayout(card)
-        layout.setSpacing(6)
+        layout.setSpacing(spacing)
 
-        # Tytuł karty
-        title = QLabel("Punkty za odległość")
-        title.setProperty("chip", True)
-        title.setProperty("variant", "primary")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
+        if title_text is not None:
+            title = QLabel(title_text)
+            title.setProperty("chip", True)
+            title.setProperty("variant", "primary")
+            title.setAlignment(Qt.AlignCenter)
+            layout.addWidget(title)
+
+        return card, layout
+
+    @staticmethod
+    def _make_details_layout() -> QGridLayout:
+        """Siatka etykieta | wartość używana w kartach szczegółów."""
+        details_layout = QGridLayout()
+        details_layout.setContentsMargins(0, 0, 0, 0)
+        details_layout.setSpacing(5)
+        return details_layout
+
+    def _create_distance_card(
+        self, distance, k_point, meter_value, difference, distance_points
+    ):
+        """Tworzy kartę z informacjami o odległości i obliczeniach punktów."""
+        card, layout = self._new_breakdown_card("Punkty za odległość", spacing=6)
 
         # Główna informacja o odległości
         distance_info = QLabel(f"Odległość: {format_distance_with_unit(distance)}")
@@ -3868,13 +3858,13 @@ class MainWindow(QMainWindow):
         # Lewa kolumna - wartości
         left_col = QVBoxLayout()
 
-        k_point_label = QLabel(f"K-point: {k_point:.1f} m")
+        k_point_label = QLabel("K-point: %.1f m" % k_point)
         left_col.addWidget(k_point_label)
 
-        difference_label = QLabel(f"Różnica: {difference:+.1f} m")
+        difference_label = QLabel("Różnica: %+.1f m" % difference)
         left_col.addWidget(difference_label)
 
-        meter_label = QLabel(f"Meter value: {meter_value:.1f} pkt/m")
+        meter_label = QLabel("Meter value: %.1f pkt/m" % meter_value)
         left_col.addWidget(meter_label)
 
         details_layout.addLayout(left_col)
@@ -3887,11 +3877,11 @@ class MainWindow(QMainWindow):
         right_col.addWidget(base_points_label)
 
         bonus_points = difference * meter_value
-        bonus_label = QLabel(f"{bonus_points:+.1f} pkt")
+        bonus_label = QLabel("%+.1f pkt" % bonus_points)
         bonus_label.setProperty("role", "meta")
         right_col.addWidget(bonus_label)
 
-        total_distance_label = QLabel(f"{distance_points:.1f} pkt")
+        total_distance_label = QLabel("%.1f pkt" % distance_points)
         total_distance_label.setProperty("chip", True)
         total_distance_label.setProperty("variant", "success")
         total_distance_label.setAlignment(Qt.AlignCenter)
@@ -3907,18 +3897,7 @@ class MainWindow(QMainWindow):
 
         title_text: nagłówek karty (np. "Noty sędziów - I seria").
         """
-        card = QWidget()
-        card.setProperty("class", "card")
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(4)
-
-        # Tytuł karty
-        title = QLabel(title_text)
-        title.setProperty("chip", True)
-        title.setProperty("variant", "primary")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
+        card, layout = self._new_breakdown_card(title_text)
 
         # Noty sędziowskie w poziomie
         scores_layout = QHBoxLayout()
@@ -4005,7 +3984,7 @@ class MainWindow(QMainWindow):
             total_judge_points = float(total_judge_points)
         except (ValueError, TypeError):
             total_judge_points = 0.0
-        judge_summary = QLabel(f"Suma (bez skrajnych): {total_judge_points:.1f} pkt")
+        judge_summary = QLabel("Suma (bez skrajnych): %.1f pkt" % total_judge_points)
         judge_summary.setProperty("chip", True)
         judge_summary.setProperty("variant", "primary")
         judge_summary.setAlignment(Qt.AlignCenter)
@@ -4044,18 +4023,7 @@ class MainWindow(QMainWindow):
 
     def _create_simple_judge_card(self, judge_data):
         """Tworzy prostą kartę z notami sędziowskimi dla danych z historii."""
-        card = QWidget()
-        card.setProperty("class", "card")
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(4)
-
-        # Tytuł karty
-        title = QLabel("Punkty za noty")
-        title.setProperty("chip", True)
-        title.setProperty("variant", "primary")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
+        card, layout = self._new_breakdown_card("Punkty za noty")
 
         # Wyświetl dostępne dane judge
         info_label = QLabel("Dane not sędziowskich dostępne")
@@ -4076,18 +4044,7 @@ class MainWindow(QMainWindow):
 
     def _create_no_judge_card(self):
         """Tworzy kartę informującą o braku danych not sędziowskich."""
-        card = QWidget()
-        card.setProperty("class", "card")
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(4)
-
-        # Tytuł karty
-        title = QLabel("Punkty za noty")
-        title.setProperty("chip", True)
-        title.setProperty("variant", "primary")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
+        card, layout = self._new_breakdown_card("Punkty za noty")
 
         # Informacja o braku danych
         info_label = QLabel("Brak danych not sędziowskich")
@@ -4100,11 +4057,7 @@ class MainWindow(QMainWindow):
 
     def _create_total_card(self, distance_points, judge_data):
         """Tworzy kartę z sumą punktów."""
-        card = QWidget()
-        card.setProperty("class", "card")
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(4)
+        card, layout = self._new_breakdown_card()
 
         # Tytuł karty
         title = QLabel("Suma punktów")
@@ -4183,6 +4136,20 @@ class MainWindow(QMainWindow):
         vbox.addWidget(table)
         self.points_breakdown_layout.addWidget(container)
 
+    def _clear_points_breakdown(self):
+        """Usuwa karty podziału punktów, ukrywając je od razu.
+
+        Karty są usuwane przez deleteLater, więc do końca pętli zdarzeń pozostają
+        dziećmi kontenera – ukrycie zapobiega ich ponownemu układaniu i malowaniu.
+        """
+        layout = self.points_breakdown_layout
+        while layout.count() > 0:
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+
     def _show_points_breakdown(
         self, jumper, distance, points, seria_num, judge_data=None, from_history=False
     ):
@@ -4200,14 +4167,7 @@ class MainWindow(QMainWindow):
             )
             hill_name = getattr(self, "_history_detail_hill_name", "")
             if hill_name:
-                hill = next(
-                    (
-                        h
-                        for h in self.all_hills
-                        if getattr(h, "name", None) == hill_name
-                    ),
-                    None,
-                )
+                hill = self._hill_by_name(hill_name)
                 if hill:
                     self.competition_hill = hill
                     print(f"DEBUG: Znaleziono skocznie: {hill.name}")
@@ -4239,39 +4199,40 @@ class MainWindow(QMainWindow):
         )
         self.points_info_label.setText(stats_text)
 
-        # Clear existing breakdown cards
-        while self.points_breakdown_layout.count() > 0:
-            item = self.points_breakdown_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Przebudowa kart bez odświeżania kontenera po każdym addWidget
+        self.points_breakdown_container.setUpdatesEnabled(False)
+        try:
+            self._clear_points_breakdown()
 
-        # Calculate distance points
-        distance_points = 60.0 + (difference * meter_value)
+            # Calculate distance points
+            distance_points = 60.0 + (difference * meter_value)
 
-        # Create visual breakdown cards
-        self._create_distance_card(
-            distance, k_point, meter_value, difference, distance_points
-        )
+            # Create visual breakdown cards
+            self._create_distance_card(
+                distance, k_point, meter_value, difference, distance_points
+            )
 
-        if judge_data and isinstance(judge_data, dict):
-            # Sprawdź czy dane judge mają wymaganą strukturę
-            if "all_scores" in judge_data and "total_score" in judge_data:
-                try:
-                    self._create_judge_card(judge_data)
-                except Exception as e:
-                    print(f"DEBUG: Błąd tworzenia karty judge: {e}")
+            if judge_data and isinstance(judge_data, dict):
+                # Sprawdź czy dane judge mają wymaganą strukturę
+                if "all_scores" in judge_data and "total_score" in judge_data:
+                    try:
+                        self._create_judge_card(judge_data)
+                    except Exception as e:
+                        print(f"DEBUG: Błąd tworzenia karty judge: {e}")
+                        self._create_simple_judge_card(judge_data)
+                else:
+                    # Jeśli dane judge mają inną strukturę, utwórz prostą kartę
                     self._create_simple_judge_card(judge_data)
+            elif judge_data:
+                # Jeśli judge_data nie jest dict, ale ma jakąś wartość
+                self._create_simple_judge_card({"raw_data": judge_data})
             else:
-                # Jeśli dane judge mają inną strukturę, utwórz prostą kartę
-                self._create_simple_judge_card(judge_data)
-        elif judge_data:
-            # Jeśli judge_data nie jest dict, ale ma jakąś wartość
-            self._create_simple_judge_card({"raw_data": judge_data})
-        else:
-            # Jeśli brak danych judge, utwórz informację o braku danych
-            self._create_no_judge_card()
+                # Jeśli brak danych judge, utwórz informację o braku danych
+                self._create_no_judge_card()
 
-        self._create_total_card(distance_points, judge_data)
+            self._create_total_card(distance_points, judge_data)
+        finally:
+            self.points_breakdown_container.setUpdatesEnabled(True)
 
         # Usunięto zbędne lokalne obliczenia sumy – karta sumy jest tworzona powyżej
 
@@ -4289,8 +4250,8 @@ class MainWindow(QMainWindow):
         sim_data = self._calculate_trajectory(
             jumper, self.competition_hill, self.competition_gate
         )
-        self._run_animation_on_canvas(
-            self.points_canvas, self.points_figure, sim_data, self.competition_hill
+        self._run_trajectory_animation(
+            self.points_view, sim_data, self.competition_hill
         )
 
         # Przełącz na stronę podziału punktów
@@ -4316,14 +4277,10 @@ class MainWindow(QMainWindow):
             hill = self.competition_hill
             gate = getattr(self, "competition_gate", None)
             k_point = hill.K
-        elif (
-            hasattr(self, "_history_detail_hill_name")
-            and self._history_detail_hill_name
-        ):
+        else:
             # Znajdź skocznię po nazwie z historii
-            hill_name = self._history_detail_hill_name
-            hill = next((h for h in self.all_hills if h.name == hill_name), None)
-            if hill:
+            hill = self._hill_by_name(self._history_detail_hill_name)
+            if hill is not None:
                 gate = getattr(self, "_history_detail_gate", None) or hill.gates
                 k_point = hill.K
 
@@ -4343,57 +4300,66 @@ class MainWindow(QMainWindow):
         )
         self.points_info_label.setText(stats_text)
 
-        # Clear existing breakdown cards
-        while self.points_breakdown_layout.count() > 0:
-            item = self.points_breakdown_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Przebudowa kart bez odświeżania kontenera po każdym addWidget
+        self.points_breakdown_container.setUpdatesEnabled(False)
+        try:
+            self._clear_points_breakdown()
 
-        # I seria – prosty, logiczny widok z trzema wartościami
-        if result_data.get("d1", 0) > 0 and result_data.get("p1", 0) > 0:
-            try:
-                d1 = float(result_data["d1"])
-                p1 = float(result_data["p1"])  # suma serii (odległość + noty)
-                distance_points_1 = calculate_jump_points(d1, k_point)
-                judges1 = result_data.get("judges1")
-                if judges1 and isinstance(judges1, dict) and "total_score" in judges1:
-                    try:
-                        judge_points_1 = float(judges1["total_score"])
-                    except (ValueError, TypeError):
+            # I seria – prosty, logiczny widok z trzema wartościami
+            if result_data.get("d1", 0) > 0 and result_data.get("p1", 0) > 0:
+                try:
+                    d1 = float(result_data["d1"])
+                    p1 = float(result_data["p1"])  # suma serii (odległość + noty)
+                    distance_points_1 = calculate_jump_points(d1, k_point)
+                    judges1 = result_data.get("judges1")
+                    if (
+                        judges1
+                        and isinstance(judges1, dict)
+                        and "total_score" in judges1
+                    ):
+                        try:
+                            judge_points_1 = float(judges1["total_score"])
+                        except (ValueError, TypeError):
+                            judge_points_1 = max(0.0, p1 - distance_points_1)
+                    else:
                         judge_points_1 = max(0.0, p1 - distance_points_1)
-                else:
-                    judge_points_1 = max(0.0, p1 - distance_points_1)
-                self._create_series_points_table(
-                    "I seria", distance_points_1, judge_points_1, p1
-                )
-            except Exception as e:
-                print(f"DEBUG: Błąd przetwarzania I serii: {e}")
-                return
+                    self._create_series_points_table(
+                        "I seria", distance_points_1, judge_points_1, p1
+                    )
+                except Exception as e:
+                    print(f"DEBUG: Błąd przetwarzania I serii: {e}")
+                    return
 
-        # II seria – analogicznie
-        if result_data.get("d2", 0) > 0 and result_data.get("p2", 0) > 0:
-            try:
-                d2 = float(result_data["d2"])
-                p2 = float(result_data["p2"])  # suma serii
-                distance_points_2 = calculate_jump_points(d2, k_point)
-                judges2 = result_data.get("judges2")
-                if judges2 and isinstance(judges2, dict) and "total_score" in judges2:
-                    try:
-                        judge_points_2 = float(judges2["total_score"])
-                    except (ValueError, TypeError):
+            # II seria – analogicznie
+            if result_data.get("d2", 0) > 0 and result_data.get("p2", 0) > 0:
+                try:
+                    d2 = float(result_data["d2"])
+                    p2 = float(result_data["p2"])  # suma serii
+                    distance_points_2 = calculate_jump_points(d2, k_point)
+                    judges2 = result_data.get("judges2")
+                    if (
+                        judges2
+                        and isinstance(judges2, dict)
+                        and "total_score" in judges2
+                    ):
+                        try:
+                            judge_points_2 = float(judges2["total_score"])
+                        except (ValueError, TypeError):
+                            judge_points_2 = max(0.0, p2 - distance_points_2)
+                    else:
                         judge_points_2 = max(0.0, p2 - distance_points_2)
-                else:
-                    judge_points_2 = max(0.0, p2 - distance_points_2)
-                self._create_series_points_table(
-                    "II seria", distance_points_2, judge_points_2, p2
-                )
-            except Exception as e:
-                print(f"DEBUG: Błąd przetwarzania II serii: {e}")
-                return
+                    self._create_series_points_table(
+                        "II seria", distance_points_2, judge_points_2, p2
+                    )
+                except Exception as e:
+                    print(f"DEBUG: Błąd przetwarzania II serii: {e}")
+                    return
 
-        # Zwięzła karta sumy punktów pozostaje bez zmian, ale mogę ją też
-        # zamienić na trzecią mini-tabelę "Razem" jeśli zechcesz.
-        self._create_total_card(total_points, None)
+            # Zwięzła karta sumy punktów pozostaje bez zmian, ale mogę ją też
+            # zamienić na trzecią mini-tabelę "Razem" jeśli zechcesz.
+            self._create_total_card(total_points, None)
+        finally:
+            self.points_breakdown_container.setUpdatesEnabled(True)
 
         # Aktualizuj informacje o skoczni
         self.points_hill_name.setText(f"Skocznia: {hill}")
@@ -4406,9 +4372,7 @@ class MainWindow(QMainWindow):
         # Uruchom animację trajektorii w tle (użyj pierwszej serii jeśli dostępna)
         if result_data.get("d1", 0) > 0:
             sim_data = self._calculate_trajectory(jumper, hill, gate)
-            self._run_animation_on_canvas(
-                self.points_canvas, self.points_figure, sim_data, hill
-            )
+            self._run_trajectory_animation(self.points_view, sim_data, hill)
 
         # Store the back navigation context - we're coming from history
         self._points_breakdown_from_history = True
@@ -4599,112 +4563,36 @@ class MainWindow(QMainWindow):
 
         self.points_breakdown_layout.addWidget(card)
 
-    def _run_animation_on_canvas(self, canvas, figure, sim_data, hill):
-        # Zatrzymaj poprzednią animację jeśli istnieje
-        # Użyj różnych zmiennych animacji dla różnych canvasów
-        if canvas == self.points_canvas:
-            animation_var = "points_ani"
-        elif canvas == self.replay_canvas:
-            animation_var = "replay_ani"
-        else:
-            animation_var = "ani"  # fallback dla innych canvasów
+    def _stop_trajectory_animations(self):
+        """Zatrzymuje animacje trajektorii na wszystkich stronach."""
+        for view in (self.trajectory_view, self.replay_view, self.points_view):
+            view.stop()
 
-        # Zatrzymaj wszystkie animacje dla tego canvasu
-        for var in ["ani", "points_ani", "replay_ani", "zoom_ani"]:
-            if hasattr(self, var) and getattr(self, var) is not None:
-                try:
-                    current_ani = getattr(self, var)
-                    if (
-                        hasattr(current_ani, "event_source")
-                        and current_ani.event_source is not None
-                    ):
-                        current_ani.event_source.stop()
-                except Exception:
-                    pass  # Ignoruj błędy przy zatrzymywaniu animacji
-                setattr(self, var, None)
-
-        # Wyczyść figure przed rozpoczęciem nowej animacji
-        figure.clear()
-        ax = figure.add_subplot(111)
-        # Ciemne tło zgodne z motywem
-        ax.set_facecolor("#0f1115")
-        figure.patch.set_facecolor("#0f1115")
-        ax.axis("off")
-        ax.set_aspect("auto")
+    def _run_trajectory_animation(self, view, sim_data, hill):
+        # Naraz odtwarzana jest tylko jedna animacja
+        self._stop_trajectory_animations()
 
         inrun_length_to_show = 15.0
         x_inrun = np.linspace(-inrun_length_to_show, 0, 50)
         y_inrun = np.tan(-hill.alpha_rad) * x_inrun
-        ax.plot(x_inrun, y_inrun, color="#4c84ff", linewidth=2.5)
 
         max_y_inrun = y_inrun[0] if len(y_inrun) > 0 else 0
         # Poprawione limity - animacja będzie wyżej i ładniej sformatowana
-        ax.set_xlim(-inrun_length_to_show - 5, hill.n + hill.a_finish + 30)
-        ax.set_ylim(
+        xlim = (-inrun_length_to_show - 5, hill.n + hill.a_finish + 30)
+        ylim = (
             min(min(sim_data["y_landing"]), 0) - 3,
             max(sim_data["max_height"] * 1.3, max_y_inrun) + 3,
         )
 
-        (jumper_point,) = ax.plot(
-            [],
-            [],
-            "o",
-            color="#e8eaf1",
-            markersize=7,
-            markeredgecolor="#4c84ff",
-            markeredgewidth=1.5,
-        )
-        (trail_line,) = ax.plot([], [], color="#5b90ff", linewidth=2.5, alpha=0.7)
-        (landing_line,) = ax.plot([], [], color="#4c84ff", linewidth=3, alpha=0.8)
-        plot_elements = [jumper_point, trail_line, landing_line]
-
-        def init():
-            for element in plot_elements:
-                element.set_data([], [])
-            return plot_elements
-
-        def update(frame):
-            positions, x_landing, y_landing = (
-                sim_data["positions"],
-                sim_data["x_landing"],
-                sim_data["y_landing"],
-            )
-            if frame >= max(len(positions), len(x_landing)):
-                # Zatrzymaj animację gdy się skończy
-                try:
-                    current_ani = getattr(self, animation_var)
-                    if (
-                        hasattr(current_ani, "event_source")
-                        and current_ani.event_source is not None
-                    ):
-                        current_ani.event_source.stop()
-                except Exception:
-                    pass
-                setattr(self, animation_var, None)
-                return plot_elements
-            if frame < len(positions):
-                x, y = positions[frame]
-                jumper_point.set_data([x], [y])
-                trail_line.set_data(
-                    [p[0] for p in positions[: frame + 1]],
-                    [p[1] for p in positions[: frame + 1]],
-                )
-            if frame < len(x_landing):
-                landing_line.set_data(x_landing[:frame], y_landing[:frame])
-            return plot_elements
-
-        new_ani = animation.FuncAnimation(
-            figure,
-            update,
-            init_func=init,
-            frames=max(len(sim_data["positions"]), len(sim_data["x_landing"])),
-            interval=8,
-            blit=False,
-            repeat=False,
+        view.set_trajectory(
+            np.column_stack((x_inrun, y_inrun)),
+            np.column_stack((sim_data["x_landing"], sim_data["y_landing"])),
+            sim_data["positions"],
+            xlim,
+            ylim,
         )
-        setattr(self, animation_var, new_ani)
-        canvas.draw()
 
+    @pyqtSlot()
     def run_simulation(self):
         self.play_sound()
         if not self.selected_jumper or not self.selected_hill:
@@ -4745,8 +4633,8 @@ class MainWindow(QMainWindow):
             self.single_jump_stats_label.setProperty("variant", "success")
             self.single_jump_stats_label.setStyleSheet("")
 
-            self._run_animation_on_canvas(
-                self.canvas, self.figure, sim_data, self.selected_hill
+            self._run_trajectory_animation(
+                self.trajectory_view, sim_data, self.selected_hill
             )
 
         except ValueError as e:
@@ -4757,10 +4645,9 @@ class MainWindow(QMainWindow):
 
     def play_sound(self):
         if hasattr(self, "sound_loaded") and self.sound_loaded:
-            if self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
-                self.player.setPosition(0)
-            else:
-                self.player.play()
+            if self.player.isPlaying():
+                self.player.stop()
+            self.player.play()
 
     def adjust_brightness(self, hex_color, contrast):
         hex_color = hex_color.lstrip("#")
@@ -4768,6 +4655,7 @@ class MainWindow(QMainWindow):
         rgb = [min(max(int(c * contrast), 0), 255) for c in rgb]
         return f"{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
 
+    @pyqtSlot()
     def update_jumper(self):
         if self.jumper_combo.currentIndex() > 0:
             self.selected_jumper = self.all_jumpers[
@@ -4776,6 +4664,7 @@ class MainWindow(QMainWindow):
         else:
             self.selected_jumper = None
 
+    @pyqtSlot()
     def update_hill(self):
         if self.hill_combo.currentIndex() > 0:
             self.selected_hill = self.all_hills[self.hill_combo.currentIndex() - 1]
@@ -4784,6 +4673,7 @@ class MainWindow(QMainWindow):
         else:
             self.selected_hill = None
 
+    @pyqtSlot()
     def update_competition_hill(self):
         if self.comp_hill_combo.currentIndex() > 0:
             hill = self.all_hills[self.comp_hill_combo.currentIndex() - 1]
@@ -4797,6 +4687,7 @@ class MainWindow(QMainWindow):
             if hasattr(self, "recommended_gate_label"):
                 self.recommended_gate_label.setVisible(False)
 
+    @pyqtSlot()
     def clear_results(self):
         self.jumper_combo.setCurrentIndex(0)
         self.hill_combo.setCurrentIndex(0)
@@ -4807,25 +4698,10 @@ class MainWindow(QMainWindow):
         self.single_jump_stats_label.setProperty("chip", True)
         self.single_jump_stats_label.setProperty("variant", "info")
         self.single_jump_stats_label.setStyleSheet("")
-        if hasattr(self, "figure"):
-            self.figure.clear()
-            self.canvas.draw()
-        # Zatrzymaj wszystkie animacje
-        for animation_var in ["ani", "points_ani", "replay_ani", "zoom_ani"]:
-            if (
-                hasattr(self, animation_var)
-                and getattr(self, animation_var) is not None
-            ):
-                try:
-                    current_ani = getattr(self, animation_var)
-                    if (
-                        hasattr(current_ani, "event_source")
-                        and current_ani.event_source is not None
-                    ):
-                        current_ani.event_source.stop()
-                except Exception:
-                    pass  # Ignoruj błędy przy zatrzymywaniu animacji
-                setattr(self, animation_var, None)
+        if hasattr(self, "trajectory_view"):
+            self.trajectory_view.clear()
+            # Zatrzymaj wszystkie animacje
+            self._stop_trajectory_animations()
 
     def change_theme(self, theme):
         theme_mapping = {
@@ -4835,17 +4711,19 @@ class MainWindow(QMainWindow):
         self.current_theme = theme_mapping.get(theme, "dark")
         self.update_styles()
 
+    @pyqtSlot()
     def change_contrast(self):
         self.contrast_level = self.contrast_slider.value() / 100.0
         self.update_styles()
 
+    @pyqtSlot()
     def change_volume(self):
         self.volume_level = self.volume_slider.value() / 100.0
         if hasattr(self, "sound_loaded") and self.sound_loaded:
-            self.audio_output.setVolume(self.volume_level)
+            self.player.setVolume(self.volume_level)
 
     def update_styles(self):
-        # Respect global QSS. Only refresh figure backgrounds to match theme if needed.
+        # Respect global QSS. Only refresh trajectory view backgrounds to match theme if needed.
 
         # Apply styles to both tables
         if hasattr(self, "results_table"):
@@ -4856,65 +4734,72 @@ class MainWindow(QMainWindow):
         # Nie nadpisuj globalnego QSS lokalnym styleSheet na oknie, bo kasuje to reguły
         # dla QComboBox/QSlider. Tło zostawiamy po stronie QSS motywu.
 
-        if hasattr(self, "figure"):
-            self.figure.set_facecolor(
-                f"#{self.adjust_brightness('1a1a1a' if self.current_theme == 'dark' else 'f0f0f0', self.contrast_level)}"
-            )
-            if hasattr(self, "canvas"):
-                self.canvas.draw()
-        if hasattr(self, "replay_figure"):
-            self.replay_figure.set_facecolor(
-                f"#{self.adjust_brightness('1a1a1a' if self.current_theme == 'dark' else 'f0f0f0', self.contrast_level)}"
-            )
-            if hasattr(self, "replay_canvas"):
-                self.replay_canvas.draw()
+        background = f"#{self.adjust_brightness('1a1a1a' if self.current_theme == 'dark' else 'f0f0f0', self.contrast_level)}"
+        if hasattr(self, "trajectory_view"):
+            self.trajectory_view.set_background_color(background)
+        if hasattr(self, "replay_view"):
+            self.replay_view.set_background_color(background)
 
     def _create_rounded_flag_pixmap(self, country_code, size=QSize(48, 33), radius=8):
-        if not country_code:
-            return QPixmap()
-        flag_path = resource_path(
-            os.path.join("assets", "flags", f"{country_code}.png")
-        )
-        if not os.path.exists(flag_path):
-            return QPixmap()
-        try:
-            # Wysokiej jakości antyaliasing: rysuj maskę w skali i przeskaluj LANCZOS
-            scale = 4
-            target_w, target_h = size.width(), size.height()
-            hi_w, hi_h = target_w * scale, target_h * scale
-            with Image.open(flag_path) as img:
-                img = img.convert("RGBA")
-                img_resized = img.resize((hi_w, hi_h), Image.Resampling.LANCZOS)
-            mask_hi = Image.new("L", (hi_w, hi_h), 0)
-            draw = ImageDraw.Draw(mask_hi)
-            draw.rounded_rectangle(
-                ((0, 0), (hi_w, hi_h)), radius=radius * scale, fill=255
-            )
-            # Minimalne rozmycie krawędzi maski, by usunąć pikselowe rogi
-            mask_hi = mask_hi.filter(ImageFilter.GaussianBlur(radius=scale * 0.35))
-            img_resized.putalpha(mask_hi)
-            # Downscale do docelowego rozmiaru z zachowaniem antyaliasingu
-            final_img = img_resized.resize(
-                (target_w, target_h), Image.Resampling.LANCZOS
-            )
-            qimage = QImage(
-                final_img.tobytes("raw", "RGBA"),
-                final_img.width,
-                final_img.height,
-                QImage.Format_RGBA8888,
-            )
-            return QPixmap.fromImage(qimage)
-        except Exception as e:
-            print(f"Error creating flag pixmap for {country_code}: {e}")
-            return QPixmap()
+        return _rounded_flag_pixmap(country_code, size.width(), size.height(), radius)
 
     def create_rounded_flag_icon(self, country_code, radius=6):
+        key = (country_code, radius)
+        icon = self._flag_icon_cache.get(key)
+        if icon is None:
+            icon = self._flag_icon_cache[key] = self._build_flag_icon(
+                country_code, radius
+            )
+        return icon
+
+    def _build_flag_icon(self, country_code, radius):
         pixmap = self._create_rounded_flag_pixmap(
             country_code, size=QSize(32, 22), radius=radius
         )
         if pixmap.isNull():
             return QIcon()
-        return QIcon(pixmap)
+        icon = QIcon(pixmap)
+        # Wariant w domyślnym rozmiarze ikon list i comboboxów (16 px) – rysowany
+        # bez skalowania 32x22 przy każdym malowaniu
+        icon.addPixmap(
+            self._create_rounded_flag_pixmap(
+                country_code, size=QSize(16, 11), radius=max(1, radius // 2)
+            )
+        )
+        return icon
+
+    def _table_item(self, table, row, col, align_center=True):
+        """Zwraca komórkę tabeli, tworząc ją tylko przy pierwszym użyciu.
+
+        Kolejne odświeżenia zmieniają jedynie tekst istniejących komórek.
+        """
+        item = table.item(row, col)
+        if item is None:
+            item = QTableWidgetItem()
+            if align_center:
+                item.setTextAlignment(Qt.AlignCenter)
+            table.setItem(row, col, item)
+        return item
+
+    def _flag_cell_label(self, table, row, col=1):
+        """Zwraca etykietę flagi w komórce, budując kontener tylko raz na wiersz."""
+        container = table.cellWidget(row, col)
+        if container is not None:
+            label = container.findChild(QLabel)
+            if label is not None:
+                return label
+        # Flaga kraju – opakowana w bezmarginesowy kontener dla idealnego centrowania
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        label = QLabel()
+        label.setAlignment(Qt.AlignCenter)
+        layout.addStretch(1)
+        layout.addWidget(label, 0, Qt.AlignCenter)
+        layout.addStretch(1)
+        table.setCellWidget(row, col, container)
+        return label
 
     def run_competition(self):
         self.play_sound()
@@ -4933,6 +4818,8 @@ class MainWindow(QMainWindow):
 
         self.competition_hill = self.all_hills[hill_idx - 1]
         self.competition_gate = self.comp_gate_spin.value()
+        # Stałe punktacji skoczni liczone raz na konkurs
+        self.competition_meter_value = get_meter_value(self.competition_hill.K)
         self.competition_results = []
         self.current_jumper_index = 0
         self.current_round = 1
@@ -5107,7 +4994,7 @@ class MainWindow(QMainWindow):
                 )
                 distance = round_distance_to_half_meter(distance)
                 distance_points = calculate_jump_points(
-                    distance, self.competition_hill.K
+                    distance, self.competition_hill.K, self.competition_meter_value
                 )
 
                 # Oceniaj skok przez sędziów
@@ -5256,7 +5143,9 @@ class MainWindow(QMainWindow):
         )
 
         # Oblicz punkty za skok using rounded distance
-        distance_points = calculate_jump_points(distance, self.competition_hill.K)
+        distance_points = calculate_jump_points(
+            distance, self.competition_hill.K, self.competition_meter_value
+        )
 
         # Oceniaj skok przez sędziów
         judge_scores = self.judge_panel.score_jump(
@@ -5377,60 +5266,48 @@ class MainWindow(QMainWindow):
             self.qualification_results, key=lambda x: x["points"], reverse=True
         )
 
-        # Aktualizuj tabelę kwalifikacji
-        self.qualification_table.clearContents()
-        self.qualification_table.setRowCount(len(sorted_results))
-
-        for row, result in enumerate(sorted_results):
-            jumper = result["jumper"]
-            distance = result["distance"]
-            points = result["points"]
-
-            # Miejsce
-            place_item = QTableWidgetItem(str(row + 1))
-            place_item.setTextAlignment(Qt.AlignCenter)
-            # Zapamiętaj pełny wynik w wierszu, by klik działał niezależnie od sortowania
-            place_item.setData(Qt.UserRole, result)
-            self.qualification_table.setItem(row, 0, place_item)
-
-            # Flaga — mniejsza, idealnie wycentrowana w kontenerze (tak jak w konkursie)
-            q_flag_pix = self._create_rounded_flag_pixmap(
-                jumper.nationality, size=QSize(24, 16), radius=4
-            )
-            q_flag_container = QWidget()
-            q_flag_layout = QHBoxLayout(q_flag_container)
-            q_flag_layout.setContentsMargins(0, 0, 0, 0)
-            q_flag_layout.setSpacing(0)
-            q_flag_layout.setAlignment(Qt.AlignCenter)
-            q_flag_label = QLabel()
-            if not q_flag_pix.isNull():
-                q_flag_label.setPixmap(q_flag_pix)
-            q_flag_layout.addWidget(q_flag_label, 0, Qt.AlignCenter)
-            self.qualification_table.setCellWidget(row, 1, q_flag_container)
-
-            # Zawodnik
-            jumper_item = QTableWidgetItem(str(jumper))
-            self.qualification_table.setItem(row, 2, jumper_item)
-
-            # Odległość kwalifikacji
-            distance_item = QTableWidgetItem(format_distance_with_unit(distance))
-            distance_item.setTextAlignment(Qt.AlignCenter)
-            self.qualification_table.setItem(row, 3, distance_item)
-
-            # Punkty kwalifikacji
-            points_item = QTableWidgetItem(f"{points:.1f}")
-            points_item.setTextAlignment(Qt.AlignCenter)
-            self.qualification_table.setItem(row, 4, points_item)
-
-            # Kolorowanie awansujących
-            if row < self.qualification_limit:
-                # Nie nadpisujemy koloru tłem — użyjemy pogrubienia, by trzymać się motywu
-                for col in range(self.qualification_table.columnCount()):
-                    item = self.qualification_table.item(row, col)
-                    if item:
-                        f = item.font()
-                        f.setBold(True)
+        # Aktualizuj tabelę kwalifikacji – istniejące komórki są tylko nadpisywane
+        table = self.qualification_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(sorted_results))
+            for row, result in enumerate(sorted_results):
+                jumper = result["jumper"]
+                # Awansujący pogrubieni — bez nadpisywania koloru tła motywu
+                bold = row < self.qualification_limit
+
+                # Miejsce
+                place_item = self._table_item(table, row, 0)
+                place_item.setText(str(row + 1))
+                # Zapamiętaj pełny wynik w wierszu, by klik działał niezależnie
+                # od sortowania
+                place_item.setData(Qt.UserRole, result)
+
+                # Flaga — mniejsza, idealnie wycentrowana (tak jak w konkursie)
+                self._flag_cell_label(table, row).setPixmap(
+                    self._create_rounded_flag_pixmap(
+                        jumper.nationality, QSize(24, 16), 4
+                    )
+                )
+
+                # Zawodnik, odległość i punkty kwalifikacji
+                texts = (
+                    (2, str(jumper)),
+                    (3, format_distance_with_unit(result["distance"])),
+                    (4, f"{result['points']:.1f}"),
+                )
+                self._table_item(table, row, 2, align_center=False)
+                for col, text in texts:
+                    self._table_item(table, row, col).setText(text)
+
+                for col in (0, 2, 3, 4):
+                    item = table.item(row, col)
+                    f = item.font()
+                    if f.bold() != bold:
+                        f.setBold(bold)
                         item.setFont(f)
+        finally:
+            table.setUpdatesEnabled(True)
 
     def _start_second_round(self):
         """Rozpoczyna drugą serię zawodów"""
@@ -5461,6 +5338,7 @@ class MainWindow(QMainWindow):
         self.competition_status_label.setProperty("variant", "warning")
         self._update_competition_button("Rozpocznij II serię", variant="warning")
 
+    @pyqtSlot()
     def _on_competition_button_clicked(self):
         """Obsługa kliknięcia głównego przycisku zawodów"""
         self.play_sound()
@@ -5613,200 +5491,92 @@ class MainWindow(QMainWindow):
                 key=lambda x: (x.get("p1", 0) + x.get("p2", 0)), reverse=True
             )
 
-        self.results_table.setRowCount(len(self.competition_results))
-        for i, res in enumerate(self.competition_results):
-            jumper = res["jumper"]
-
-            # Miejsce dla top 3
-            place_item = QTableWidgetItem()
-            # Bez kolorów tła, tylko tekst i wyrównanie — minimalistycznie
-            place_item.setText(str(i + 1))
-            place_item.setTextAlignment(Qt.AlignCenter)
-            self.results_table.setItem(i, 0, place_item)
-
-            # Flaga kraju – opakowana w bezmarginesowy kontener dla idealnego centrowania
-            flag_pix = self._create_rounded_flag_pixmap(
-                jumper.nationality, size=QSize(24, 16), radius=4
-            )
-            flag_container = QWidget()
-            flag_layout = QHBoxLayout(flag_container)
-            flag_layout.setContentsMargins(0, 0, 0, 0)
-            flag_layout.setSpacing(0)
-            flag_label = QLabel()
-            if not flag_pix.isNull():
-                flag_label.setPixmap(flag_pix)
-            flag_label.setAlignment(Qt.AlignCenter)
-            flag_layout.addStretch(1)
-            flag_layout.addWidget(flag_label, 0, Qt.AlignCenter)
-            flag_layout.addStretch(1)
-            self.results_table.setCellWidget(i, 1, flag_container)
-
-            # Nazwa zawodnika (pogrubiona)
-            jumper_item = QTableWidgetItem(str(jumper))
-            f = jumper_item.font()
-            f.setBold(True)
-            jumper_item.setFont(f)
-            self.results_table.setItem(i, 2, jumper_item)
-
-            # I seria - dystans
-            d1_item = QTableWidgetItem()
-            d1_item.setText(format_distance_with_unit(res["d1"])) if res[
-                "d1"
-            ] > 0 else d1_item.setText("-")
-            d1_item.setTextAlignment(Qt.AlignCenter)
-            f = d1_item.font()
-            f.setBold(True)
-            d1_item.setFont(f)
-            self.results_table.setItem(i, 3, d1_item)
-
-            # I seria - punkty
-            p1_item = QTableWidgetItem()
-            p1_item.setText(f"{res['p1']:.1f}") if res["p1"] > 0 else p1_item.setText(
-                "-"
-            )
-            p1_item.setTextAlignment(Qt.AlignCenter)
-            f = p1_item.font()
-            f.setBold(True)
-            p1_item.setFont(f)
-            self.results_table.setItem(i, 4, p1_item)
-
-            # II seria - dystans
-            d2_item = QTableWidgetItem()
-            d2_item.setText(format_distance_with_unit(res["d2"])) if res[
-                "d2"
-            ] > 0 else d2_item.setText("-")
-            d2_item.setTextAlignment(Qt.AlignCenter)
-            f = d2_item.font()
-            f.setBold(True)
-            d2_item.setFont(f)
-            self.results_table.setItem(i, 5, d2_item)
-
-            # II seria - punkty
-            p2_item = QTableWidgetItem()
-            p2_item.setText(f"{res['p2']:.1f}") if res["p2"] > 0 else p2_item.setText(
-                "-"
-            )
-            p2_item.setTextAlignment(Qt.AlignCenter)
-            f = p2_item.font()
-            f.setBold(True)
-            p2_item.setFont(f)
-            self.results_table.setItem(i, 6, p2_item)
-
-            # Suma punktów (pogrubiona)
-            total_points = res.get("p1", 0) + res.get("p2", 0)
-            total_item = QTableWidgetItem()
-            total_item.setText(
-                f"{total_points:.1f}"
-            ) if total_points > 0 else total_item.setText("-")
-            # Pogrubiony font bez tła
-            f_total = total_item.font()
-            f_total.setBold(True)
-            total_item.setFont(f_total)
-            total_item.setTextAlignment(Qt.AlignCenter)
-            self.results_table.setItem(i, 7, total_item)
+        # Odległości obu serii zaokrąglane i formatowane jednym przebiegiem
+        d1_texts = format_distances_vec([res["d1"] for res in self.competition_results])
+        d2_texts = format_distances_vec([res["d2"] for res in self.competition_results])
+        # Komórki tworzone są raz na wiersz; po każdym skoku zmienia się tylko tekst
+        table = self.results_table
+        table.setUpdatesEnabled(False)
+        try:
+            table.setRowCount(len(self.competition_results))
+            for i, res in enumerate(self.competition_results):
+                jumper = res["jumper"]
+                total_points = res.get("p1", 0) + res.get("p2", 0)
+                texts = (
+                    # Miejsce — bez kolorów tła, tylko tekst i wyrównanie
+                    (0, str(i + 1)),
+                    (2, str(jumper)),
+                    (3, d1_texts[i] if res["d1"] > 0 else "-"),
+                    (4, f"{res['p1']:.1f}" if res["p1"] > 0 else "-"),
+                    (5, d2_texts[i] if res["d2"] > 0 else "-"),
+                    (6, f"{res['p2']:.1f}" if res["p2"] > 0 else "-"),
+                    (7, f"{total_points:.1f}" if total_points > 0 else "-"),
+                )
+                for col, text in texts:
+                    item = table.item(i, col)
+                    if item is None:
+                        item = self._table_item(table, i, col, align_center=col != 2)
+                        # Nazwisko, odległości i punkty pogrubione
+                        if col != 0:
+                            f = item.font()
+                            f.setBold(True)
+                            item.setFont(f)
+                    item.setText(text)
+
+                self._flag_cell_label(table, i).setPixmap(
+                    self._create_rounded_flag_pixmap(
+                        jumper.nationality, QSize(24, 16), 4
+                    )
+                )
+        finally:
+            table.setUpdatesEnabled(True)
 
         QApplication.processEvents()
 
-    def start_zoom_animation(self, ax, plot_elements):
-        if not hasattr(self, "positions") or not self.positions:
-            return
-        final_x, final_y = self.positions[-1]
-        zoom_frames = 10
-        initial_xlim, initial_ylim = ax.get_xlim(), ax.get_ylim()
-        final_xlim = (final_x - 10, final_x + 10)
-        final_ylim = (final_y - 10, final_y + 10)
-
-        def zoom_update(frame):
-            if frame >= zoom_frames:
-                ax.set_xlim(final_xlim)
-                ax.set_ylim(final_ylim)
-                self.canvas.draw_idle()
-                if hasattr(self, "zoom_ani") and self.zoom_ani is not None:
-                    try:
-                        if (
-                            hasattr(self.zoom_ani, "event_source")
-                            and self.zoom_ani.event_source is not None
-                        ):
-                            self.zoom_ani.event_source.stop()
-                    except Exception:
-                        pass
-                    self.zoom_ani = None
-                return
-            t = frame / zoom_frames
-            new_xlim = (
-                initial_xlim[0] + t * (final_xlim[0] - initial_xlim[0]),
-                initial_xlim[1] + t * (final_xlim[1] - initial_xlim[1]),
-            )
-            new_ylim = (
-                initial_ylim[0] + t * (final_ylim[0] - initial_ylim[0]),
-                initial_ylim[1] + t * (final_ylim[1] - initial_ylim[1]),
-            )
-            ax.set_xlim(new_xlim)
-            ax.set_ylim(new_ylim)
-            self.canvas.draw_idle()
-            return
-
-        self.zoom_ani = animation.FuncAnimation(
-            self.figure,
-            zoom_update,
-            frames=zoom_frames + 1,
-            interval=50,
-            blit=False,
-            repeat=False,
-        )
-        self.canvas.draw()
-
     def _create_series_summary_card(
         self, seria_name, distance, points, difference, k_point, meter_value
     ):
         """Tworzy kartę z podsumowaniem dla pojedynczej serii w widoku sumy punktów."""
-        card = QWidget()
-        card.setProperty("class", "card")
-
-        layout = QVBoxLayout(card)
-        layout.setSpacing(5)
+        card, layout = self._new_breakdown_card(f"📊 {seria_name}", spacing=5)
 
-        title = QLabel(f"📊 {seria_name}")
-        title.setProperty("chip", True)
-        title.setProperty("variant", "primary")
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
-
-        # Details in a grid-like format
-        details_layout = QFormLayout()
-        details_layout.setContentsMargins(0, 0, 0, 0)
-        details_layout.setSpacing(5)
+        # Szczegóły w stałej siatce 4x2 (etykieta | wartość)
+        details_layout = self._make_details_layout()
 
         # Distance
         dist_label = QLabel("Odległość:")
         dist_value = QLabel(format_distance_with_unit(distance))
         dist_value.setProperty("class", "metric")
-        details_layout.addRow(dist_label, dist_value)
+        details_layout.addWidget(dist_label, 0, 0)
+        details_layout.addWidget(dist_value, 0, 1)
 
         # Difference from K-point
         diff_label = QLabel("Różnica od K-point:")
-        diff_value = QLabel(f"{difference:+.1f} m")
+        diff_value = QLabel("%+.1f m" % difference)
         diff_value.setProperty("class", "metric")
-        details_layout.addRow(diff_label, diff_value)
+        details_layout.addWidget(diff_label, 1, 0)
+        details_layout.addWidget(diff_value, 1, 1)
 
         # Points for distance
         dist_points_label = QLabel("Punkty za odległość:")
-        dist_points_value = QLabel(f"{60.0 + (difference * meter_value):.1f} pkt")
+        dist_points_value = QLabel("%.1f pkt" % (60.0 + difference * meter_value))
         dist_points_value.setProperty("chip", True)
         dist_points_value.setProperty("variant", "success")
-        details_layout.addRow(dist_points_label, dist_points_value)
+        details_layout.addWidget(dist_points_label, 2, 0)
+        details_layout.addWidget(dist_points_value, 2, 1)
 
         # Total points for series
         total_series_points_label = QLabel("Suma punktów serii:")
-        total_series_points_value = QLabel(f"{points:.1f} pkt")
+        total_series_points_value = QLabel("%.1f pkt" % points)
         total_series_points_value.setProperty("chip", True)
         total_series_points_value.setProperty("variant", "success")
         total_series_points_value.setAlignment(Qt.AlignCenter)
-        details_layout.addRow(total_series_points_label, total_series_points_value)
+        details_layout.addWidget(total_series_points_label, 3, 0)
+        details_layout.addWidget(total_series_points_value, 3, 1)
 
         layout.addLayout(details_layout)
         self.points_breakdown_layout.addWidget(card)
 
+    @pyqtSlot()
     def _jump_replay_back_navigation(self):
         """Handle back navigation from jump replay page based on context."""
         if (
@@ -5823,6 +5593,7 @@ class MainWindow(QMainWindow):
             # If we came from competition, go back to competition page
             self.central_widget.setCurrentIndex(self.COMPETITION_IDX)
 
+    @pyqtSlot()
     def _points_breakdown_back_navigation(self):
         """Handle back navigation from points breakdown page based on context."""
         if (
@@ -5843,6 +5614,8 @@ class MainWindow(QMainWindow):
 class Judge:
     """Reprezentuje pojedynczego sędziego"""
 
+    __slots__ = ("judge_id", "name")
+
     def __init__(self, judge_id: int):
         self.judge_id = judge_id
         self.name = f"Sędzia {judge_id}"
@@ -5854,6 +5627,7 @@ class Judge:
         hill_size: float,
         telemark_landing: bool = False,
         hill=None,
+        k_point: Optional[float] = None,
     ) -> float:
         """
         Ocenia skok w skali 14-20 punktów.
@@ -5863,62 +5637,34 @@ class Judge:
             distance: Odległość skoku
             hill_size: Rozmiar skoczni (HS)
             telemark_landing: Czy lądowanie telemarkiem
+            k_point: Punkt K wyliczony wcześniej przez panel (opcjonalnie)
 
         Returns:
             Nota sędziego (14.0-20.0)
         """
         # Potrzebujemy dostępu do punktu K skoczni
-        if hill is not None:
-            k_point = hill.K
-        else:
-            # Fallback - przybliżenie punktu K jako 90% HS
-            k_point = hill_size * 0.9
+        if k_point is None:
+            if hill is not None:
+                k_point = hill.K
+            else:
+                # Fallback - przybliżenie punktu K jako 90% HS
+                k_point = hill_size * 0.9
 
-        # Określ położenie względem punktów K i HS
-        is_before_k = distance < k_point
-        is_at_or_after_k = distance >= k_point
-        is_before_hs = distance < hill_size
-        is_at_or_after_hs = distance >= hill_size
+        # Bonus za odległość: +1 na/za K, kolejne +1 na/za HS
+        bonus = (distance >= k_point) + (distance >= hill_size)
 
         if telemark_landing:
             # Z telemarkiem - interpolacja na podstawie statystyki Telemark
-            telemark_factor = jumper.telemark / 100.0
-
-            # Bazowa ocena zależna od statystyki Telemark
             # Telemark 0 → 16, Telemark 100 → 17
-            base_score = 16.0 + (telemark_factor * 1.0)
-
-            # Bonus za odległość
-            if is_before_k:
-                # Przed K - bez bonusu
-                final_base = base_score
-            elif is_at_or_after_k and is_before_hs:
-                # Na lub za K, ale przed HS - bonus +1
-                final_base = base_score + 1.0
-            elif is_at_or_after_hs:
-                # Na lub za HS - bonus +2
-                final_base = base_score + 2.0
-            else:
-                final_base = base_score
-
-            # Odchylenie ±1
-            score = random.uniform(final_base - 1.0, final_base + 1.0)
+            base_score = 16.0 + jumper.telemark_factor
         else:
-            # Bez telemarku - nie zależy od statystyki Telemark
-            if is_before_k:
-                # Przed K - bazowa ocena 14
-                base_score = 14.0
-            elif is_at_or_after_k and is_before_hs:
-                # Na lub za K, ale przed HS - bonus +1
-                base_score = 15.0
-            elif is_at_or_after_hs:
-                # Na lub za HS - bonus +2
-                base_score = 16.0
-            else:
-                base_score = 14.0
+            # Bez telemarku - nie zależy od statystyki Telemark (bazowo 14)
+            base_score = 14.0
 
-            # Odchylenie ±1
-            score = random.uniform(base_score - 1.0, base_score + 1.0)
+        final_base = base_score + bonus
+
+        # Odchylenie ±1
+        score = random.uniform(final_base - 1.0, final_base + 1.0)
 
         # Ogranicz do zakresu 14-20
         score = max(14.0, min(20.0, score))
@@ -5991,22 +5737,23 @@ class JudgePanel:
                 jumper, distance, hill_size
             )
             telemark_landing = random.random() < telemark_chance
+            # Punkt K jest wspólny dla wszystkich sędziów – wylicz go raz
+            k_point = hill.K if hill is not None else hill_size * 0.9
             for judge in self.judges:
                 score = judge.score_jump(
-                    jumper, distance, hill_size, telemark_landing, hill
+                    jumper, distance, hill_size, telemark_landing, hill, k_point
                 )
                 judge_scores.append(score)
 
-        # Usuń najwyższą i najniższą notę
-        judge_scores.sort()
-        final_scores = judge_scores[1:-1]
+        # Usuń najwyższą i najniższą notę (bez sortowania całej listy)
+        lowest = min(judge_scores)
+        highest = max(judge_scores)
 
         # Suma not (bez najwyższej i najniższej)
-        total_judge_score = sum(final_scores)
+        total_judge_score = sum(judge_scores) - lowest - highest
 
         return {
             "all_scores": judge_scores,
-            "final_scores": final_scores,
             "total_score": total_judge_score,
             "event": event,
             # Jeśli SAFE, dołącz kontekst telemarku (dla spójności UI)
@@ -6033,8 +5780,7 @@ class JudgePanel:
             Szansa na telemark (0.0-1.0)
         """
         # Interpolacja szansy na podstawie telemarku (50%→100%)
-        telemark_factor = jumper.telemark / 100.0
-        base_chance = 0.50 + (telemark_factor * 0.50)
+        base_chance = 0.50 + (jumper.telemark_factor * 0.50)
 
         # Spadek 2.5 p.p. za każdy pełny 1 m za HS (zgodnie z ustaleniami)
         if distance > hill_size:
@@ -6046,6 +5792,9 @@ class JudgePanel:
 
 
 if __name__ == "__main__":
+    # Wymagane dla puli procesów w wersji .exe (PyInstaller)
+    multiprocessing.freeze_support()
+
     app = QApplication(sys.argv)
 
     app.setStyle("Fusion")
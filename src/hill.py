@@ -3,14 +3,65 @@
 # Nazewnictwo według nomenklatury FIS
 # https://assets.fis-ski.com/f/252177/5ba64e29f2/construction-norm-2018-2.pdf
 
+import itertools
 import math
 import numpy as np
 import scipy.optimize as so
 
+# Numery wersji parametrów – klucz pamięci podręcznej wyników symulacji
+_versions = itertools.count(1)
+
 
 class Hill:
     """Wprowadzamy atrybuty skoczni"""
 
+    __slots__ = (
+        "name",
+        "country",
+        "e1",
+        "e2",
+        "gates",
+        "t",
+        "gamma_deg",
+        "alpha_deg",
+        "r1",
+        "h",
+        "n",
+        "s",
+        "l1",
+        "l2",
+        "a_finish",
+        "betaP_deg",
+        "beta_deg",
+        "betaL_deg",
+        "P",
+        "K",
+        "L",
+        "Zu",
+        "inrun_friction_coefficient",
+        "_ver",
+        "_display_name",
+        # --- atrybuty pochodne (recalculate_derived_attributes) ---
+        "gamma_rad",
+        "alpha_rad",
+        "betaP_rad",
+        "beta_rad",
+        "betaL_rad",
+        "es",
+        "gate_diff",
+        "r1_min",
+        "clothoid_length",
+        "clothoid_parameter",
+        "landing_segment_boundaries",
+        "a_landing1",
+        "b_landing1",
+        "c_landing1",
+        "d_landing1",
+        "a_landing2",
+        "b_landing2",
+        "c_landing2",
+    )
+
     def __init__(
         self,
         name: str,  # Nazwa skoczni
@@ -60,6 +111,8 @@ class Hill:
         self.L = L
         self.Zu = Zu
         self.inrun_friction_coefficient = inrun_friction_coefficient
+        self._ver = next(_versions)
+        self._display_name = None
 
         # Oblicz wszystkie atrybuty pochodne
         self.recalculate_derived_attributes()
@@ -200,10 +253,39 @@ class Hill:
         else:
             return self.a_landing2 * x**2 + self.b_landing2 * x + self.c_landing2
 
+    def mark_modified(self):
+        """Nadaje nową wersję po edycji parametrów (unieważnia zapamiętane skoki)."""
+        self._ver = next(_versions)
+        self._display_name = None
+
+    @property
+    def display_name(self) -> str:
+        """Nazwa z punktem K i HS – formatowana raz, aż do następnej edycji."""
+        if self._display_name is None:
+            k_point = int(self.K) if self.K == int(self.K) else self.K
+            hill_size = int(self.L) if self.L == int(self.L) else self.L
+            self._display_name = f"{self.name} K-{k_point} HS{hill_size}"
+        return self._display_name
+
+    def __deepcopy__(self, memo):
+        """Szybka kopia: pola to liczby/napisy, jedynie słownik granic zeskoku jest kopiowany."""
+        new = Hill.__new__(Hill)
+        memo[id(self)] = new
+        for attr in Hill.__slots__:
+            try:
+                setattr(new, attr, getattr(self, attr))
+            except AttributeError:
+                # Pole nieustawione – zostaw puste jak w oryginale
+                continue
+        new.landing_segment_boundaries = dict(self.landing_segment_boundaries)
+        return new
+
+    def clone(self) -> "Hill":
+        """Kopia do edytora – bez narzutu copy.deepcopy (memo, dispatch)."""
+        return self.__deepcopy__({})
+
     def __str__(self):
-        k_point = int(self.K) if self.K == int(self.K) else self.K
-        hill_size = int(self.L) if self.L == int(self.L) else self.L
-        return f"{self.name} K-{k_point} HS{hill_size}"
+        return self.display_name
 
     def to_dict(self):
         """Konwertuje obiekt Hill do słownika w celu serializacji do JSON."""
@@ -1,9 +1,47 @@
 """Klasa skoczek"""
 
+import itertools
+
+# Numery wersji parametrów – klucz pamięci podręcznej wyników symulacji
+_versions = itertools.count(1)
+
 
 class Jumper:
     """Wprowadzamy atrybuty skoczka"""
 
+    __slots__ = (
+        "name",
+        "last_name",
+        "nationality",
+        "mass",
+        "height",
+        "inrun_drag_coefficient",
+        "inrun_frontal_area",
+        "inrun_lift_coefficient",
+        "takeoff_drag_coefficient",
+        "takeoff_frontal_area",
+        "takeoff_lift_coefficient",
+        "jump_force",
+        "flight_drag_coefficient",
+        "flight_frontal_area",
+        "flight_lift_coefficient",
+        "landing_drag_coefficient",
+        "landing_frontal_area",
+        "landing_lift_coefficient",
+        "_telemark",
+        "telemark_factor",
+        "stability",
+        "timing",
+        "inrun_position",
+        "takeoff_force",
+        "flight_technique",
+        "flight_style",
+        "flight_resistance",
+        "last_timing_info",
+        "_ver",
+        "_display_name",
+    )
+
     def __init__(
         self,
         name: str,  # Imię
@@ -71,8 +109,54 @@ class Jumper:
             None  # Będzie obliczane na podstawie flight_drag_coefficient
         )
 
+        # Informacja o timingu ostatniego wybicia (ustawiana przez fly_simulation)
+        self.last_timing_info = None
+
+        self._ver = next(_versions)
+        self._display_name = None
+
+    @property
+    def telemark(self) -> float:
+        return self._telemark
+
+    @telemark.setter
+    def telemark(self, value: float):
+        # Współczynnik 0-1 używany przy ocenie lądowania – liczony raz przy zmianie
+        self._telemark = value
+        self.telemark_factor = value / 100.0
+
+    def mark_modified(self):
+        """Nadaje nową wersję po edycji parametrów (unieważnia zapamiętane skoki)."""
+        self._ver = next(_versions)
+        self._display_name = None
+
+    @property
+    def display_name(self) -> str:
+        """Imię i nazwisko – formatowane raz, aż do następnej edycji (mark_modified)."""
+        if self._display_name is None:
+            self._display_name = f"{self.name} {self.last_name}"
+        return self._display_name
+
+    def __deepcopy__(self, memo):
+        """Szybka kopia: wszystkie pola to liczby/napisy (poza słownikiem timingu)."""
+        new = Jumper.__new__(Jumper)
+        memo[id(self)] = new
+        for attr in Jumper.__slots__:
+            try:
+                setattr(new, attr, getattr(self, attr))
+            except AttributeError:
+                # Pole nieustawione – zostaw puste jak w oryginale
+                continue
+        if new.last_timing_info is not None:
+            new.last_timing_info = dict(new.last_timing_info)
+        return new
+
+    def clone(self) -> "Jumper":
+        """Kopia do edytora – bez narzutu copy.deepcopy (memo, dispatch)."""
+        return self.__deepcopy__({})
+
     def __str__(self):
-        return f"{self.name} {self.last_name}"
+        return self.display_name
 
     def to_dict(self):
         """Konwertuje obiekt Jumper do słownika w celu serializacji do JSON."""
@@ -16,10 +16,16 @@ except Exception:  # Headless / tests without Qt
             print(f"[CRITICAL] {title}:\n{message}")
 
 
+try:
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except ImportError:  # Opcjonalna zależność – standardowy json wystarcza
+    _json_loads = json.loads
+
 from src.hill import Hill
 from src.jumper import Jumper
 from utils.constants import GRAVITY, AIR_DENSITY
-from utils.helpers import gravity_force_parallel, friction_force, drag_force
 
 
 def get_data_path(filename):
@@ -40,8 +46,9 @@ def load_data_from_json():
     """Wczytuje dane skoczków i skoczni z jednego, zewnętrznego pliku data.json."""
     try:
         data_path = get_data_path("data.json")
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Odczyt bajtów: orjson (jeśli zainstalowany) i json.loads przyjmują UTF-8 wprost
+        with open(data_path, "rb") as f:
+            data = _json_loads(f.read())
 
         hills = [Hill(**h) for h in data["hills"]]
         jumpers = [Jumper(**j) for j in data["jumpers"]]
@@ -82,27 +89,35 @@ def inrun_simulation(
     # Domyślnie 3 m, ale przy wczesnym timingu możemy wejść wcześniej (zwiększone opory wcześniej).
     aero_switch_distance = 3.0 + max(0.0, early_takeoff_aero_shift_m)
 
+    # Stałe pętli liczone raz – w pętli zostają tylko zmienne lokalne
+    # (te same wzory co gravity_force_parallel / friction_force / drag_force).
+    mass = Jumper.mass
+    weight = mass * GRAVITY
+    friction_coefficient = Hill.inrun_friction_coefficient
+    inrun_drag = (
+        0.5 * AIR_DENSITY * Jumper.inrun_drag_coefficient * Jumper.inrun_frontal_area
+    )
+    takeoff_drag = (
+        0.5
+        * AIR_DENSITY
+        * Jumper.takeoff_drag_coefficient
+        * Jumper.takeoff_frontal_area
+    )
+    get_inrun_angle = Hill.get_inrun_angle
+    sin = math.sin
+    cos = math.cos
+
     while distance_to_takeoff > 0:
-        current_angle = Hill.get_inrun_angle(distance_to_takeoff)
-        g_force = gravity_force_parallel(Jumper.mass, current_angle)
-        f_force = friction_force(
-            Hill.inrun_friction_coefficient, Jumper.mass, current_angle
-        )
+        current_angle = get_inrun_angle(distance_to_takeoff)
         # W ostatnich metrach przełączamy na większe opory pozycji wybicia.
-        use_inrun_aero = distance_to_takeoff > aero_switch_distance
-        d_force = drag_force(
-            current_velocity,
-            Jumper.inrun_drag_coefficient
-            if use_inrun_aero
-            else Jumper.takeoff_drag_coefficient,
-            Jumper.inrun_frontal_area
-            if use_inrun_aero
-            else Jumper.takeoff_frontal_area,
-        )
+        drag = inrun_drag if distance_to_takeoff > aero_switch_distance else takeoff_drag
 
-        net_force = g_force - f_force - d_force
-        acceleration = net_force / Jumper.mass
-        current_velocity += acceleration * time_step
+        net_force = (
+            weight * sin(current_angle)
+            - friction_coefficient * weight * cos(current_angle)
+            - drag * current_velocity * current_velocity
+        )
+        current_velocity += net_force / mass * time_step
         distance_to_takeoff -= current_velocity * time_step
 
     return current_velocity
@@ -215,36 +230,32 @@ def fly_simulation(
     time_step = 0.01
     max_hill_length = Hill.n + Hill.a_finish + 50
 
+    # Składowe sił liczone bez atan2/sin/cos: kierunek lotu to (vx, vy) / |v|,
+    # więc np. F_drag_x = -k * |v|^2 * vx / |v| = -k * |v| * vx.
+    mass = Jumper.mass
+    force_g_y = -mass * GRAVITY
+    drag_factor = (
+        0.5 * AIR_DENSITY * Jumper.flight_drag_coefficient * Jumper.flight_frontal_area
+    )
+    lift_factor = 0.5 * AIR_DENSITY * effective_cl * Jumper.flight_frontal_area
+    y_landing = Hill.y_landing
+    sqrt = math.sqrt
+
     while (
-        current_position_y > Hill.y_landing(current_position_x)
+        current_position_y > y_landing(current_position_x)
         and current_position_x < max_hill_length
     ):
-        total_velocity = math.sqrt(current_velocity_x**2 + current_velocity_y**2)
-        angle_of_flight_rad = math.atan2(current_velocity_y, current_velocity_x)
-        force_g_y = -Jumper.mass * GRAVITY
-
-        force_drag_magnitude = (
-            0.5
-            * AIR_DENSITY
-            * Jumper.flight_drag_coefficient
-            * Jumper.flight_frontal_area
-            * total_velocity**2
-        )
-        force_drag_x = -force_drag_magnitude * math.cos(angle_of_flight_rad)
-        force_drag_y = -force_drag_magnitude * math.sin(angle_of_flight_rad)
-
-        force_lift_magnitude = (
-            0.5
-            * AIR_DENSITY
-            * effective_cl
-            * Jumper.flight_frontal_area
-            * total_velocity**2
+        total_velocity = sqrt(
+            current_velocity_x * current_velocity_x
+            + current_velocity_y * current_velocity_y
         )
-        force_lift_x = -force_lift_magnitude * math.sin(angle_of_flight_rad)
-        force_lift_y = force_lift_magnitude * math.cos(angle_of_flight_rad)
+        drag = drag_factor * total_velocity
+        lift = lift_factor * total_velocity
 
-        acceleration_x = (force_drag_x + force_lift_x) / Jumper.mass
-        acceleration_y = (force_g_y + force_drag_y + force_lift_y) / Jumper.mass
+        acceleration_x = (-drag * current_velocity_x - lift * current_velocity_y) / mass
+        acceleration_y = (
+            force_g_y - drag * current_velocity_y + lift * current_velocity_x
+        ) / mass
 
         current_velocity_x += acceleration_x * time_step
         current_velocity_y += acceleration_y * time_step
@@ -252,3 +263,36 @@ def fly_simulation(
         current_position_y += current_velocity_y * time_step
 
     return current_position_x
+
+
+def highest_safe_gate(Hill, Jumper, start_gate=None):
+    """
+    Szuka (od góry) najwyższej belki, z której skoczek nie przekracza HS.
+
+    Zwraca krotkę (belka, odległość); (0, None) gdy żadna belka nie jest bezpieczna.
+    Cały skan jednego zawodnika to jedno wywołanie – wygodne do zlecania w puli.
+    Skoki liczone są z idealnym timingiem, więc wynik zależy tylko od skoczni,
+    skoczka i belki startowej (i może być zapamiętany).
+    """
+    start_gate = Hill.gates if start_gate is None else start_gate
+    for gate in range(start_gate, 0, -1):
+        try:
+            distance = fly_simulation(
+                Hill, Jumper, gate_number=gate, perfect_timing=True
+            )
+        except Exception:
+            # Błąd symulacji – traktuj belkę jako niebezpieczną
+            continue
+        if distance <= Hill.L:
+            return gate, distance
+    return 0, None
+
+
+def warm_up():
+    """
+    Zadanie-rozgrzewka dla procesów roboczych puli symulacji.
+
+    Samo uruchomienie w nowym procesie importuje ten moduł (wraz z NumPy/SciPy),
+    więc pierwszy skan belek nie płaci kosztu startu procesów.
+    """
+    return True
@@ -1,9 +1,27 @@
 from .animations import AnimatedStackedWidget
-from .components import NavigationSidebar, ModernComboBox, ModernSlider
+from .components import (
+    CardButton,
+    CenteredIconDelegate,
+    FlagListModel,
+    HistoryDetailModel,
+    HistoryTableModel,
+    JumperListModel,
+    NavigationSidebar,
+    ModernComboBox,
+    ModernSlider,
+    TrajectoryView,
+)
 
 __all__ = [
     "AnimatedStackedWidget",
+    "CardButton",
+    "CenteredIconDelegate",
+    "FlagListModel",
+    "HistoryDetailModel",
+    "HistoryTableModel",
+    "JumperListModel",
     "NavigationSidebar",
     "ModernComboBox",
     "ModernSlider",
+    "TrajectoryView",
 ]
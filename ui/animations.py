@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from PySide6.QtCore import QEasingCurve, QPropertyAnimation, QRect
 from PySide6.QtWidgets import QGraphicsOpacityEffect, QStackedWidget, QWidget
@@ -18,8 +18,32 @@ class AnimatedStackedWidget(QStackedWidget):
         self._animation_duration_ms: int = animation_ms
         self._active_animations: List[QPropertyAnimation] = []
         self._transition_running: bool = False
+        self._lazy_builders: Dict[int, Callable[[], QWidget]] = {}
+
+    def add_lazy_page(self, builder: Callable[[], QWidget]) -> int:
+        """
+        Rezerwuje indeks strony pustym widgetem. Właściwą stronę tworzy
+        builder() przy pierwszym przełączeniu na ten indeks.
+        """
+        index = self.addWidget(QWidget())
+        self._lazy_builders[index] = builder
+        return index
+
+    def ensure_page(self, index: int) -> None:
+        """Buduje stronę o danym indeksie, jeśli wciąż jest zastępcza."""
+        builder = self._lazy_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.widget(index)
+        was_current = self.currentIndex() == index
+        self.insertWidget(index, builder())
+        if was_current:
+            super().setCurrentIndex(index)
+        self.removeWidget(placeholder)
+        placeholder.deleteLater()
 
     def setCurrentIndex(self, index: int) -> None:  # type: ignore[override]
+        self.ensure_page(index)
         if self._transition_running:
             # Jeśli animacja trwa, zakończ natychmiast i przełącz
             super().setCurrentIndex(index)
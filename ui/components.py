@@ -1,9 +1,32 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt, QPointF, QRectF
-from PySide6.QtGui import QColor, QPainter, QPen, QBrush, QPalette
+import numpy as np
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QAbstractTableModel,
+    QModelIndex,
+    QPointF,
+    QRectF,
+    QSize,
+    QTimer,
+    QElapsedTimer,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QIcon,
+    QPainter,
+    QPen,
+    QBrush,
+    QPalette,
+    QPixmap,
+    QPolygonF,
+)
 from PySide6.QtWidgets import (
     QLabel,
     QPushButton,
@@ -11,6 +34,10 @@ from PySide6.QtWidgets import (
     QWidget,
     QComboBox,
     QSlider,
+    QSizePolicy,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
 )
 
 
@@ -57,6 +84,38 @@ class NavigationSidebar(QWidget):
             b.setChecked(b is btn)
 
 
+class CardButton(QPushButton):
+    """
+    Karta menu startowego: tytuł i podpis w układzie pionowym.
+
+    Jako QPushButton dostaje sygnał clicked; jak dawne karty-widgety nie
+    przyjmuje fokusu. Etykiety przepuszczają kliknięcia do przycisku.
+    """
+
+    def __init__(self, text: str, sub: str, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setProperty("class", "cardButton")
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setMinimumSize(280, 120)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(24, 28, 24, 20)
+        layout.setSpacing(8)
+        # Odstęp u góry dla lepszej symetrii
+        layout.addSpacing(4)
+
+        for label_text, css_class in ((text, "cardMainText"), (sub, "cardSubText")):
+            label = QLabel(label_text)
+            label.setProperty("class", css_class)
+            label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+            label.setWordWrap(True)
+            label.setAttribute(Qt.WA_TransparentForMouseEvents)
+            layout.addWidget(label)
+        layout.addStretch()
+
+
 class ModernComboBox(QComboBox):
     """
     QComboBox z własnym rysowaniem strzałki (chevron), aby uniknąć problemów
@@ -248,3 +307,593 @@ class ModernSlider(QSlider):
             )
 
         p.end()
+
+
+class TrajectoryView(QWidget):
+    """
+    Animowany podgląd trajektorii skoku malowany bezpośrednio QPainterem.
+
+    Współrzędne (w metrach) przeliczane są na piksele tylko przy zmianie danych
+    lub rozmiaru; klatka animacji to kilka drawPolyline zamiast przerysowania
+    całej figury Matplotlib. Odsłaniane linie (zeskok, ślad lotu) trzymane są
+    w buforach QPolygonF, do których klatka dopisuje tylko nowe punkty.
+    """
+
+    # Obszar wykresu jak w domyślnym układzie figury Matplotlib (left, bottom, right, top)
+    _AXES_BOX = (0.125, 0.11, 0.9, 0.88)
+    # Grubości linii podane w punktach (jak w Matplotlib przy 100 dpi)
+    _PT = 100.0 / 72.0
+    # Jedna klatka = jeden krok symulacji (0.01 s) wyświetlany przez 8 ms
+    _FRAME_MS = 8
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._background = QColor("#0f1115")
+        self._axes_background = QColor("#0f1115")
+
+        empty = np.empty((0, 2))
+        self._inrun = empty
+        self._landing = empty
+        self._positions = empty
+        self._xlim = (0.0, 1.0)
+        self._ylim = (0.0, 1.0)
+        self._inrun_px = QPolygonF()
+        self._landing_px: list[QPointF] = []
+        self._trail_px: list[QPointF] = []
+        self._landing_poly = QPolygonF()
+        self._trail_poly = QPolygonF()
+
+        # Pióra stałe dla wszystkich klatek
+        self._inrun_pen = self._pen("#4c84ff", 2.5)
+        self._landing_pen = self._pen("#4c84ff", 3, 0.8)
+        self._trail_pen = self._pen("#5b90ff", 2.5, 0.7)
+        self._marker_pen = self._pen("#4c84ff", 1.5)
+        self._marker_brush = QColor("#e8eaf1")
+
+        self._frame = 0
+        self._frame_count = 0
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._advance)
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+    def sizeHint(self):  # noqa: N802 - Qt API
+        return QSize(640, 480)
+
+    def set_background_color(self, color) -> None:
+        self._background = QColor(color)
+        self.update()
+
+    def set_trajectory(self, inrun, landing, positions, xlim, ylim) -> None:
+        """
+        Ustawia dane i odtwarza animację od początku.
+
+        inrun, landing i positions to sekwencje punktów (x, y) w metrach;
+        xlim/ylim to zakresy osi widocznego obszaru.
+        """
+        self._inrun = np.asarray(inrun, dtype=float).reshape(-1, 2)
+        self._landing = np.asarray(landing, dtype=float).reshape(-1, 2)
+        self._positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self._xlim = (float(xlim[0]), float(xlim[1]))
+        self._ylim = (float(ylim[0]), float(ylim[1]))
+        self._frame_count = max(len(self._positions), len(self._landing))
+        self._frame = 0
+        self._map_to_pixels()
+
+        self._clock.start()
+        self._timer.start()
+        self.update()
+
+    def stop(self) -> None:
+        """Zatrzymuje animację (ostatnia klatka zostaje na ekranie)."""
+        self._timer.stop()
+
+    def clear(self) -> None:
+        self.stop()
+        empty = np.empty((0, 2))
+        self._inrun = self._landing = self._positions = empty
+        self._frame = self._frame_count = 0
+        self._map_to_pixels()
+        self.update()
+
+    def _axes_rect(self) -> QRectF:
+        left, bottom, right, top = self._AXES_BOX
+        w, h = self.width(), self.height()
+        return QRectF(left * w, (1.0 - top) * h, (right - left) * w, (top - bottom) * h)
+
+    def _to_pixels(self, points: np.ndarray) -> list[QPointF]:
+        if not len(points):
+            return []
+        rect = self._axes_rect()
+        x0, x1 = self._xlim
+        y0, y1 = self._ylim
+        px = rect.left() + (points[:, 0] - x0) * (rect.width() / ((x1 - x0) or 1.0))
+        py = rect.top() + (y1 - points[:, 1]) * (rect.height() / ((y1 - y0) or 1.0))
+        return [QPointF(x, y) for x, y in zip(px.tolist(), py.tolist())]
+
+    def _map_to_pixels(self) -> None:
+        self._inrun_px = QPolygonF(self._to_pixels(self._inrun))
+        self._landing_px = self._to_pixels(self._landing)
+        self._trail_px = self._to_pixels(self._positions)
+        # Bufory odsłoniętych linii budowane od nowa w nowej skali
+        self._landing_poly = QPolygonF()
+        self._trail_poly = QPolygonF()
+
+    @staticmethod
+    def _grow(poly: QPolygonF, points: list[QPointF], count: int) -> None:
+        """Dopisuje do bufora punkty aż do count (bez kopiowania całej linii)."""
+        for i in range(poly.size(), count):
+            poly.append(points[i])
+
+    def _advance(self) -> None:
+        # Klatka wynika z upływu czasu, więc tempo nie zależy od obciążenia UI
+        frame = self._clock.elapsed() // self._FRAME_MS
+        if frame >= self._frame_count:
+            frame = self._frame_count
+            self._timer.stop()
+        if frame != self._frame:
+            self._frame = frame
+            self.update()
+
+    def resizeEvent(self, event):  # noqa: N802 - Qt API
+        self._map_to_pixels()
+        super().resizeEvent(event)
+
+    def _pen(self, color: str, width_pt: float, alpha: float = 1.0) -> QPen:
+        qcolor = QColor(color)
+        qcolor.setAlphaF(alpha)
+        pen = QPen(qcolor, width_pt * self._PT)
+        pen.setCapStyle(Qt.SquareCap)
+        pen.setJoinStyle(Qt.RoundJoin)
+        return pen
+
+    def paintEvent(self, event):  # noqa: N802 - Qt API
+        p = QPainter(self)
+        p.fillRect(self.rect(), self._background)
+        axes_rect = self._axes_rect()
+        p.fillRect(axes_rect, self._axes_background)
+        if not self._frame_count:
+            p.end()
+            return
+
+        p.setRenderHint(QPainter.Antialiasing, True)
+        p.setClipRect(axes_rect)
+
+        # Najazd – zawsze w całości
+        if not self._inrun_px.isEmpty():
+            p.setPen(self._inrun_pen)
+            p.drawPolyline(self._inrun_px)
+
+        # Zeskok odsłaniany razem z lotem
+        landing_count = min(self._frame, len(self._landing_px))
+        if landing_count > 1:
+            p.setPen(self._landing_pen)
+            self._grow(self._landing_poly, self._landing_px, landing_count)
+            p.drawPolyline(self._landing_poly)
+
+        # Ślad lotu i zawodnik
+        trail_count = min(self._frame + 1, len(self._trail_px))
+        if trail_count:
+            if trail_count > 1:
+                p.setPen(self._trail_pen)
+                self._grow(self._trail_poly, self._trail_px, trail_count)
+                p.drawPolyline(self._trail_poly)
+            radius = 3.5 * self._PT
+            p.setPen(self._marker_pen)
+            p.setBrush(self._marker_brush)
+            p.drawEllipse(self._trail_px[trail_count - 1], radius, radius)
+
+        p.end()
+
+
+class JumperListModel(QAbstractListModel):
+    """
+    Model listy wyboru zawodników (nazwa, flaga, pole wyboru).
+
+    Dane trzymane są poza Qt: lista zawodników i bytearray stanów zaznaczenia.
+    Widok rysuje tylko widoczne wiersze, a zaznaczenie wszystkich to jedno
+    przypisanie i jeden sygnał dataChanged zamiast setCheckState na każdym
+    elemencie.
+    """
+
+    # Zawodnik, którego pole wyboru zmienił użytkownik, i jego nowy stan
+    check_changed = Signal(object, bool)
+    # Wspólne flagi wszystkich wierszy, liczone raz zamiast przy każdym flags()
+    _ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def __init__(
+        self,
+        icon_provider: Callable[[str], QIcon],
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent)
+        self._icon_provider = icon_provider
+        self._jumpers: list = []
+        self._checked = bytearray()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._jumpers)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        jumper = self._jumpers[index.row()]
+        if role == Qt.DisplayRole:
+            return jumper.display_name
+        if role == Qt.DecorationRole:
+            return self._icon_provider(jumper.nationality)
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[index.row()] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return jumper
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.Checked
+        row = index.row()
+        if bool(self._checked[row]) == checked:
+            return True
+        self._checked[row] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_changed.emit(self._jumpers[row], checked)
+        return True
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self._ITEM_FLAGS
+
+    def set_jumpers(self, jumpers, checked=()) -> None:
+        """Podmienia zawodników; zaznaczeni zostają ci obecni w `checked`."""
+        checked_ids = {id(j) for j in checked}
+        self.beginResetModel()
+        self._jumpers = list(jumpers)
+        self._checked = bytearray(id(j) in checked_ids for j in self._jumpers)
+        self.endResetModel()
+
+    def jumpers(self) -> list:
+        return list(self._jumpers)
+
+    def jumper(self, row: int):
+        return self._jumpers[row]
+
+    def checked_jumpers(self) -> list:
+        return [j for j, c in zip(self._jumpers, self._checked) if c]
+
+    def checked_count(self) -> int:
+        return self._checked.count(1)
+
+    def set_all_checked(self, checked: bool) -> None:
+        """Zaznacza lub odznacza wszystkich bez sygnału check_changed."""
+        if not self._jumpers:
+            return
+        self._checked[:] = (b"\x01" if checked else b"\x00") * len(self._jumpers)
+        self.dataChanged.emit(
+            self.index(0), self.index(len(self._jumpers) - 1), [Qt.CheckStateRole]
+        )
+
+    def reorder(self, jumpers) -> None:
+        """Ustawia podaną kolejność tych samych zawodników, zachowując zaznaczenia."""
+        self.layoutAboutToBeChanged.emit()
+        rows = {id(j): r for r, j in enumerate(self._jumpers)}
+        order = [rows[id(j)] for j in jumpers]
+        self._jumpers = [self._jumpers[r] for r in order]
+        self._checked = bytearray(self._checked[r] for r in order)
+        # Zaznaczenie/bieżący wiersz widoku podążają za przeniesionym zawodnikiem
+        new_rows = {old: new for new, old in enumerate(order)}
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(new_rows[i.row()]) for i in persistent]
+        )
+        self.layoutChanged.emit()
+
+
+class FlagListModel(QAbstractListModel):
+    """
+    Model listy obiektów z flagą kraju (zawodnicy lub skocznie w edytorze).
+
+    Obiekty trzymane są w zwykłej liście; tekst i ikona liczone są dopiero
+    dla wierszy, które widok faktycznie rysuje.
+    """
+
+    def __init__(
+        self,
+        code_attr: str,
+        icon_provider: Callable[[str], QIcon],
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent)
+        self._code_attr = code_attr
+        self._icon_provider = icon_provider
+        self._items: list = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        obj = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return str(obj)
+        if role == Qt.DecorationRole:
+            return self._icon_provider(getattr(obj, self._code_attr))
+        if role == Qt.UserRole:
+            return obj
+        return None
+
+    def set_items(self, items) -> None:
+        self.beginResetModel()
+        self._items = list(items)
+        self.endResetModel()
+
+    def reorder(self, items) -> None:
+        """Ustawia podaną kolejność tych samych obiektów; zaznaczenie widoku zostaje."""
+        self.layoutAboutToBeChanged.emit()
+        rows = {id(obj): r for r, obj in enumerate(self._items)}
+        new_rows = {rows[id(obj)]: r for r, obj in enumerate(items)}
+        self._items = list(items)
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(
+            persistent, [self.index(new_rows[i.row()]) for i in persistent]
+        )
+        self.layoutChanged.emit()
+
+    def index_of(self, obj) -> QModelIndex:
+        # Obiekty danych nie definiują __eq__ – list.index porównuje tożsamość w C
+        try:
+            return self.index(self._items.index(obj))
+        except ValueError:
+            return QModelIndex()
+
+
+class CenteredIconDelegate(QStyledItemDelegate):
+    """Rysuje ikonę komórki (np. flagę) na środku zamiast przy lewej krawędzi."""
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        super().initStyleOption(option, index)
+        # Tło i zaznaczenie rysuje styl, samą ikonę – paint()
+        option.features &= ~QStyleOptionViewItem.HasDecoration
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
+        super().paint(painter, option, index)
+        pixmap = index.data(Qt.DecorationRole)
+        if not isinstance(pixmap, QPixmap) or pixmap.isNull():
+            return
+        size = pixmap.deviceIndependentSize().toSize()
+        target = QStyle.alignedRect(
+            option.direction, Qt.AlignCenter, size, option.rect
+        )
+        painter.drawPixmap(target, pixmap)
+
+
+@lru_cache(maxsize=32)
+def _history_mode_label(mode: str) -> str:
+    """Etykieta typu zawodów; tryby w bazie się powtarzają, więc wynik jest pamiętany."""
+    lowered = mode.lower()
+    if "qualification" in lowered:
+        return "Kwalifikacje"
+    if "competition" in lowered:
+        return "Konkurs"
+    return mode or "Nieznany"
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """
+    Lista zapisanych zawodów (wiersze z list_competitions).
+
+    Tekst komórek liczony jest dopiero dla wierszy rysowanych przez widok.
+    Edytowalna jest tylko nazwa – zmiana zgłaszana jest sygnałem name_edited.
+    """
+
+    HEADERS = ("ID", "Nazwa", "Skocznia", "K", "Data", "Typ", "Akcje")
+    NAME_COLUMN = 1
+    ACTIONS_COLUMN = 6
+
+    # ID zawodów i nowa nazwa wpisana przez użytkownika
+    name_edited = Signal(int, str)
+    _READONLY_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    _EDITABLE_FLAGS = _READONLY_FLAGS | Qt.ItemIsEditable
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._rows: list = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._cell_text(self._rows[index.row()], index.column())
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        if index.column() != self.NAME_COLUMN:
+            return False
+        row = self._rows[index.row()]
+        name = value.strip()
+        # Zatwierdzenie bez zmiany nazwy nie zapisuje do bazy
+        if name == row.get("name"):
+            return False
+        row["name"] = name
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.name_edited.emit(int(row.get("id")), name)
+        return True
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.NAME_COLUMN:
+            return self._EDITABLE_FLAGS
+        return self._READONLY_FLAGS
+
+    def set_rows(self, rows) -> None:
+        self.beginResetModel()
+        # Kopie słowników – edycja nazwy nie zmienia danych wywołującego
+        self._rows = [dict(r) for r in rows]
+        self.endResetModel()
+
+    def competition_id(self, row: int) -> Optional[int]:
+        if not 0 <= row < len(self._rows):
+            return None
+        try:
+            return int(self._rows[row].get("id"))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _cell_text(row: dict, column: int) -> str:
+        if column == 0:
+            return str(row.get("id", ""))
+        if column == 1:
+            return row.get("name", "")
+        if column == 2:
+            return row.get("hill_name", "")
+        if column == 3:
+            return f"{float(row.get('k_point') or 0):.0f}"
+        if column == 4:
+            # Data bez separatora "T" z zapisu ISO
+            return row.get("created_at", "").replace("T", " ")
+        if column == 5:
+            return _history_mode_label(row.get("mode") or "")
+        return ""
+
+
+class HistoryDetailModel(QAbstractTableModel):
+    """
+    Wyniki zapisanych zawodów lub kwalifikacji (lista słowników d1/p1/d2/p2).
+
+    Odległości i punkty formatowane są na żądanie widoku; flaga trafia do
+    DecorationRole kolumny "Flaga".
+    """
+
+    QUALIFICATION_HEADERS = ("Miejsce", "Flaga", "Zawodnik", "Dystans", "Punkty")
+    COMPETITION_HEADERS = (
+        "Miejsce",
+        "Flaga",
+        "Zawodnik",
+        "I seria",
+        "I seria (pkt)",
+        "II seria",
+        "II seria (pkt)",
+        "Suma (pkt)",
+    )
+    FLAG_COLUMN = 1
+    NAME_COLUMN = 2
+    # Kolumna -> (klucz wyniku, czy odległość); None oznacza sumę punktów
+    _QUALIFICATION_VALUES = {3: ("d1", True), 4: ("p1", False)}
+    _COMPETITION_VALUES = {
+        3: ("d1", True),
+        4: ("p1", False),
+        5: ("d2", True),
+        6: ("p2", False),
+        7: (None, False),
+    }
+    _ITEM_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def __init__(
+        self,
+        results: list,
+        is_qualification: bool,
+        flag_provider: Callable[[str], QPixmap],
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent)
+        self._results = results
+        self._flag_provider = flag_provider
+        self._headers, self._values = self._layout_for(is_qualification)
+        self._name_font = QFont()
+        self._name_font.setBold(True)
+
+    @classmethod
+    def _layout_for(cls, is_qualification: bool) -> tuple:
+        if is_qualification:
+            return cls.QUALIFICATION_HEADERS, cls._QUALIFICATION_VALUES
+        return cls.COMPETITION_HEADERS, cls._COMPETITION_VALUES
+
+    def set_results(self, results: list, is_qualification: bool) -> None:
+        """
+        Podmienia wyniki bez przebudowy widoku.
+
+        Przy tym samym układzie kolumn i liczbie wierszy wystarczy sygnał
+        dataChanged; w przeciwnym razie model jest resetowany.
+        """
+        headers, values = self._layout_for(is_qualification)
+        if headers is self._headers and len(results) == len(self._results):
+            self._results = results
+            if results:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(results) - 1, len(headers) - 1),
+                )
+            return
+        self.beginResetModel()
+        self._results = results
+        self._headers, self._values = headers, values
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self._cell_text(index.row(), column)
+        if role == Qt.DecorationRole and column == self.FLAG_COLUMN:
+            pixmap = self._flag_provider(self._results[index.row()]["country"])
+            return None if pixmap.isNull() else pixmap
+        if role == Qt.TextAlignmentRole and column != self.NAME_COLUMN:
+            return Qt.AlignCenter
+        if role == Qt.FontRole and column == self.NAME_COLUMN:
+            return self._name_font
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self._ITEM_FLAGS
+
+    def _cell_text(self, row: int, column: int) -> Optional[str]:
+        res = self._results[row]
+        if column == 0:
+            return str(row + 1)
+        if column == self.FLAG_COLUMN:
+            return None
+        if column == self.NAME_COLUMN:
+            return f"{res['name']} {res['last']}"
+        key, is_distance = self._values[column]
+        if key is None:
+            value = res.get("p1", 0.0) + res.get("p2", 0.0)
+        else:
+            value = res.get(key, 0.0)
+        if value <= 0:
+            return "-"
+        return f"{value:.1f} m" if is_distance else f"{value:.1f}"